@@ -0,0 +1,24 @@
+"""Micro-benchmarks for the year_2026 exercises.
+
+Run one from the python/ directory with `uv run python -m benchmarks.<name>`
+(or `just bench <name>` from the repo root).
+"""
+
+import time
+from typing import Callable
+
+
+def best_of(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Return the fastest wall time in seconds of `repeat` calls to fn."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, baseline: float, candidate: float) -> None:
+    """Print one benchmark row: both timings and the speedup."""
+    speedup = baseline / candidate if candidate else float("inf")
+    print(f"{label:<40} {baseline:>10.4f}s {candidate:>10.4f}s {speedup:>8.1f}x")
@@ -0,0 +1,53 @@
+"""Plain BST against AVL for sorted and random key streams.
+
+A plain BST is what bst_insert does to a hand-built TreeNode root; the AVL
+tree is what it builds from None. Sorted keys turn the plain BST into a
+linked list, so that stream uses a smaller N for it.
+"""
+
+import random
+import time
+
+from src.year_2026 import trees
+
+N = 100_000
+PLAIN_SORTED_N = 5_000
+
+
+def run(first, keys):
+    start = time.perf_counter()
+    root = first
+    for key in keys:
+        root = trees.bst_insert(root, key)
+    inserted = time.perf_counter()
+    for key in keys:
+        trees.bst_search(root, key)
+    searched = time.perf_counter()
+    for key in keys[::2]:
+        root = trees.bst_delete(root, key)
+    deleted = time.perf_counter()
+    return inserted - start, searched - inserted, deleted - searched
+
+
+def main() -> None:
+    rng = random.Random(42)
+    print(
+        f"{'tree':<6} {'stream':<7} {'n':>7} {'insert':>9} {'search':>9} {'delete':>9}"
+    )
+    for stream in ("sorted", "random"):
+        for name in ("plain", "avl"):
+            n = PLAIN_SORTED_N if (name, stream) == ("plain", "sorted") else N
+            keys = list(range(1, n + 1))
+            if stream == "random":
+                rng.shuffle(keys)
+            # A TreeNode root makes bst_insert grow a plain BST; key 0 sorts first.
+            first = trees.TreeNode(0) if name == "plain" else None
+            phases = run(first, keys)
+            print(
+                f"{name:<6} {stream:<7} {n:>7} "
+                + " ".join(f"{p:>8.3f}s" for p in phases)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Streaming bracket validation throughput on a generated JSON-like file.
+
+Usage: python -m benchmarks.brackets [size_mb]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.year_2026 import stack
+
+
+def stack_based_valid_parentheses(s: str) -> bool:
+    """The previous implementation: generic Stack plus str.index per bracket."""
+    starts = "[{("
+    ends = "]})"
+    st = stack.Stack()
+    for c in s:
+        if c in starts:
+            st.push(c)
+        elif c in ends:
+            last = st.pop()
+            if last is None or starts.index(last) != ends.index(c):
+                return False
+    return st.is_empty()
+
+
+def generate(path: str, size_bytes: int) -> None:
+    rng = random.Random(42)
+    record = b'{"id": %d, "tags": ["a", "b"], "pos": [%d, %d], "meta": {"x": (1)}}'
+    written = 0
+    with open(path, "wb") as out:
+        out.write(b"[")
+        while written < size_bytes:
+            block = b",".join(
+                record % (i, rng.randint(0, 999), rng.randint(0, 999))
+                for i in range(10_000)
+            )
+            out.write(block + b",")
+            written += len(block) + 1
+        out.write(b"{}]")
+
+
+def main() -> None:
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "payload.json")
+        generate(path, size_mb * 1024 * 1024)
+        size = os.path.getsize(path) / (1024 * 1024)
+
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            while f.read(1 << 20):
+                pass
+        read_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            assert stack.validate_brackets_stream(f) is None
+        stream_time = time.perf_counter() - start
+
+        print(f"{size:.0f} MB payload")
+        print(f"  raw read                 {size / read_time:8.1f} MB/s")
+        print(f"  validate_brackets_stream {size / stream_time:8.1f} MB/s")
+        if size <= 64:
+            with open(path) as f:
+                text = f.read()
+            start = time.perf_counter()
+            assert stack_based_valid_parentheses(text)
+            print(
+                f"  previous Stack version   "
+                f"{size / (time.perf_counter() - start):8.1f} MB/s (whole file in memory)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Rebuilding a BST index from a sorted dump of N keys.
+
+Compares repeated bst_insert, the usual recursive build that slices the
+array at every level, and the O(n) bulk loaders for linked and
+array-backed trees.
+"""
+
+import sys
+import time
+
+from src.year_2026 import trees
+
+N = 1_000_000
+
+
+def recursive_slicing(arr):
+    if not arr:
+        return None
+    mid = (len(arr) - 1) // 2
+    return trees.TreeNode(
+        arr[mid], recursive_slicing(arr[:mid]), recursive_slicing(arr[mid + 1 :])
+    )
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    keys = list(range(N))
+    print(f"{N} sorted keys")
+    cases = [
+        ("bst_insert_many (AVL)", lambda: trees.bst_insert_many(None, keys)),
+        ("recursive, slicing", lambda: recursive_slicing(keys)),
+        ("bst_from_sorted, AVLNode", lambda: trees.bst_from_sorted(iter(keys))),
+        (
+            "bst_from_sorted, SlotTreeNode",
+            lambda: trees.bst_from_sorted(iter(keys), node_type=trees.SlotTreeNode),
+        ),
+        ("ArrayTree.from_sorted('q')", lambda: trees.ArrayTree.from_sorted(keys, "q")),
+    ]
+    for name, build in cases:
+        print(f"  {name:<32} {timed(build):7.2f}s")
+
+
+if __name__ == "__main__":
+    sys.setrecursionlimit(10_000)
+    main()
@@ -0,0 +1,56 @@
+"""Throughput of external_sort on a generated file.
+
+Usage: python -m benchmarks.external_sort [size_mb] [memory_limit_mb] [fan_in]
+Defaults generate a 2 GB file and sort it with a 64 MB budget.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.year_2026 import external_sort
+from src.year_2026.sorting import merge_sort
+
+
+def generate(path: str, size_bytes: int) -> None:
+    rng = random.Random(42)
+    written = 0
+    with open(path, "wb", buffering=1 << 20) as out:
+        while written < size_bytes:
+            block = b"".join(
+                b"%016x,%d\n" % (rng.getrandbits(64), rng.randint(0, 10**6))
+                for _ in range(10_000)
+            )
+            out.write(block)
+            written += len(block)
+
+
+def main() -> None:
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 2048
+    memory_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    fan_in = int(sys.argv[3]) if len(sys.argv) > 3 else external_sort.DEFAULT_FAN_IN
+    with tempfile.TemporaryDirectory() as tmp:
+        src, dst = os.path.join(tmp, "in.txt"), os.path.join(tmp, "out.txt")
+        generate(src, size_mb * 1024 * 1024)
+        size = os.path.getsize(src) / (1024 * 1024)
+        for name, sorter in (("merge_sort", merge_sort), ("sorted", sorted)):
+            start = time.perf_counter()
+            runs = external_sort.external_sort(
+                src,
+                dst,
+                memory_limit=memory_mb * 1024 * 1024,
+                fan_in=fan_in,
+                tmp_dir=tmp,
+                sorter=sorter,
+            )
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name}: {size:.0f} MB, {runs} runs, fan_in={fan_in}, "
+                f"memory={memory_mb} MB: {elapsed:.2f}s ({size / elapsed:.1f} MB/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
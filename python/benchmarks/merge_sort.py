@@ -0,0 +1,63 @@
+"""Compare the bottom-up merge sort with the previous top-down slicing version."""
+
+import random
+
+from src.year_2026 import sorting
+
+from . import best_of, report
+
+
+def recursive_merge_sort(arr):
+    """The original top-down implementation: slices and a new list per level."""
+    if len(arr) <= 1:
+        return arr
+    mid = len(arr) // 2
+    x, y = recursive_merge_sort(arr[:mid]), recursive_merge_sort(arr[mid:])
+    ix = iy = 0
+    merged = []
+    while ix < len(x) and iy < len(y):
+        if y[iy] < x[ix]:
+            merged.append(y[iy])
+            iy += 1
+        else:
+            merged.append(x[ix])
+            ix += 1
+    merged.extend(x[ix:])
+    merged.extend(y[iy:])
+    return merged
+
+
+def datasets(n: int):
+    rng = random.Random(42)
+    rand = [rng.randint(-(10**6), 10**6) for _ in range(n)]
+    nearly = sorted(rand)
+    for _ in range(n // 100):
+        i = rng.randrange(n - 1)
+        nearly[i], nearly[i + 1] = nearly[i + 1], nearly[i]
+    return {"random": rand, "sorted": sorted(rand), "nearly-sorted": nearly}
+
+
+def main() -> None:
+    n = 200_000
+    data = datasets(n)
+    print(f"{'case':<40} {'top-down':>11} {'bottom-up':>11} {'speedup':>9}")
+    for name, arr in data.items():
+        report(
+            f"{name} n={n}",
+            best_of(lambda: recursive_merge_sort(arr)),
+            best_of(lambda: sorting.merge_sort(arr)),
+        )
+
+    print("\nmin run sweep (random):")
+    default = sorting.MERGE_SORT_MIN_RUN
+    try:
+        for min_run in (8, 16, 32, 64, 128):
+            sorting.MERGE_SORT_MIN_RUN = min_run
+            elapsed = best_of(lambda: sorting.merge_sort(data["random"]))
+            print(f"  min_run={min_run:<4} {elapsed:.4f}s")
+    finally:
+        sorting.MERGE_SORT_MIN_RUN = default
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Percentile queries on a live BST: inorder_traversal indexing against bst_select.
+
+Builds an AVL tree of N random keys, then interleaves inserts with
+percentile lookups, the way a live p50/p99 dashboard would.
+"""
+
+import random
+import time
+
+from src.year_2026 import trees
+
+N = 100_000
+QUERIES = 500
+
+
+def main() -> None:
+    rng = random.Random(42)
+    root = trees.bst_insert_many(None, rng.sample(range(10 * N), N))
+    percentiles = [rng.random() for _ in range(QUERIES)]
+    new_keys = [10 * N + i for i in range(QUERIES)]
+
+    def by_walk(root):
+        for key, p in zip(new_keys, percentiles):
+            root = trees.bst_insert(root, key)
+            ordered = trees.inorder_traversal(root)
+            ordered[int(p * len(ordered))]
+        return root
+
+    def by_select(root):
+        for key, p in zip(new_keys, percentiles):
+            root = trees.bst_insert(root, key + QUERIES)
+            trees.bst_select(root, int(p * root.size))
+        return root
+
+    print(f"{QUERIES} insert + percentile queries on {N} keys")
+    for name, run in (("inorder walk", by_walk), ("bst_select", by_select)):
+        start = time.perf_counter()
+        root = run(root)
+        seconds = time.perf_counter() - start
+        print(f"  {name:<13} {seconds:8.3f}s  {QUERIES / seconds:>12,.0f} queries/s")
+
+
+if __name__ == "__main__":
+    main()
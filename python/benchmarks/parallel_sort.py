@@ -0,0 +1,31 @@
+"""Scaling of parallel_sort with the number of worker processes."""
+
+import os
+import random
+import sys
+from array import array
+
+from src.year_2026 import parallel_sort
+
+from . import best_of, report
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = random.Random(42)
+    arr = array("q", (rng.getrandbits(62) for _ in range(n)))
+    print(f"n={n}, cpu_count={os.cpu_count()}")
+    print(f"{'case':<40} {'1 process':>11} {'parallel':>11} {'speedup':>9}")
+    baseline = best_of(lambda: array("q", sorted(arr)), repeat=1)
+    for workers in (2, 4, 8):
+        report(
+            f"{workers} workers",
+            baseline,
+            best_of(
+                lambda: parallel_sort.parallel_sort(arr, workers=workers), repeat=1
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
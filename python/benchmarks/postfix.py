@@ -0,0 +1,55 @@
+"""Re-evaluating a postfix formula per row vs compiling it once.
+
+The NumPy section runs only when numpy is importable (it comes with matplotlib).
+"""
+
+import random
+
+from src.year_2026 import stack
+
+from . import best_of, report
+
+FORMULA = "price cost - qty * 2 /"
+
+
+def main() -> None:
+    rows = 200_000
+    rng = random.Random(42)
+    columns = {
+        "price": [rng.uniform(1, 100) for _ in range(rows)],
+        "cost": [rng.uniform(1, 100) for _ in range(rows)],
+        "qty": [rng.randint(1, 10) for _ in range(rows)],
+    }
+    tokens = FORMULA.split()
+
+    def per_row():
+        # The old evaluator has no variables, so values are spliced in as text.
+        out = []
+        for values in zip(*columns.values()):
+            row = dict(zip(columns, values))
+            bound = [str(row[t]) if t in row else t for t in tokens]
+            out.append(stack.evaluate_postfix(bound))
+        return out
+
+    expr = stack.compile_postfix(tokens)
+    print(f"{'case':<40} {'per row':>11} {'compiled':>11} {'speedup':>9}")
+    report(
+        f"{rows} rows, Python lists",
+        best_of(per_row, repeat=1),
+        best_of(lambda: expr.evaluate_batch(columns)),
+    )
+    try:
+        import numpy as np
+    except ImportError:
+        print("numpy not installed; skipping vectorized case")
+        return
+    arrays = {name: np.asarray(col) for name, col in columns.items()}
+    report(
+        f"{rows} rows, NumPy columns",
+        best_of(lambda: expr.evaluate_batch(columns)),
+        best_of(lambda: expr.evaluate_batch(arrays)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Draining a large queue: list.pop(0) against the ring buffer."""
+
+from src.year_2026 import queue_ds
+
+from . import best_of, report
+
+
+class ListQueue:
+    """The previous list-backed queue, minus its debug printing."""
+
+    def __init__(self):
+        self._queue = []
+
+    def enqueue(self, value):
+        self._queue.append(value)
+
+    def dequeue(self):
+        if not self._queue:
+            return None
+        return self._queue.pop(0)
+
+
+def fill_and_drain(q, n):
+    for i in range(n):
+        q.enqueue(i)
+    while q.dequeue() is not None:
+        pass
+
+
+def main() -> None:
+    print(f"{'case':<40} {'list':>11} {'ring':>11} {'speedup':>9}")
+    for n in (10_000, 100_000, 300_000):
+        report(
+            f"enqueue + drain {n}",
+            best_of(lambda: fill_and_drain(ListQueue(), n), repeat=1),
+            best_of(lambda: fill_and_drain(queue_ds.Queue(), n), repeat=1),
+        )
+    n = 1_000_000
+
+    def batched():
+        q = queue_ds.Queue()
+        q.enqueue_many(range(n))
+        while q.dequeue_many(1024):
+            pass
+
+    report(
+        f"ring: single vs batch ops {n}",
+        best_of(lambda: fill_and_drain(queue_ds.Queue(), n)),
+        best_of(batched),
+    )
+
+
+if __name__ == "__main__":
+    main()
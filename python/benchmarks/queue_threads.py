@@ -0,0 +1,80 @@
+"""Producer/consumer throughput through ThreadSafeQueue and AsyncQueue.
+
+One producer hands N items to one consumer through a bounded queue, item by
+item and in batches, at several capacities. Small capacities force the
+producer to wait on the consumer (backpressure), which shows up as put wait.
+"""
+
+import asyncio
+import threading
+import time
+
+from src.year_2026 import queue_ds
+
+N = 200_000
+BATCH = 256
+
+
+def threaded(capacity, batch):
+    q = queue_ds.ThreadSafeQueue(capacity=capacity)
+
+    def consume():
+        seen = 0
+        while seen < N:
+            seen += len(q.get_many(batch))
+
+    consumer = threading.Thread(target=consume)
+    start = time.perf_counter()
+    consumer.start()
+    if batch == 1:
+        for i in range(N):
+            q.put(i)
+    else:
+        for lo in range(0, N, batch):
+            q.put_many(range(lo, min(lo + batch, N)))
+    consumer.join()
+    return time.perf_counter() - start, q.stats()
+
+
+def asynchronous(capacity, batch):
+    async def run():
+        q = queue_ds.AsyncQueue(capacity=capacity)
+
+        async def consume():
+            seen = 0
+            while seen < N:
+                seen += len(await q.get_many(batch))
+
+        start = time.perf_counter()
+        consumer = asyncio.create_task(consume())
+        if batch == 1:
+            for i in range(N):
+                await q.put(i)
+        else:
+            for lo in range(0, N, batch):
+                await q.put_many(range(lo, min(lo + batch, N)))
+        await consumer
+        return time.perf_counter() - start, q.stats()
+
+    return asyncio.run(run())
+
+
+def main() -> None:
+    print(f"{N} items, one producer and one consumer")
+    print(
+        f"{'queue':<8} {'capacity':>8} {'batch':>6} {'items/s':>12} "
+        f"{'max depth':>10} {'put wait':>9} {'get wait':>9}"
+    )
+    for name, run in (("thread", threaded), ("asyncio", asynchronous)):
+        for capacity in (16, 1_024, 65_536):
+            for batch in (1, BATCH):
+                seconds, stats = run(capacity, batch)
+                print(
+                    f"{name:<8} {capacity:>8} {batch:>6} {N / seconds:>12,.0f} "
+                    f"{stats.max_depth:>10} {stats.put_wait:>8.2f}s "
+                    f"{stats.get_wait:>8.2f}s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""quick_sort and select/partial_sort against merge_sort and a full sort."""
+
+import random
+
+from src.year_2026 import sorting
+
+from . import best_of
+
+
+def main() -> None:
+    n = 200_000
+    rng = random.Random(42)
+    data = {
+        "random": [rng.randint(-(10**9), 10**9) for _ in range(n)],
+        "few-unique": [rng.randint(0, 9) for _ in range(n)],
+        "sorted": list(range(n)),
+    }
+    print(f"n={n}")
+    for name, arr in data.items():
+        quick = best_of(lambda: sorting.quick_sort(arr))
+        merge = best_of(lambda: sorting.merge_sort(arr))
+        print(f"  {name:<12} quick_sort {quick:.3f}s  merge_sort {merge:.3f}s")
+    arr = data["random"]
+    full = best_of(lambda: sorting.quick_sort(arr)[n // 2])
+    sel = best_of(lambda: sorting.select(list(arr), n // 2))
+    top = best_of(lambda: sorting.partial_sort(list(arr), 100))
+    print(f"  median: full sort {full:.3f}s, select {sel:.3f}s")
+    print(f"  top-100: partial_sort {top:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
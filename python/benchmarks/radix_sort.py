@@ -0,0 +1,37 @@
+"""Radix and counting sort against merge_sort and the built-in sort on typed int arrays."""
+
+import random
+import sys
+from array import array
+
+from src.year_2026 import sorting
+
+from . import best_of
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    wide = array("q", (rng.randint(-(2**31), 2**31) for _ in range(n)))
+    narrow = array("i", (rng.randint(-1000, 1000) for _ in range(n)))
+    cases = {
+        "32-bit keys": wide,
+        "keys in [-1000, 1000]": narrow,
+    }
+    sorters = {
+        "radix_sort": sorting.radix_sort,
+        "counting_sort": sorting.counting_sort,
+        "merge_sort": sorting.merge_sort,
+        "sorted": sorted,
+    }
+    print(f"n={n}")
+    for case, arr in cases.items():
+        print(case)
+        for name, sorter in sorters.items():
+            if name == "counting_sort" and max(arr) - min(arr) > 10 * n:
+                continue
+            print(f"  {name:<15} {best_of(lambda: sorter(arr), repeat=1):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
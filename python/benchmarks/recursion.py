@@ -0,0 +1,39 @@
+"""Compare sequential factorial/power against the product-tree and squaring versions."""
+
+from src.year_2026 import recursion
+
+from . import best_of, report
+
+
+def sequential_factorial(n: int) -> int:
+    result = 1
+    for k in range(2, n + 1):
+        result *= k
+    return result
+
+
+def sequential_power(base: int, exp: int) -> int:
+    result = 1
+    for _ in range(exp):
+        result *= base
+    return result
+
+
+def main() -> None:
+    print(f"{'case':<40} {'sequential':>11} {'new':>11} {'speedup':>9}")
+    for n in (10_000, 50_000, 100_000):
+        report(
+            f"factorial({n})",
+            best_of(lambda: sequential_factorial(n)),
+            best_of(lambda: recursion.factorial(n)),
+        )
+    for exp in (10_000, 100_000):
+        report(
+            f"power(3, {exp})",
+            best_of(lambda: sequential_power(3, exp)),
+            best_of(lambda: recursion.power(3, exp)),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Cross-process handoff: multiprocessing.Queue against SharedRingBuffer.
+
+A child process sends messages of a fixed size; the parent receives them.
+The ring is read both as copies (get) and zero-copy (acquire/release).
+"""
+
+import multiprocessing
+import time
+
+from src.year_2026 import queue_ds
+
+RING_BYTES = 4 * 1024 * 1024
+
+
+def mp_producer(q, payload, count):
+    for _ in range(count):
+        q.put(payload)
+    q.put(None)
+
+
+def ring_producer(ring, payload, count):
+    for _ in range(count):
+        ring.put(payload)
+    ring.close()
+
+
+def run_mp_queue(ctx, payload, count):
+    q = ctx.Queue(maxsize=1024)
+    producer = ctx.Process(target=mp_producer, args=(q, payload, count))
+    start = time.perf_counter()
+    producer.start()
+    while q.get() is not None:
+        pass
+    seconds = time.perf_counter() - start
+    producer.join()
+    return seconds
+
+
+def run_ring(ctx, payload, count, zero_copy):
+    ring = queue_ds.SharedRingBuffer(RING_BYTES)
+    try:
+        producer = ctx.Process(target=ring_producer, args=(ring, payload, count))
+        start = time.perf_counter()
+        producer.start()
+        for _ in range(count):
+            if zero_copy:
+                view = ring.acquire()
+                view.release()
+                ring.release()
+            else:
+                ring.get()
+        seconds = time.perf_counter() - start
+        producer.join()
+        return seconds
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def main() -> None:
+    ctx = multiprocessing.get_context("fork")
+    print(
+        f"{'message':>8} {'count':>8} {'mp.Queue':>12} {'ring get':>12} {'ring view':>12}"
+    )
+    for size, count in ((64, 100_000), (4096, 50_000), (256 * 1024, 2_000)):
+        payload = bytes(size)
+        rates = [
+            count / run_mp_queue(ctx, payload, count),
+            count / run_ring(ctx, payload, count, zero_copy=False),
+            count / run_ring(ctx, payload, count, zero_copy=True),
+        ]
+        print(f"{size:>8} {count:>8} " + " ".join(f"{r:>10,.0f}/s" for r in rates))
+
+
+if __name__ == "__main__":
+    main()
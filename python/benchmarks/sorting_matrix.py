@@ -0,0 +1,211 @@
+"""Run every sorter over a matrix of input sizes and distributions.
+
+Each cell records wall time, comparisons (comparison sorters only) and
+peak traced memory, and the whole matrix is written as JSON and CSV named
+after the current commit, so two runs can be diffed directly.
+
+A cell sorts its input three times (timed, counting comparisons, under
+tracemalloc). It is skipped when the wall time of all three at the
+previous size, scaled by the sorter's asymptotic cost, projects past
+--budget seconds.
+
+Usage: python -m benchmarks.sorting_matrix [--sizes 100 1000 ...]
+       [--budget SECONDS] [--sorters merge_sort quick_sort ...] [--output DIR]
+       [--compare results/sorting-<commit>.json]
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import subprocess
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from src.year_2026 import sorting
+
+
+def quadratic(n: int) -> float:
+    return float(n * n)
+
+
+def linearithmic(n: int) -> float:
+    return n * math.log2(max(n, 2))
+
+
+def linear(n: int) -> float:
+    return float(n)
+
+
+# name -> (sorter, compares elements?, cost model, per-distribution overrides)
+SORTERS: Dict[str, tuple] = {
+    "bubble_sort": (sorting.bubble_sort, True, quadratic, {}),
+    "selection_sort": (sorting.selection_sort, True, quadratic, {}),
+    "insertion_sort": (sorting.insertion_sort, True, quadratic, {"sorted": linear}),
+    "merge_sort": (
+        sorting.merge_sort,
+        True,
+        linearithmic,
+        {"sorted": linear, "reversed": linear},
+    ),
+    "quick_sort": (sorting.quick_sort, True, linearithmic, {}),
+    "counting_sort": (sorting.counting_sort, False, linear, {}),
+    "radix_sort": (sorting.radix_sort, False, linear, {}),
+}
+
+
+def organ_pipe(n: int, rng: random.Random) -> List[int]:
+    half = sorted(rng.randint(0, n) for _ in range(n // 2))
+    return half + sorted(
+        (rng.randint(0, n) for _ in range(n - len(half))), reverse=True
+    )
+
+
+DISTRIBUTIONS: Dict[str, Callable[[int, random.Random], List[int]]] = {
+    "random": lambda n, rng: [rng.randint(-(10**6), 10**6) for _ in range(n)],
+    "sorted": lambda n, rng: sorted(rng.randint(-(10**6), 10**6) for _ in range(n)),
+    "reversed": lambda n, rng: sorted(
+        (rng.randint(-(10**6), 10**6) for _ in range(n)), reverse=True
+    ),
+    "few-unique": lambda n, rng: [rng.randint(0, 9) for _ in range(n)],
+    "organ-pipe": organ_pipe,
+}
+
+
+def run_once(sorter: Callable, arr: List[int]) -> float:
+    work = list(arr)
+    start = time.perf_counter()
+    sorter(work)
+    return time.perf_counter() - start
+
+
+def peak_memory(sorter: Callable, arr: List[int]) -> int:
+    work = list(arr)
+    tracemalloc.start()
+    try:
+        sorter(work)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def current_commit() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_matrix(
+    sizes: List[int], sorters: List[str], budget: float, seed: int = 42
+) -> List[dict]:
+    rows = []
+    for dist_name, make in DISTRIBUTIONS.items():
+        inputs = {n: make(n, random.Random(seed)) for n in sizes}
+        for name in sorters:
+            sorter, compares, model, overrides = SORTERS[name]
+            model = overrides.get(dist_name, model)
+            previous: Optional[tuple] = None
+            for n in sizes:
+                row = {"sorter": name, "distribution": dist_name, "n": n}
+                if previous is not None:
+                    prev_n, prev_time = previous
+                    projected = prev_time * model(n) / model(prev_n)
+                    if projected > budget:
+                        row.update(status="skipped", projected_seconds=projected)
+                        rows.append(row)
+                        continue
+                arr = inputs[n]
+                cell_start = time.perf_counter()
+                seconds = run_once(sorter, arr)
+                comparisons = (
+                    sorting.count_comparisons(sorter, arr)[1] if compares else None
+                )
+                row.update(
+                    status="ok",
+                    seconds=seconds,
+                    comparisons=comparisons,
+                    peak_bytes=peak_memory(sorter, arr),
+                )
+                rows.append(row)
+                previous = (n, time.perf_counter() - cell_start)
+                print(
+                    f"{name:<15} {dist_name:<11} n={n:<8} {seconds:9.4f}s "
+                    f"cmp={comparisons if comparisons is not None else '-':<10} "
+                    f"peak={row['peak_bytes']}"
+                )
+    return rows
+
+
+def write_results(rows: List[dict], output_dir: str, commit: str) -> None:
+    os.makedirs(output_dir, exist_ok=True)
+    base = os.path.join(output_dir, f"sorting-{commit}")
+    with open(base + ".json", "w") as f:
+        json.dump({"commit": commit, "results": rows}, f, indent=2)
+    fields = [
+        "sorter",
+        "distribution",
+        "n",
+        "status",
+        "seconds",
+        "comparisons",
+        "peak_bytes",
+        "projected_seconds",
+    ]
+    with open(base + ".csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"wrote {base}.json and {base}.csv")
+
+
+def compare(baseline_path: str, rows: List[dict]) -> None:
+    """Print the time ratio of every cell measured in both the baseline and this run."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    old = {
+        (r["sorter"], r["distribution"], r["n"]): r
+        for r in baseline["results"]
+        if r["status"] == "ok"
+    }
+    print(f"\ncompared with {baseline['commit']} (old / new time):")
+    for row in rows:
+        before = old.get((row["sorter"], row["distribution"], row["n"]))
+        if row["status"] != "ok" or before is None:
+            continue
+        ratio = before["seconds"] / row["seconds"] if row["seconds"] else float("inf")
+        print(
+            f"  {row['sorter']:<15} {row['distribution']:<11} n={row['n']:<8} "
+            f"{ratio:6.2f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--budget", type=float, default=5.0)
+    parser.add_argument("--sorters", nargs="+", default=list(SORTERS), choices=SORTERS)
+    parser.add_argument(
+        "--output", default=os.path.join(os.path.dirname(__file__), "results")
+    )
+    parser.add_argument("--compare", help="earlier JSON result to compare against")
+    args = parser.parse_args()
+    rows = run_matrix(sorted(args.sizes), args.sorters, args.budget)
+    write_results(rows, args.output, current_commit())
+    if args.compare:
+        compare(args.compare, rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""One million pending timers: TimerWheel against a heapq scheduler.
+
+Both schedule N timers with random delays, cancel every tenth one and then
+advance the clock one tick at a time until everything has fired. The heap
+cancels lazily (a flag checked on pop), the usual way to get O(1) cancel
+out of heapq.
+"""
+
+import heapq
+import random
+import time
+
+from src.year_2026 import timer_wheel
+
+N = 1_000_000
+HORIZON = 60_000
+
+
+class HeapScheduler:
+    def __init__(self):
+        self.now = 0
+        self._heap = []
+        self._seq = 0
+
+    def schedule(self, item, delay):
+        entry = [self.now + delay, self._seq, item, True]
+        self._seq += 1
+        heapq.heappush(self._heap, entry)
+        return entry
+
+    def cancel(self, entry):
+        entry[3] = False
+
+    def advance(self, ticks=1):
+        self.now += ticks
+        heap, expired = self._heap, []
+        while heap and heap[0][0] <= self.now:
+            entry = heapq.heappop(heap)
+            if entry[3]:
+                expired.append(entry[2])
+        return expired
+
+
+def run(scheduler, delays):
+    start = time.perf_counter()
+    handles = [scheduler.schedule(i, d) for i, d in enumerate(delays)]
+    scheduled = time.perf_counter()
+    for handle in handles[::10]:
+        scheduler.cancel(handle)
+    cancelled = time.perf_counter()
+    fired = 0
+    for _ in range(HORIZON):
+        fired += len(scheduler.advance())
+    drained = time.perf_counter()
+    assert fired == N - len(handles[::10])
+    return scheduled - start, cancelled - scheduled, drained - cancelled
+
+
+def main() -> None:
+    rng = random.Random(42)
+    delays = [rng.randint(1, HORIZON) for _ in range(N)]
+    print(f"{N} timers over {HORIZON} ticks")
+    print(f"{'scheduler':<12} {'schedule':>9} {'cancel':>9} {'drain':>9} {'total':>9}")
+    for name, scheduler in (
+        ("heapq", HeapScheduler()),
+        ("wheel", timer_wheel.TimerWheel()),
+    ):
+        phases = run(scheduler, delays)
+        print(
+            f"{name:<12} "
+            + " ".join(f"{p:>8.2f}s" for p in phases)
+            + f" {sum(phases):>8.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Dashboard-style tree statistics: eight calls, one pass, and a cached pass.
+
+The cached variant is measured after a single bst_insert, so it recomputes
+only the path that insert changed.
+"""
+
+import random
+import time
+
+from src.year_2026 import trees
+
+N = 200_000
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rng = random.Random(42)
+    root = trees.bst_insert_many(None, rng.sample(range(10 * N), N))
+
+    def separate():
+        trees.tree_size(root)
+        trees.tree_height(root)
+        trees.tree_sum(root)
+        trees.tree_min(root)
+        trees.tree_max(root)
+        trees.tree_average(root)
+        trees.tree_count_of(root, 7)
+        trees.tree_is_balanced(root)
+
+    def combined():
+        trees.tree_aggregates(root, *trees.AGGREGATES, value=7)
+
+    print(f"{N} nodes")
+    print(f"  eight separate functions   {timed(separate):8.3f}s")
+    print(f"  one tree_aggregates pass   {timed(combined):8.3f}s")
+    warm = timed(lambda: trees.tree_aggregates(root, cache=True))
+    print(f"  first cached pass          {warm:8.3f}s")
+    root = trees.bst_insert(root, -1)
+    after = timed(lambda: trees.tree_aggregates(root, cache=True))
+    print(f"  cached, after one insert   {after * 1e6:8.1f}us")
+    again = timed(lambda: trees.tree_aggregates(root, cache=True))
+    print(f"  cached, unchanged          {again * 1e6:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
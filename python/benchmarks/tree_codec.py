@@ -0,0 +1,74 @@
+"""Text against binary tree serialization, and lazy mmap loading.
+
+Encodes a balanced BST of N int keys both ways, decodes it back, then
+writes the binary form to a file and compares a full read_tree with
+opening it as a MappedTree and running a few searches.
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from src.year_2026 import tree_codec, trees
+
+N = 1_000_000
+SEARCHES = 1_000
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    root = trees.bst_insert_many(None, range(N))
+    text, text_enc = timed(lambda: trees.serialize_tree(root))
+    _, text_dec = timed(lambda: trees.deserialize_tree(text))
+    binary, bin_enc = timed(lambda: tree_codec.encode_tree(root, "i"))
+    _, bin_dec = timed(lambda: tree_codec.decode_tree(binary))
+    print(f"{N} nodes")
+    print(f"{'format':<8} {'bytes':>12} {'encode':>9} {'decode':>9}")
+    print(f"{'json':<8} {len(text):>12,} {text_enc:>8.2f}s {text_dec:>8.2f}s")
+    print(f"{'binary':<8} {len(binary):>12,} {bin_enc:>8.2f}s {bin_dec:>8.2f}s")
+
+    probes = random.Random(1).sample(range(N), SEARCHES)
+    fd, path = tempfile.mkstemp(suffix=".tree")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            tree_codec.write_tree(root, f, "i")
+
+        def full_load():
+            with open(path, "rb") as f:
+                loaded = tree_codec.read_tree(f)
+            for probe in probes:
+                trees.bst_search(loaded, probe)
+
+        def lazy_load():
+            with tree_codec.MappedTree(path) as mapped:
+                return sum(_search_depth(mapped.root, probe) for probe in probes)
+
+        _, full = timed(full_load)
+        touched, lazy = timed(lazy_load)
+        print(f"\nopen + {SEARCHES} searches:")
+        print(f"  read_tree  {full:8.3f}s  ({N:,} nodes built)")
+        print(f"  MappedTree {lazy:8.3f}s  ({touched:,} nodes touched)")
+    finally:
+        os.remove(path)
+
+
+def _search_depth(root, value) -> int:
+    """Run a BST search and return how many nodes it visited."""
+    visited = 0
+    node = root
+    while node is not None:
+        visited += 1
+        if value == node.value:
+            break
+        node = node.left if value < node.value else node.right
+    return visited
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Structural hashing: equality checks and hash-consing.
+
+Compares trees_equal against a plain node-by-node walk: without hashes,
+with cached hashes (verified and trusted), after a single insert (only
+that path is rehashed), and on hash-consed trees, where equal subtrees are
+shared and compare by identity.
+"""
+
+import random
+import time
+import tracemalloc
+
+from src.year_2026 import trees
+
+N = 200_000
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def walk_equal(a, b):
+    pairs = [(a, b)]
+    while pairs:
+        x, y = pairs.pop()
+        if x is None or y is None:
+            if x is not y:
+                return False
+            continue
+        if x.value != y.value:
+            return False
+        pairs.append((x.left, y.left))
+        pairs.append((x.right, y.right))
+    return True
+
+
+def build(values):
+    root = None
+    for value in values:
+        root = trees.bst_insert(root, value)
+    return root
+
+
+def main() -> None:
+    values = random.Random(42).sample(range(10 * N), N)
+    a, b = build(values), build(values)
+
+    print(f"{N} nodes, equal trees")
+    print(f"  node-by-node walk          {timed(lambda: walk_equal(a, b)):8.3f}s")
+    cold = timed(lambda: trees.trees_equal(a, b))
+    print(f"  trees_equal, no hashes     {cold:8.3f}s")
+    hashing = timed(lambda: (trees.tree_hash(a), trees.tree_hash(b)))
+    print(f"  tree_hash on both          {hashing:8.3f}s")
+    warm = timed(lambda: trees.trees_equal(a, b))
+    print(f"  trees_equal, hashed        {warm:8.3f}s")
+    trusted = timed(lambda: trees.trees_equal(a, b, verify=False))
+    print(f"  trees_equal(verify=False)  {trusted * 1e6:8.1f}us")
+
+    a = trees.bst_insert(a, -1)
+    print(f"{N} nodes, differ by one insert")
+    print(
+        f"  node-by-node walk          {timed(lambda: walk_equal(a, b)) * 1e3:8.1f}ms"
+    )
+    rejected = timed(lambda: trees.trees_equal(a, b))
+    print(f"  trees_equal (path rehash)  {rejected * 1e6:8.1f}us")
+
+    depth = 17  # a full tree over a 3-value alphabet: many repeated subtrees
+    rng = random.Random(1)
+
+    def full(level):
+        if level == 0:
+            return None
+        return trees.TreeNode(
+            rng.randrange(3) if level < 4 else level, full(level - 1), full(level - 1)
+        )
+
+    tracemalloc.start()
+    root = full(depth)
+    plain = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    root = trees.hash_cons(root)
+    seconds = time.perf_counter() - start
+    shared = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"full tree of depth {depth} ({2**depth - 1} nodes)")
+    print(f"  hash_cons                  {seconds:8.3f}s")
+    print(
+        f"  traced memory              {plain / 2**20:8.1f}MB -> {shared / 2**20:.1f}MB"
+    )
+    for label in ("cold", "warm"):
+        seconds = timed(lambda: trees.trees_equal(root.left, root.right))
+        print(f"  trees_equal(left, right), {label} {seconds * 1e3:6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
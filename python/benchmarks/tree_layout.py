@@ -0,0 +1,94 @@
+"""Memory and lookup cost of TreeNode, SlotTreeNode, ArrayTree and EytzingerTree.
+
+Builds a balanced BST over 0..N-1 in each layout, reports the memory traced
+while building it, then times random lookups (half of them misses).
+bisect over a sorted array is included as the flat-array baseline.
+"""
+
+import bisect
+import random
+import time
+import tracemalloc
+from array import array
+
+from src.year_2026 import trees
+
+N = 1_000_000
+LOOKUPS = 200_000
+
+
+def balanced(cls, lo, hi):
+    # Iterative so the build itself needs no recursion limit tweaks.
+    if lo > hi:
+        return None
+    root = cls((lo + hi) // 2)
+    stack = [(root, lo, hi)]
+    while stack:
+        node, lo, hi = stack.pop()
+        mid = (lo + hi) // 2
+        if lo <= mid - 1:
+            node.left = cls((lo + mid - 1) // 2)
+            stack.append((node.left, lo, mid - 1))
+        if mid + 1 <= hi:
+            node.right = cls((mid + 1 + hi) // 2)
+            stack.append((node.right, mid + 1, hi))
+    return root
+
+
+def node_search(root, value):
+    node = root
+    while node is not None:
+        if value == node.value:
+            return True
+        node = node.left if value < node.value else node.right
+    return False
+
+
+def measure(build):
+    tracemalloc.start()
+    structure = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return structure, size
+
+
+def timed(fn, probes):
+    start = time.perf_counter()
+    for probe in probes:
+        fn(probe)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rng = random.Random(42)
+    probes = [rng.randrange(-N // 2, N + N // 2) for _ in range(LOOKUPS)]
+    layouts = {
+        "TreeNode": lambda: balanced(trees.TreeNode, 0, N - 1),
+        "SlotTreeNode": lambda: balanced(trees.SlotTreeNode, 0, N - 1),
+        "ArrayTree('q')": lambda: trees.ArrayTree.from_nodes(
+            balanced(trees.SlotTreeNode, 0, N - 1), "q"
+        ),
+        "EytzingerTree('q')": lambda: trees.EytzingerTree(range(N), "q"),
+        "sorted array('q')": lambda: array("q", range(N)),
+    }
+    lookups = {
+        "TreeNode": lambda s: lambda v: node_search(s, v),
+        "SlotTreeNode": lambda s: lambda v: node_search(s, v),
+        "ArrayTree('q')": lambda s: s.search,
+        "EytzingerTree('q')": lambda s: s.__contains__,
+        "sorted array('q')": lambda s: lambda v: bisect.bisect_left(s, v),
+    }
+    print(f"N = {N}, {LOOKUPS} random lookups")
+    print(f"{'layout':<20} {'MiB':>8} {'bytes/node':>11} {'lookups/s':>12}")
+    for name, build in layouts.items():
+        structure, size = measure(build)
+        seconds = timed(lookups[name](structure), probes)
+        print(
+            f"{name:<20} {size / 2**20:>8.1f} {size / N:>11.1f} "
+            f"{LOOKUPS / seconds:>12,.0f}"
+        )
+        del structure
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Batch LCA queries: per-pair walks against the preorder sparse-table index.
+
+A random general tree is answered with a parent-pointer walk, and a BST
+with bst_lowest_common_ancestor; both are compared with LCAIndex, whose
+build time is reported separately.
+"""
+
+import random
+import time
+
+from src.year_2026 import tree_lca, trees
+
+N = 100_000
+QUERIES = 200_000
+
+
+def random_tree(n, rng):
+    root = trees.TreeNode(0)
+    nodes, parents = [root], {root: None}
+    while len(nodes) < n:
+        parent = rng.choice(nodes)
+        side = "left" if rng.random() < 0.5 else "right"
+        if getattr(parent, side) is None:
+            child = trees.TreeNode(len(nodes))
+            setattr(parent, side, child)
+            nodes.append(child)
+            parents[child] = parent
+    return root, nodes, parents
+
+
+def walk_lca(parents, p, q):
+    seen = set()
+    while p is not None:
+        seen.add(p)
+        p = parents[p]
+    while q not in seen:
+        q = parents[q]
+    return q
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    rng = random.Random(42)
+    root, nodes, parents = random_tree(N, rng)
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(QUERIES)]
+    print(f"{N} nodes, {QUERIES} queries")
+
+    walked, walk_time = timed(lambda: [walk_lca(parents, p, q) for p, q in pairs])
+    index, build = timed(lambda: tree_lca.LCAIndex(root))
+    answered, query = timed(lambda: index.lca_many(pairs))
+    assert walked == answered
+    print(f"general tree (height {trees.tree_height(root)}):")
+    print(f"  parent walk      {walk_time:7.2f}s")
+    print(f"  LCAIndex         {build:7.2f}s build + {query:.2f}s queries")
+
+    bst = trees.bst_insert_many(None, rng.sample(range(10 * N), N))
+    bst_nodes = [trees.bst_search(bst, v) for v in trees.inorder_traversal(bst)]
+    bst_pairs = [(rng.choice(bst_nodes), rng.choice(bst_nodes)) for _ in range(QUERIES)]
+    walked, walk_time = timed(
+        lambda: [trees.bst_lowest_common_ancestor(bst, p, q) for p, q in bst_pairs]
+    )
+    index, build = timed(lambda: tree_lca.LCAIndex(bst))
+    answered, query = timed(lambda: index.lca_many(bst_pairs))
+    assert walked == answered
+    print("AVL tree:")
+    print(f"  bst walk         {walk_time:7.2f}s")
+    print(f"  LCAIndex         {build:7.2f}s build + {query:.2f}s queries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Memory and throughput of the list-backed stacks against the array-backed ones."""
+
+import random
+import tracemalloc
+
+from src.year_2026 import stack
+
+from . import best_of, report
+
+
+def traced_bytes(build) -> int:
+    tracemalloc.start()
+    try:
+        obj = build()
+        size = tracemalloc.get_traced_memory()[0]
+        del obj
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    n = 1_000_000
+    rng = random.Random(42)
+    # Large values so ints are not cached small-int singletons.
+    values = [rng.randint(10**6, 10**12) for _ in range(n)]
+
+    def fill(s):
+        for v in values:
+            s.push(v)
+        return s
+
+    def build_min_stack():
+        return fill(stack.MinStack())
+
+    def build_typed_min_stack():
+        return fill(stack.TypedMinStack("q"))
+
+    def drain(s):
+        while s.peek() is not None:
+            s.pop()
+
+    def fill_fresh(s):
+        # New int objects per push, as when values arrive from parsing or I/O.
+        for i in range(n):
+            s.push(10**12 + i * 7919)
+        return s
+
+    print("memory for 10^6 freshly created values:")
+    for name, cls in [
+        ("Stack", stack.Stack),
+        ("TypedStack('q')", lambda: stack.TypedStack("q")),
+        ("MinStack", stack.MinStack),
+        ("TypedMinStack('q')", lambda: stack.TypedMinStack("q")),
+    ]:
+        size = traced_bytes(lambda: fill_fresh(cls()))
+        print(f"  {name:<20} {size / 2**20:8.1f} MiB")
+
+    print(f"\n{'case':<40} {'list':>11} {'typed':>11} {'speedup':>9}")
+    report(
+        "push 10^6",
+        best_of(lambda: fill(stack.Stack())),
+        best_of(lambda: fill(stack.TypedStack("q"))),
+    )
+    report(
+        "push_many 10^6",
+        best_of(lambda: stack.Stack().push_many(values)),
+        best_of(lambda: stack.TypedStack("q").push_many(values)),
+    )
+    report(
+        "MinStack push + drain 10^6",
+        best_of(lambda: drain(build_min_stack())),
+        best_of(lambda: drain(build_typed_min_stack())),
+    )
+    report(
+        "MinStack fill + drain, bulk ops on typed",
+        best_of(lambda: drain(build_min_stack())),
+        best_of(
+            lambda: [
+                s.pop_n(1000)
+                for s in [stack.TypedMinStack("q", values)]
+                for _ in range(1000)
+            ]
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
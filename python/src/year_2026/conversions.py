@@ -1,3 +1,6 @@
+from .trees import bst_from_sorted
+
+
 def list_to_linked_list(values):
     """Convert a list to a linked list, return root node (None if empty list)."""
     raise NotImplementedError
@@ -9,8 +12,13 @@ def bst_to_sorted_array(root):
 
 
 def sorted_array_to_balanced_bst(arr):
-    """Convert sorted array to height-balanced BST."""
-    raise NotImplementedError
+    """Convert sorted array to height-balanced BST.
+
+    The middle element becomes the root. Delegates to trees.bst_from_sorted,
+    which builds the tree in O(n) without slicing or recursion and also
+    accepts iterators of unknown length.
+    """
+    return bst_from_sorted(arr, len(arr))
 
 
 def adjacency_list_to_matrix(adj_list, n):
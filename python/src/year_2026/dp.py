@@ -1,17 +1,25 @@
 """Dynamic programming problems - from basic 1D to advanced patterns."""
 
+from .memo import memoize
+
 
 # === 1D DP ===
 
 
+@memoize(maxsize=1024, chain=True)
 def fibonacci(n):
     """Return nth Fibonacci number."""
-    raise NotImplementedError
+    if n < 2:
+        return n
+    return fibonacci(n - 1) + fibonacci(n - 2)
 
 
+@memoize(maxsize=1024, chain=True)
 def climbing_stairs(n):
     """Return number of ways to climb n stairs taking 1 or 2 steps at a time."""
-    raise NotImplementedError
+    if n <= 2:
+        return max(n, 1)
+    return climbing_stairs(n - 1) + climbing_stairs(n - 2)
 
 
 def house_robber(nums):
@@ -0,0 +1,123 @@
+"""External merge sort for line-oriented files larger than RAM.
+
+Phase 1 reads the input in chunks of at most `memory_limit` bytes, sorts
+each chunk in memory with `sorting.merge_sort` and spills it to a temporary
+run file. Phase 2 k-way merges up to `fan_in` runs at a time with a heap,
+each run read through a buffer of about memory_limit / (fan_in + 1) bytes,
+repeating until a single run is left.
+
+Records are held without their b"\n" terminator everywhere they are
+compared, so a record sorts before any longer record it is a prefix of,
+even when the longer one continues with a byte below b"\n" (a tab).
+Run files store one record per line.
+"""
+
+from __future__ import annotations
+import heapq
+import os
+import shutil
+import tempfile
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional
+
+from .sorting import merge_sort
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+DEFAULT_FAN_IN = 64
+
+
+def _records(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield each line without its trailing newline (the last may lack one)."""
+    for line in lines:
+        yield line[:-1] if line.endswith(b"\n") else line
+
+
+def _lines(records: Iterable[bytes]) -> Iterator[bytes]:
+    for record in records:
+        yield record + b"\n"
+
+
+def _read_chunks(source: BinaryIO, memory_limit: int) -> Iterator[List[bytes]]:
+    """Yield lists of records of about memory_limit bytes (payload, not overhead)."""
+    chunk: List[bytes] = []
+    size = 0
+    for record in _records(source):
+        chunk.append(record)
+        size += len(record) + 1
+        if size >= memory_limit:
+            yield chunk
+            chunk, size = [], 0
+    if chunk:
+        yield chunk
+
+
+def _write_run(records: Iterable[bytes], tmp_dir: str, buffer_size: int) -> str:
+    fd, path = tempfile.mkstemp(prefix="run-", suffix=".txt", dir=tmp_dir)
+    with open(fd, "wb", buffering=buffer_size) as out:
+        out.writelines(_lines(records))
+    return path
+
+
+def _merge_runs(
+    paths: List[str],
+    out: BinaryIO,
+    buffer_size: int,
+    key: Optional[Callable[[bytes], object]],
+) -> None:
+    """K-way merge the sorted run files into out."""
+    files = [open(path, "rb", buffering=buffer_size) for path in paths]
+    try:
+        merged = heapq.merge(*(_records(f) for f in files), key=key)
+        out.writelines(_lines(merged))
+    finally:
+        for f in files:
+            f.close()
+
+
+def external_sort(
+    input_path: str,
+    output_path: str,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+    fan_in: int = DEFAULT_FAN_IN,
+    tmp_dir: Optional[str] = None,
+    key: Optional[Callable[[bytes], object]] = None,
+    sorter: Callable[[List], List] = merge_sort,
+) -> int:
+    """Sort the newline-separated records of input_path into output_path.
+
+    Records are compared as bytes without their trailing newline (or by
+    key(record) if given); the output always ends with a newline. `sorter`
+    must take key= and return a new, stably sorted list (merge_sort,
+    quick_sort or the built-in `sorted`). Returns the number of sorted runs
+    spilled.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    if memory_limit <= 0:
+        raise ValueError("memory_limit must be positive")
+    buffer_size = max(memory_limit // (fan_in + 1), 4096)
+    work_dir = tempfile.mkdtemp(prefix="external-sort-", dir=tmp_dir)
+    try:
+        runs = []
+        with open(input_path, "rb", buffering=buffer_size) as source:
+            for chunk in _read_chunks(source, memory_limit):
+                ordered = sorter(chunk, key=key)
+                runs.append(_write_run(ordered, work_dir, buffer_size))
+        spilled = len(runs)
+
+        # Merge passes until at most fan_in runs remain, then merge into the output.
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i : i + fan_in]
+                fd, path = tempfile.mkstemp(prefix="run-", suffix=".txt", dir=work_dir)
+                with open(fd, "wb", buffering=buffer_size) as out:
+                    _merge_runs(group, out, buffer_size, key)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+        with open(output_path, "wb", buffering=buffer_size) as out:
+            _merge_runs(runs, out, buffer_size, key)
+        return spilled
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
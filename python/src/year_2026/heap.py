@@ -1,5 +1,7 @@
 """Heap (priority queue) data structure and heap-based problems."""
 
+from .sorting import select
+
 
 class MinHeap:
     """Min-heap where parent is always smaller than children."""
@@ -59,12 +61,12 @@ def heap_sort(arr):
 
 def kth_largest(arr, k):
     """Return the kth largest element in arr. k=1 is the maximum."""
-    raise NotImplementedError
+    return select(list(arr), len(arr) - k)
 
 
 def kth_smallest(arr, k):
     """Return the kth smallest element in arr. k=1 is the minimum."""
-    raise NotImplementedError
+    return select(list(arr), k - 1)
 
 
 def merge_k_sorted_lists(lists):
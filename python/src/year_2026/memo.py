@@ -0,0 +1,266 @@
+"""Process-wide bounded memoization with LRU/LFU eviction and hit-rate stats."""
+
+from __future__ import annotations
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_KWARGS_MARK = object()
+
+# Every memoized function registers its cache here so stats can be read in one
+# place. Keyed by the cache itself, so closures and redefinitions sharing a
+# qualified name each keep their entry, and weakly, so the registry never
+# keeps a discarded function's cache alive.
+_REGISTRY: weakref.WeakKeyDictionary[_Cache, str] = weakref.WeakKeyDictionary()
+
+# memoize(chain=True) fills the cache bottom-up in steps of this many
+# arguments, so recursion through the wrapper stays about CHAIN_STRIDE calls
+# deep instead of n.
+CHAIN_STRIDE = 128
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Snapshot of a cache's counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return hits / lookups, 0.0 if the cache was never queried."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Cache(ABC):
+    """Base cache that counts hits, misses and evictions.
+
+    get, put and clear hold an RLock, so one cache can be shared between
+    threads, as with functools.lru_cache.
+    """
+
+    def __init__(self, maxsize: Optional[int]) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self)
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+
+class LRUCache(_Cache):
+    """Evict the least recently used entry once maxsize is reached."""
+
+    def __init__(self, maxsize: Optional[int]) -> None:
+        super().__init__(maxsize)
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default on a miss."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry if full."""
+        with self._lock:
+            if self.maxsize == 0:
+                return
+            if key in self._data:
+                self._data.move_to_end(key)
+            elif self.maxsize is not None and len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            self._data[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.reset_stats()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LFUCache(_Cache):
+    """Evict the least frequently used entry (oldest first on ties) in O(1)."""
+
+    def __init__(self, maxsize: Optional[int]) -> None:
+        super().__init__(maxsize)
+        self._values: Dict[Hashable, Any] = {}
+        self._freq: Dict[Hashable, int] = {}
+        # frequency -> keys with that frequency, in insertion/usage order
+        self._buckets: Dict[int, OrderedDict[Hashable, None]] = {}
+        self._min_freq = 0
+
+    def _touch(self, key: Hashable) -> None:
+        freq = self._freq[key]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default on a miss."""
+        with self._lock:
+            if key not in self._values:
+                self.misses += 1
+                return default
+            self._touch(key)
+            self.hits += 1
+            return self._values[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least used entry if full."""
+        with self._lock:
+            if self.maxsize == 0:
+                return
+            if key in self._values:
+                self._values[key] = value
+                self._touch(key)
+                return
+            if self.maxsize is not None and len(self._values) >= self.maxsize:
+                bucket = self._buckets[self._min_freq]
+                victim, _ = bucket.popitem(last=False)
+                if not bucket:
+                    del self._buckets[self._min_freq]
+                del self._values[victim]
+                del self._freq[victim]
+                self.evictions += 1
+            self._values[key] = value
+            self._freq[key] = 1
+            self._buckets.setdefault(1, OrderedDict())[key] = None
+            self._min_freq = 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._freq.clear()
+            self._buckets.clear()
+            self._min_freq = 0
+            self.reset_stats()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+_POLICIES = {"lru": LRUCache, "lfu": LFUCache}
+_MISSING = object()
+
+
+def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def memoize(
+    maxsize: Optional[int] = 1024, policy: str = "lru", chain: bool = False
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Cache a function's results across calls. maxsize=None means unbounded.
+
+    The wrapped function gets cache_info() and cache_clear(). Recursive calls
+    go through the cache too, so subproblems are shared between top-level calls.
+
+    chain=True is for a function of one int n that recurses on n - 1, n - 2,
+    ... with small base cases. A miss on a large n first evaluates the
+    function at every CHAIN_STRIDE-th argument below n, bottom-up from the
+    nearest one already cached, so no call recurses much deeper than
+    CHAIN_STRIDE and any n works regardless of the recursion limit.
+    maxsize must then be well above CHAIN_STRIDE (or None).
+    """
+    if policy not in _POLICIES:
+        raise ValueError(
+            f"unknown eviction policy {policy!r}, use one of {sorted(_POLICIES)}"
+        )
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("maxsize must be >= 0 or None")
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache = _POLICIES[policy](maxsize)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _make_key(args, kwargs)
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                if chain and len(key) == 1 and type(key[0]) is int:
+                    _fill_chain(wrapper, cache, key[0])
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        _REGISTRY[cache] = f"{func.__module__}.{func.__qualname__}"
+        return wrapper
+
+    return decorator
+
+
+def _fill_chain(wrapper: Callable[[int], Any], cache: _Cache, n: int) -> None:
+    """Evaluate wrapper at n - k * CHAIN_STRIDE, bottom-up from the first cached one."""
+    start = n - CHAIN_STRIDE
+    while start > 0 and (start,) not in cache:
+        start -= CHAIN_STRIDE
+    for k in range(start + CHAIN_STRIDE, n, CHAIN_STRIDE):
+        wrapper(k)
+
+
+def cache_stats() -> Dict[str, CacheInfo]:
+    """Return a snapshot of every live memoized function's counters.
+
+    Keyed by qualified name; later functions with a name already taken
+    (closures, redefinitions) get a "#2", "#3", ... suffix.
+    """
+    stats: Dict[str, CacheInfo] = {}
+    for cache, name in list(_REGISTRY.items()):
+        key, copy = name, 1
+        while key in stats:
+            copy += 1
+            key = f"{name}#{copy}"
+        stats[key] = cache.info()
+    return stats
+
+
+def clear_all_caches() -> None:
+    """Empty every registered cache and reset its counters."""
+    for cache in list(_REGISTRY):
+        cache.clear()
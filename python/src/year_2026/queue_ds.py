@@ -1,42 +1,615 @@
 """Queue data structure and queue-based problems."""
 
-from typing import Generic, Optional, TypeVar
+import asyncio
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Deque, Generic, Iterable, List, Optional, TypeVar
 
 
 T = TypeVar("T")
 
+# What a bounded queue does when it is full: wait for room (only meaningful
+# when another thread is consuming), evict the front item, or raise QueueFull.
+OVERFLOW_POLICIES = ("block", "drop_oldest", "raise")
+
+
+class QueueFull(Exception):
+    """Raised when enqueueing into a full queue with overflow="raise"."""
+
+
+class QueueEmpty(Exception):
+    """Raised when a blocking get times out on an empty queue."""
+
 
 class Queue(Generic[T]):
-    """Basic queue with enqueue, dequeue, peek, and is_empty operations."""
+    """Basic queue with enqueue, dequeue, peek, and is_empty operations.
+
+    Backed by a circular buffer, so enqueue and dequeue are O(1) (amortized
+    while growing). With capacity=None the buffer doubles when full;
+    otherwise a full queue applies the overflow policy.
+    """
 
-    def __init__(self) -> None:
-        self._queue = []
+    def __init__(self, capacity: Optional[int] = None, overflow: str = "raise") -> None:
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        if overflow == "block" and type(self) is Queue:
+            raise ValueError(
+                "a single-threaded Queue has no consumer to make room; "
+                "use ThreadSafeQueue or AsyncQueue for 'block'"
+            )
+        self.capacity = capacity
+        self.overflow = overflow
+        self.dropped = 0
+        self._buf: List[Optional[T]] = [None] * (capacity or 8)
+        self._head = 0
+        self._size = 0
 
     def __repr__(self) -> str:
-        return "<Queue@{} : {}>".format(id(self), (self._queue))
+        return "<Queue@{} : {}>".format(id(self), self._items())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _items(self) -> List[T]:
+        end = self._head + self._size
+        if end <= len(self._buf):
+            return self._buf[self._head : end]
+        return self._buf[self._head :] + self._buf[: end - len(self._buf)]
+
+    def _grow(self, needed: int) -> None:
+        size = len(self._buf)
+        while size < needed:
+            size *= 2
+        items = self._items()
+        self._buf = items + [None] * (size - len(items))
+        self._head = 0
+
+    def _make_room(self, count: int) -> int:
+        """Apply the overflow policy for count incoming items; return how many fit."""
+        free = len(self._buf) - self._size
+        if count <= free:
+            return count
+        if self.capacity is None:
+            self._grow(self._size + count)
+            return count
+        if self.overflow != "drop_oldest":
+            # "block" callers wait for room first; reaching here means they didn't.
+            raise QueueFull(f"queue is at capacity {self.capacity}")
+        # drop_oldest: evict from the front; only the newest capacity items survive.
+        evict = min(count - free, self._size)
+        self._take(evict)
+        self.dropped += evict + max(count - self.capacity, 0)
+        return min(count, self.capacity)
+
+    def _take(self, count: int) -> List[T]:
+        """Remove count items from the front and return them in order."""
+        buf, head = self._buf, self._head
+        first = min(count, len(buf) - head)
+        items = buf[head : head + first]
+        buf[head : head + first] = [None] * first
+        if first < count:
+            rest = count - first
+            items += buf[:rest]
+            buf[:rest] = [None] * rest
+        self._head = (head + count) % len(buf)
+        self._size -= count
+        return items
 
     def enqueue(self, value: T) -> None:
         """Add value to the back of the queue."""
-        self._queue.append(value)
-        print(self)
+        if self._size == len(self._buf):
+            self._make_room(1)
+        buf = self._buf
+        buf[(self._head + self._size) % len(buf)] = value
+        self._size += 1
+
+    def enqueue_many(self, values: Iterable[T]) -> None:
+        """Add every value to the back of the queue, in order."""
+        values = list(values)
+        fits = self._make_room(len(values))
+        if fits < len(values):
+            values = values[len(values) - fits :]
+        buf = self._buf
+        tail = (self._head + self._size) % len(buf)
+        first = min(len(values), len(buf) - tail)
+        buf[tail : tail + first] = values[:first]
+        buf[: len(values) - first] = values[first:]
+        self._size += len(values)
 
     def dequeue(self) -> Optional[T]:
         """Remove and return the front value. Return None if empty."""
         if self.is_empty():
             return None
-        val = self._queue.pop(0)
-        print(self)
+        buf = self._buf
+        val = buf[self._head]
+        buf[self._head] = None
+        self._head = (self._head + 1) % len(buf)
+        self._size -= 1
         return val
 
+    def dequeue_many(self, n: int) -> List[T]:
+        """Remove and return up to n values from the front, in order."""
+        return self._take(max(0, min(n, self._size)))
+
     def peek(self) -> Optional[T]:
         """Return the front value without removing it. Return None if empty."""
         if self.is_empty():
             return None
-        return self._queue[0]
+        return self._buf[self._head]
 
     def is_empty(self) -> bool:
         """Return True if queue has no elements."""
-        return len(self._queue) == 0
+        return self._size == 0
+
+    def is_full(self) -> bool:
+        """Return True if a bounded queue is at capacity."""
+        return self.capacity is not None and self._size >= self.capacity
+
+
+@dataclass
+class QueueStats:
+    """Counters shared by the concurrent queues. Wait times are in seconds."""
+
+    enqueued: int = 0
+    dequeued: int = 0
+    max_depth: int = 0
+    put_wait: float = 0.0
+    get_wait: float = 0.0
+    started: float = field(default_factory=time.perf_counter)
+
+    def record_put(self, count: int, depth: int, waited: float) -> None:
+        self.enqueued += count
+        self.max_depth = max(self.max_depth, depth)
+        self.put_wait += waited
+
+    def record_get(self, count: int, waited: float) -> None:
+        self.dequeued += count
+        self.get_wait += waited
+
+    @property
+    def throughput(self) -> float:
+        """Items dequeued per second since the queue was created."""
+        elapsed = time.perf_counter() - self.started
+        return self.dequeued / elapsed if elapsed > 0 else 0.0
+
+
+class ThreadSafeQueue(Queue[T]):
+    """Queue that can be shared between threads.
+
+    put/get block (with optional timeouts) when the queue is full/empty;
+    overflow defaults to "block" so producers are slowed down to the
+    consumers' pace. The Queue methods keep their non-blocking meaning:
+    dequeue returns None when empty, enqueue follows the overflow policy.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, overflow: str = "block") -> None:
+        super().__init__(capacity, overflow)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._stats = QueueStats()
+
+    def stats(self) -> QueueStats:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            return QueueStats(**vars(self._stats))
+
+    def _wait_for_room(self, deadline: Optional[float]) -> None:
+        while self.is_full():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise QueueFull(f"no room within timeout (capacity {self.capacity})")
+            self._not_full.wait(remaining)
+
+    def put(self, value: T, timeout: Optional[float] = None) -> None:
+        """Add value, waiting up to timeout seconds for room. Raise QueueFull on timeout."""
+        self.put_many([value], timeout)
+
+    def put_many(self, values: Iterable[T], timeout: Optional[float] = None) -> None:
+        """Add values in order, waiting for room as the consumers drain the queue."""
+        values = list(values)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = time.perf_counter()
+        with self._lock:
+            pos = 0
+            while pos < len(values):
+                if self.overflow == "block" and self.capacity is not None:
+                    self._wait_for_room(deadline)
+                    room = self.capacity - len(self)
+                    batch = values[pos : pos + room]
+                else:
+                    batch = values[pos:]
+                super().enqueue_many(batch)
+                pos += len(batch)
+                self._not_empty.notify(len(batch))
+            self._stats.record_put(len(values), len(self), time.perf_counter() - start)
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        """Remove and return the front value, waiting up to timeout seconds.
+
+        Raise QueueEmpty if nothing arrived in time.
+        """
+        items = self.get_many(1, timeout)
+        if not items:
+            raise QueueEmpty("no item within timeout")
+        return items[0]
+
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[T]:
+        """Wait up to timeout for at least one item, then drain up to max_items.
+
+        Returns an empty list on timeout.
+        """
+        start = time.perf_counter()
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: len(self) > 0, timeout):
+                return []
+            items = super().dequeue_many(max_items)
+            self._not_full.notify(len(items))
+            self._stats.record_get(len(items), time.perf_counter() - start)
+            return items
+
+    def enqueue(self, value: T) -> None:
+        """Add value to the back of the queue (waits for room under "block")."""
+        self.put_many([value])
+
+    def enqueue_many(self, values: Iterable[T]) -> None:
+        """Add every value to the back of the queue, in order."""
+        self.put_many(values)
+
+    def dequeue(self) -> Optional[T]:
+        """Remove and return the front value. Return None if empty."""
+        items = self.dequeue_many(1)
+        return items[0] if items else None
+
+    def dequeue_many(self, n: int) -> List[T]:
+        """Remove and return up to n values without waiting."""
+        with self._lock:
+            items = super().dequeue_many(n)
+            if items:
+                self._not_full.notify(len(items))
+                self._stats.record_get(len(items), 0.0)
+            return items
+
+    def peek(self) -> Optional[T]:
+        """Return the front value without removing it. Return None if empty."""
+        with self._lock:
+            return super().peek()
+
+
+def _wake_next(waiters: Deque[asyncio.Future]) -> None:
+    while waiters:
+        waiter = waiters.popleft()
+        if not waiter.done():
+            waiter.set_result(None)
+            return
+
+
+class AsyncQueue(Queue[T]):
+    """Queue for coroutines on one event loop, with awaitable put/get.
+
+    Same blocking semantics and counters as ThreadSafeQueue, but waiting
+    suspends the coroutine instead of a thread. Not safe across threads.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, overflow: str = "block") -> None:
+        super().__init__(capacity, overflow)
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: Deque[asyncio.Future] = deque()
+        self._stats = QueueStats()
+
+    def stats(self) -> QueueStats:
+        """Return a snapshot of the counters."""
+        return QueueStats(**vars(self._stats))
+
+    async def _wait(
+        self, waiters: Deque[asyncio.Future], deadline: Optional[float]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        waiters.append(waiter)
+        try:
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            await asyncio.wait_for(waiter, timeout)
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # Woken but leaving anyway (cancelled or timed out): hand
+                # the wakeup to the next waiter so it is not lost.
+                _wake_next(waiters)
+            else:
+                waiter.cancel()
+                if waiter in waiters:
+                    waiters.remove(waiter)
+            raise
+
+    async def put(self, value: T, timeout: Optional[float] = None) -> None:
+        """Add value, waiting up to timeout seconds for room. Raise QueueFull on timeout."""
+        await self.put_many([value], timeout)
+
+    async def put_many(
+        self, values: Iterable[T], timeout: Optional[float] = None
+    ) -> None:
+        """Add values in order, waiting for room as the consumers drain the queue."""
+        values = list(values)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        start = time.perf_counter()
+        pos = 0
+        while pos < len(values):
+            if self.overflow == "block" and self.capacity is not None:
+                while self.is_full():
+                    try:
+                        await self._wait(self._putters, deadline)
+                    except TimeoutError:
+                        raise QueueFull("no room within timeout") from None
+                batch = values[pos : pos + self.capacity - len(self)]
+            else:
+                batch = values[pos:]
+            super().enqueue_many(batch)
+            pos += len(batch)
+            for _ in batch:
+                _wake_next(self._getters)
+        self._stats.record_put(len(values), len(self), time.perf_counter() - start)
+
+    async def get(self, timeout: Optional[float] = None) -> T:
+        """Remove and return the front value, waiting up to timeout seconds.
+
+        Raise QueueEmpty if nothing arrived in time.
+        """
+        items = await self.get_many(1, timeout)
+        if not items:
+            raise QueueEmpty("no item within timeout")
+        return items[0]
+
+    async def get_many(
+        self, max_items: int, timeout: Optional[float] = None
+    ) -> List[T]:
+        """Wait up to timeout for at least one item, then drain up to max_items.
+
+        Returns an empty list on timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        start = time.perf_counter()
+        while self.is_empty():
+            try:
+                await self._wait(self._getters, deadline)
+            except TimeoutError:
+                return []
+        items = super().dequeue_many(max_items)
+        for _ in items:
+            _wake_next(self._putters)
+        self._stats.record_get(len(items), time.perf_counter() - start)
+        return items
+
+    def enqueue(self, value: T) -> None:
+        """Add value without waiting; a full "block" queue raises QueueFull."""
+        super().enqueue(value)
+        self._stats.record_put(1, len(self), 0.0)
+        _wake_next(self._getters)
+
+    def enqueue_many(self, values: Iterable[T]) -> None:
+        """Add every value without waiting; a full "block" queue raises QueueFull."""
+        values = list(values)
+        super().enqueue_many(values)
+        self._stats.record_put(len(values), len(self), 0.0)
+        for _ in values:
+            _wake_next(self._getters)
+
+    def dequeue(self) -> Optional[T]:
+        """Remove and return the front value. Return None if empty."""
+        items = self.dequeue_many(1)
+        return items[0] if items else None
+
+    def dequeue_many(self, n: int) -> List[T]:
+        """Remove and return up to n values without waiting."""
+        items = super().dequeue_many(n)
+        self._stats.record_get(len(items), 0.0)
+        for _ in items:
+            _wake_next(self._putters)
+        return items
+
+
+# SharedRingBuffer layout: capacity and record size, then the producer's tail
+# and the consumer's head counters on separate cache lines, then the data.
+_RING_HEADER = 192
+_RING_TAIL = 64 // 8
+_RING_HEAD = 128 // 8
+_RING_WRAP = 0xFFFFFFFF
+_RING_LEN = struct.Struct("<I")
+
+
+class SharedRingBuffer:
+    """Single-producer/single-consumer byte ring in shared memory.
+
+    Carries fixed-size records (record_size > 0) or length-prefixed
+    messages (record_size=0) between two processes without pickling. The
+    other process attaches by name, or receives the pickled buffer, which
+    pickles as its name. head and tail are monotonic byte counters, each
+    written by one side only, and a side publishes its counter only after
+    the data is in place. A variable-length message that would straddle
+    the end of the buffer is moved to the start, so every record is
+    contiguous and acquire() can return a memoryview into shared memory.
+    The space skipped that way counts as used until the message is read,
+    so a message (prefix and padding included) may take at most half the
+    capacity; that way it always fits into an empty ring.
+
+    Exactly one process may put and exactly one may get.
+    """
+
+    def __init__(self, capacity: int, record_size: int = 0) -> None:
+        if record_size < 0:
+            raise ValueError("record_size must be >= 0")
+        if record_size:
+            capacity -= capacity % record_size
+        else:
+            capacity -= capacity % 8
+        if capacity < max(record_size, 16):
+            raise ValueError("capacity too small for one record")
+        shm = shared_memory.SharedMemory(create=True, size=_RING_HEADER + capacity)
+        shm.buf[:_RING_HEADER] = bytes(_RING_HEADER)
+        struct.pack_into("<QQ", shm.buf, 0, capacity, record_size)
+        self._setup(shm)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedRingBuffer":
+        """Open a ring created by another process.
+
+        The attaching side is not registered with the resource tracker, so
+        the block is freed only by the creator calling unlink().
+        """
+        ring = cls.__new__(cls)
+        ring._setup(shared_memory.SharedMemory(name=name, track=False))
+        return ring
+
+    def _setup(self, shm: shared_memory.SharedMemory) -> None:
+        self._shm = shm
+        self.capacity, self.record_size = struct.unpack_from("<QQ", shm.buf, 0)
+        self._counters = shm.buf[:_RING_HEADER].cast("Q")
+        self._data = shm.buf[_RING_HEADER : _RING_HEADER + self.capacity]
+        self._pending: Optional[int] = None
+
+    def __reduce__(self):
+        return (SharedRingBuffer.attach, (self.name,))
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def __len__(self) -> int:
+        """Bytes in use, including length prefixes and padding."""
+        return self._counters[_RING_TAIL] - self._counters[_RING_HEAD]
+
+    def is_empty(self) -> bool:
+        return self._counters[_RING_TAIL] == self._counters[_RING_HEAD]
+
+    def _record_bytes(self, size: int) -> int:
+        if self.record_size:
+            if size != self.record_size:
+                raise ValueError(f"record must be exactly {self.record_size} bytes")
+            return size
+        return (_RING_LEN.size + size + 7) & ~7
+
+    def try_put(self, data) -> bool:
+        """Copy data into the ring; return False if there is no room yet."""
+        data = memoryview(data).cast("B")
+        need = self._record_bytes(len(data))
+        if self.record_size:
+            limit = self.capacity
+        else:
+            # A wrapped message skips up to `need` bytes at the end first.
+            limit = self.capacity // 2
+        if need > limit:
+            raise ValueError("record too large for the ring")
+        tail = self._counters[_RING_TAIL]
+        pos = tail % self.capacity
+        to_end = self.capacity - pos
+        skip = to_end if need > to_end else 0
+        if self.capacity - (tail - self._counters[_RING_HEAD]) < skip + need:
+            return False
+        if skip:
+            _RING_LEN.pack_into(self._data, pos, _RING_WRAP)
+            pos = 0
+        if self.record_size:
+            self._data[pos : pos + need] = data
+        else:
+            _RING_LEN.pack_into(self._data, pos, len(data))
+            start = pos + _RING_LEN.size
+            self._data[start : start + len(data)] = data
+        self._counters[_RING_TAIL] = tail + skip + need
+        return True
+
+    def put(self, data, timeout: Optional[float] = None) -> None:
+        """Copy data into the ring, polling for room. Raise QueueFull on timeout."""
+        if not _poll(lambda: self.try_put(data), timeout):
+            raise QueueFull("no room in the ring within timeout")
+
+    def try_acquire(self) -> Optional[memoryview]:
+        """Return a view of the next record without copying, or None if empty.
+
+        The view points into shared memory and is only valid until release();
+        call release() before acquiring the next record.
+        """
+        if self._pending is not None:
+            raise RuntimeError("release() the previous record first")
+        head = self._counters[_RING_HEAD]
+        if head == self._counters[_RING_TAIL]:
+            return None
+        pos = head % self.capacity
+        if self.record_size:
+            size, start = self.record_size, pos
+        else:
+            (size,) = _RING_LEN.unpack_from(self._data, pos)
+            if size == _RING_WRAP:
+                head += self.capacity - pos
+                pos = 0
+                (size,) = _RING_LEN.unpack_from(self._data, 0)
+            start = pos + _RING_LEN.size
+        self._pending = head + self._record_bytes(size)
+        return self._data[start : start + size]
+
+    def acquire(self, timeout: Optional[float] = None) -> memoryview:
+        """Wait for the next record and return a view of it. Raise QueueEmpty on timeout."""
+        found: List[memoryview] = []
+
+        def attempt() -> bool:
+            view = self.try_acquire()
+            if view is not None:
+                found.append(view)
+            return view is not None
+
+        if not _poll(attempt, timeout):
+            raise QueueEmpty("no record within timeout")
+        return found[0]
+
+    def release(self) -> None:
+        """Hand the acquired record's space back to the producer."""
+        if self._pending is None:
+            raise RuntimeError("no record acquired")
+        self._counters[_RING_HEAD] = self._pending
+        self._pending = None
+
+    def get(self, timeout: Optional[float] = None) -> bytes:
+        """Wait for the next record and return a copy of it."""
+        view = self.acquire(timeout)
+        try:
+            return bytes(view)
+        finally:
+            view.release()
+            self.release()
+
+    def close(self) -> None:
+        """Detach from the shared memory. Views from acquire() must be released."""
+        self._counters.release()
+        self._data.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory; call once, from the creating process."""
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedRingBuffer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _poll(attempt, timeout: Optional[float]) -> bool:
+    """Call attempt() until it returns True, backing off from spinning to short sleeps."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = 0.0
+    while not attempt():
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2 or 1e-6, 1e-3)
+    return True
 
 
 class QueueUsingStacks:
@@ -1,26 +1,38 @@
 """Basic recursion exercises to build comfort with recursive thinking."""
 
-from typing import Dict, List, Optional
+from typing import List
+
+from .memo import memoize
+
+
+def _range_product(lo: int, hi: int) -> int:
+    """Return lo * (lo + 1) * ... * hi by splitting the range in half (product tree).
+
+    Multiplying balanced halves keeps both bigint operands about the same size,
+    which is much cheaper than growing one huge product a small factor at a time.
+    """
+    if lo > hi:
+        return 1
+    if hi - lo < 8:
+        result = lo
+        for k in range(lo + 1, hi + 1):
+            result *= k
+        return result
+    mid = (lo + hi) // 2
+    return _range_product(lo, mid) * _range_product(mid + 1, hi)
 
 
 def factorial(n: int) -> int:
     """Return n! (n factorial). Base case: 0! = 1."""
-    if n == 0:
-        return 1
-    else:
-        return n * factorial(n - 1)
+    return _range_product(1, n)
 
 
-def factorial_memo(n: int, memo: Optional[Dict[int, int]] = None) -> int:
+@memoize(maxsize=1024, chain=True)
+def factorial_memo(n: int) -> int:
     """Return n! using memoization. Same behavior as factorial, different implementation."""
-    if memo is None:
-        memo = {0: 1}
-    if n in memo.keys():
-        return memo[n]
-    else:
-        fact = n * factorial_memo(n - 1, memo)
-        memo[n] = fact
-        return fact
+    if n == 0:
+        return 1
+    return n * factorial_memo(n - 1)
 
 
 def sum_array_recursive(arr: List[int]) -> int:
@@ -44,24 +56,28 @@ def reverse_string_recursive(s: str) -> str:
 
 
 def power(base: int, exp: int) -> int:
-    """Return base raised to exp using recursion. Assume exp >= 0."""
+    """Return base raised to exp using recursion. Assume exp >= 0.
+
+    Uses exponentiation by squaring: base^exp = (base^(exp//2))^2 * base^(exp%2),
+    so only O(log exp) multiplications are needed.
+    """
     if exp == 0:
         return 1
-    elif exp == 1:
-        return base
-    else:
-        return base * power(base, exp - 1)
+    half = power(base, exp // 2)
+    if exp % 2 == 0:
+        return half * half
+    return half * half * base
 
 
-def power_memo(base: int, exp: int, memo: Optional[Dict[int, int]] = None):
+@memoize(maxsize=1024)
+def power_memo(base: int, exp: int) -> int:
     """Return base raised to exp using memoization. Same behavior as power, different implementation."""
-    if memo is None:
-        memo = {0: 1, 1: base}
-    if exp in memo.keys():
-        return memo[exp]
-    else:
-        memo[exp] = base * power_memo(base, exp - 1, memo)
-        return memo[exp]
+    if exp == 0:
+        return 1
+    half = power_memo(base, exp // 2)
+    if exp % 2 == 0:
+        return half * half
+    return half * half * base
 
 
 def fibonacci_recursive(n: int) -> int:
@@ -74,14 +90,9 @@ def fibonacci_recursive(n: int) -> int:
         return fibonacci_recursive(n - 1) + fibonacci_recursive(n - 2)
 
 
-def fibonacci_memo(n: int, memo: Optional[Dict[int, int]] = None) -> int:
+@memoize(maxsize=1024, chain=True)
+def fibonacci_memo(n: int) -> int:
     """Return nth Fibonacci number using memoization. Same behavior, different implementation."""
-    if memo is None:
-        memo = {0: 0, 1: 1}
-    if n in memo.keys():
-        return memo[n]
-    else:
-        n_1 = fibonacci_memo(n - 1, memo)
-        n_2 = fibonacci_memo(n - 2, memo)
-        memo[n] = n_1 + n_2
-        return memo[n]
+    if n < 2:
+        return n
+    return fibonacci_memo(n - 1) + fibonacci_memo(n - 2)
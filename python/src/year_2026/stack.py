@@ -1,7 +1,13 @@
 """Stack data structure and stack-based problems."""
 
 from __future__ import annotations
-from typing import Generic, Iterable, Optional, TypeVar
+import ast
+import operator
+import re
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from typing import BinaryIO, Generic, Iterable, List, Optional, TextIO, TypeVar
 
 T = TypeVar("T")
 
@@ -32,56 +38,372 @@ class Stack(Generic[T]):
         """Return True if stack has no elements."""
         return len(self._stack) == 0
 
+    def push_many(self, values: Iterable[T]) -> None:
+        """Push every value in order; the last one ends up on top."""
+        self._stack.extend(values)
+
+    def pop_n(self, n: int) -> List[T]:
+        """Remove up to n values and return them top first."""
+        if n <= 0:
+            return []
+        popped = self._stack[-n:]
+        del self._stack[-n:]
+        popped.reverse()
+        return popped
+
+    def __len__(self) -> int:
+        return len(self._stack)
+
     def __repr__(self) -> str:
         return "<Stack@{} = `{}`>".format(id(self), self._stack)
 
 
+class BracketValidator:
+    """Incremental bracket checker that carries its stack across chunks.
+
+    Feed str or bytes chunks in order (e.g. straight from a file or socket);
+    the first error's offset into the whole stream is kept in error_offset.
+
+    Each chunk is handled mostly in C: non-brackets are stripped with
+    bytes.translate (a regex for str), then adjacent matched pairs like "()"
+    are deleted with bytes.replace until nothing changes. A prefix is valid
+    exactly when that leaves only openers, which become the new stack. Deep
+    nesting or an error falls back to a per-bracket loop over a 256-entry
+    lookup table, which also pinpoints the error offset.
+    """
+
+    # Reduction passes before giving up on the replace() fast path; each pass
+    # peels at least one nesting level.
+    MAX_REDUCE_PASSES = 16
+
+    def __init__(self, pairs: str = "()[]{}") -> None:
+        if len(pairs) % 2 or not pairs.isascii():
+            raise ValueError("pairs must be an even-length ASCII string like '()[]'")
+        openers, closers = pairs[::2].encode(), pairs[1::2].encode()
+        # table[closer] = its opener, table[opener] = 0, table[other] = -1
+        self._table = [-1] * 256
+        for opener, closer in zip(openers, closers):
+            self._table[opener] = 0
+            self._table[closer] = opener
+        self._pairs = [bytes((o, c)) for o, c in zip(openers, closers)]
+        self._drop = bytes(b for b in range(256) if self._table[b] < 0)
+        self._drop_openers = self._drop + openers
+        self._pattern = re.compile("[" + re.escape(pairs) + "]")
+        self._byte_pattern = re.compile(self._pattern.pattern.encode("ascii"))
+        self._stack = bytearray()
+        self._consumed = 0
+        self.error_offset: Optional[int] = None
+
+    @property
+    def depth(self) -> int:
+        """Number of currently unclosed brackets."""
+        return len(self._stack)
+
+    def _brackets(self, chunk: str | bytes) -> bytes:
+        if isinstance(chunk, str):
+            return "".join(self._pattern.findall(chunk)).encode("ascii")
+        return chunk.translate(None, self._drop)
+
+    def _reduce(self, brackets: bytes) -> Optional[bytes]:
+        """Return the new stack if stack + brackets is a valid prefix, None if unsure."""
+        data = bytes(self._stack) + brackets
+        for _ in range(self.MAX_REDUCE_PASSES):
+            size = len(data)
+            for pair in self._pairs:
+                data = data.replace(pair, b"")
+            if len(data) == size:
+                # Fixed point: valid iff no closer is left.
+                return data if not data.translate(None, self._drop_openers) else None
+        return None
+
+    def _locate(self, chunk: str | bytes, index: int) -> int:
+        """Return the offset within chunk of its index-th bracket."""
+        pattern = self._pattern if isinstance(chunk, str) else self._byte_pattern
+        for i, match in enumerate(pattern.finditer(chunk)):
+            if i == index:
+                return match.start()
+        raise AssertionError("bracket index out of range")
+
+    def feed(self, chunk: str | bytes) -> bool:
+        """Consume the next chunk. Return False once an error has been seen."""
+        if self.error_offset is not None:
+            return False
+        brackets = self._brackets(chunk)
+        reduced = self._reduce(brackets)
+        if reduced is not None:
+            self._stack[:] = reduced
+        else:
+            table = self._table
+            stack = self._stack
+            for i, byte in enumerate(brackets):
+                opener = table[byte]
+                if opener == 0:
+                    stack.append(byte)
+                elif not stack or stack.pop() != opener:
+                    self.error_offset = self._consumed + self._locate(chunk, i)
+                    return False
+        self._consumed += len(chunk)
+        return True
+
+    def finish(self) -> bool:
+        """Return True if the whole stream was balanced.
+
+        Unclosed brackets are reported at the end-of-stream offset.
+        """
+        if self.error_offset is None and self._stack:
+            self.error_offset = self._consumed
+        return self.error_offset is None
+
+
+def validate_brackets_stream(
+    source: BinaryIO | TextIO, chunk_size: int = 1 << 20, pairs: str = "()[]{}"
+) -> Optional[int]:
+    """Validate brackets read from a file-like object in chunks.
+
+    Return None if balanced, otherwise the offset of the first error. Works
+    for sockets through socket.makefile("rb").
+    """
+    validator = BracketValidator(pairs)
+    while chunk := source.read(chunk_size):
+        if not validator.feed(chunk):
+            break
+    validator.finish()
+    return validator.error_offset
+
+
 def valid_parentheses(s) -> bool:
     """Return True if s has balanced brackets: (), [], {}. Handle nesting."""
-    starts = "[{("
-    ends = "]})"
-    stack = Stack()
-    for c in s:
-        if c in starts:
-            stack.push(c)
-        elif c in ends:
-            last = stack.pop()
-            if last is None:
-                return False
-            if last in ends:
-                stack.push(last)
-                stack.push(c)
-            elif starts.index(last) != ends.index(c):
-                stack.push(last)
-                stack.push(c)
-    return stack.is_empty()
+    validator = BracketValidator()
+    validator.feed(s)
+    return validator.finish()
+
+
+_BINARY_OPS = {"+": ast.Add, "-": ast.Sub, "*": ast.Mult, "/": ast.Div}
+_UNARY_OPS = {"neg": ast.USub}
+_APPLY = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "neg": operator.neg,
+}
+_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2, "neg": 3}
+_INFIX_TOKEN = re.compile(
+    r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)"
+    r"|([A-Za-z_]\w*)|([-+*/()]))"
+)
+
+
+def _parse_number(token: str) -> Optional[int | float]:
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    try:
+        return float(token)
+    except ValueError:
+        return None
+
+
+class CompiledExpression:
+    """A postfix expression compiled once into a Python function of its variables.
+
+    The stack is simulated at compile time: every operator becomes one
+    assignment to a register named after its stack slot, so evaluating
+    never re-tokenizes or dispatches on operator strings, and the generated
+    code stays flat however long the expression is. Calling it on
+    NumPy/pandas columns evaluates every row in one vectorized pass.
+    """
+
+    def __init__(self, tokens: Iterable[str]) -> None:
+        self.postfix = tuple(tokens)
+        self.variables: tuple[str, ...] = ()
+        stack = Stack()
+        names: list[str] = []
+        steps: list[tuple[int, ast.expr]] = []  # (stack slot, value) per operator
+        registers: list[ast.Name] = []  # renamed once every variable is known
+        for token in self.postfix:
+            if token in _BINARY_OPS:
+                right, left = stack.pop(), stack.pop()
+                if left is None or right is None:
+                    raise ValueError(f"operator {token!r} needs two operands")
+                value = ast.BinOp(left, _BINARY_OPS[token](), right)
+            elif token in _UNARY_OPS:
+                operand = stack.pop()
+                if operand is None:
+                    raise ValueError(f"operator {token!r} needs an operand")
+                value = ast.UnaryOp(_UNARY_OPS[token](), operand)
+            elif token.isidentifier():
+                if token not in names:
+                    names.append(token)
+                stack.push(ast.Name(token, ast.Load()))
+                continue
+            elif (number := _parse_number(token)) is not None:
+                stack.push(ast.Constant(number))
+                continue
+            else:
+                raise ValueError(f"invalid token {token!r}")
+            slot = len(stack)
+            steps.append((slot, value))
+            register = ast.Name(str(slot), ast.Load())
+            registers.append(register)
+            stack.push(register)
+        body = stack.pop()
+        if body is None or not stack.is_empty():
+            raise ValueError("expression must leave exactly one value")
+        self.variables = tuple(names)
+        prefix = "_r"
+        while any(name.startswith(prefix) for name in names):
+            prefix += "_"
+        for register in registers:
+            register.id = prefix + register.id
+        statements: list[ast.stmt] = [
+            ast.Assign([ast.Name(f"{prefix}{slot}", ast.Store())], value)
+            for slot, value in steps
+        ]
+        statements.append(ast.Return(body))
+        function = ast.FunctionDef(
+            name="_postfix",
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(name) for name in names],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=statements,
+            decorator_list=[],
+            type_params=[],
+        )
+        tree = ast.fix_missing_locations(ast.Module([function], type_ignores=[]))
+        namespace: dict = {"__builtins__": {}}
+        exec(compile(tree, "<postfix>", "exec"), namespace)
+        self._fn = namespace["_postfix"]
+
+    def __repr__(self) -> str:
+        return "<CompiledExpression `{}`>".format(" ".join(self.postfix))
+
+    def __call__(self, **bindings):
+        """Evaluate with one value (or one NumPy column) per variable."""
+        missing = [name for name in self.variables if name not in bindings]
+        if missing:
+            raise ValueError(f"unbound variables: {', '.join(missing)}")
+        return self._fn(*(bindings[name] for name in self.variables))
+
+    def evaluate_batch(self, columns):
+        """Evaluate over columns of bindings, e.g. {"x": xs, "y": ys}.
+
+        Array-like columns (anything implementing __array_ufunc__, such as
+        NumPy arrays or pandas Series) are evaluated in one vectorized call;
+        plain sequences fall back to a row-by-row loop and give a list.
+        """
+        missing = [name for name in self.variables if name not in columns]
+        if missing:
+            raise ValueError(f"unbound variables: {', '.join(missing)}")
+        cols = [columns[name] for name in self.variables]
+        if cols and all(hasattr(col, "__array_ufunc__") for col in cols):
+            return self._fn(*cols)
+        if not cols:
+            return self._fn()
+        fn = self._fn
+        return [fn(*row) for row in zip(*cols)]
+
+
+def compile_postfix(tokens: Iterable[str]) -> CompiledExpression:
+    """Compile postfix tokens (numbers, variable names, + - * / and unary `neg`)."""
+    return CompiledExpression(tokens)
+
+
+def infix_to_postfix(expression: str) -> list[str]:
+    """Convert an infix expression to postfix tokens with the shunting-yard algorithm.
+
+    Supports + - * /, parentheses, unary minus (emitted as `neg`), numbers and
+    variable names. Operators are left-associative except unary minus.
+    """
+    output: list[str] = []
+    ops = Stack()
+    expect_operand = True
+    pos = 0
+    expression = expression.rstrip()
+    while pos < len(expression):
+        match = _INFIX_TOKEN.match(expression, pos)
+        if match is None:
+            raise ValueError(f"unexpected character at {pos}: {expression[pos]!r}")
+        pos = match.end()
+        number, name, op = match.groups()
+        if number or name:
+            if not expect_operand:
+                raise ValueError(f"missing operator before {number or name!r}")
+            output.append(number or name)
+            expect_operand = False
+        elif op == "(":
+            if not expect_operand:
+                raise ValueError("missing operator before '('")
+            ops.push(op)
+        elif op == ")":
+            while ops.peek() not in (None, "("):
+                output.append(ops.pop())
+            if ops.pop() is None:
+                raise ValueError("unbalanced ')'")
+            expect_operand = False
+        elif expect_operand:
+            if op == "-":
+                ops.push("neg")
+            elif op != "+":
+                raise ValueError(f"operator {op!r} is missing its left operand")
+        else:
+            while ops.peek() not in (None, "(") and (
+                _PRECEDENCE[ops.peek()] >= _PRECEDENCE[op]
+            ):
+                output.append(ops.pop())
+            ops.push(op)
+            expect_operand = True
+    if expect_operand:
+        raise ValueError("expression ends with an operator")
+    while not ops.is_empty():
+        op = ops.pop()
+        if op == "(":
+            raise ValueError("unbalanced '('")
+        output.append(op)
+    return output
+
+
+def compile_infix(expression: str) -> CompiledExpression:
+    """Compile an infix expression such as "(price - cost) * -qty / 2"."""
+    return CompiledExpression(infix_to_postfix(expression))
 
 
 def evaluate_postfix(tokens: Iterable[str]) -> Optional[int | float]:
     """Evaluate a postfix (reverse Polish) expression. Tokens are numbers or operators (+, , *, /).
 
     Example: 3 4 + 2 * 4 /
+
+    Accepts the same literals and operators as compile_postfix but no
+    variables, and runs the stack directly: compiling only pays off when
+    the expression is evaluated more than once.
     """
-    stack = Stack()
+    values = Stack()
     for token in tokens:
-        if token.isnumeric():
-            stack.push(int(token))
+        if token in _BINARY_OPS:
+            right, left = values.pop(), values.pop()
+            if left is None or right is None:
+                raise ValueError(f"operator {token!r} needs two operands")
+            values.push(_APPLY[token](left, right))
+        elif token in _UNARY_OPS:
+            operand = values.pop()
+            if operand is None:
+                raise ValueError(f"operator {token!r} needs an operand")
+            values.push(_APPLY[token](operand))
+        elif token.isidentifier():
+            raise ValueError(f"unbound variable {token!r}; use compile_postfix")
+        elif (number := _parse_number(token)) is not None:
+            values.push(number)
         else:
-            b = stack.pop()
-            a = stack.pop()
-            if a is None or b is None:
-                raise ValueError
-            if token == "+":
-                stack.push(a + b)
-            elif token == "-":
-                stack.push(a - b)
-            elif token == "/":
-                stack.push(a / b)
-            elif token == "*":
-                stack.push(a * b)
-            else:
-                raise ValueError
-    return stack.pop()
+            raise ValueError(f"invalid token {token!r}")
+    result = values.pop()
+    if result is None or not values.is_empty():
+        raise ValueError("expression must leave exactly one value")
+    return result
 
 
 class MinStack:
@@ -89,23 +411,21 @@ class MinStack:
 
     def __init__(self):
         self._stack = []
+        # Only values that were a new minimum (or tied it) when pushed, so
+        # pushes that don't change the minimum cost no extra memory.
         self._min = []
 
     def push(self, value):
         """Add value to the stack."""
-        if len(self._min) == 0:
+        if len(self._min) == 0 or not self._min[-1] < value:
             self._min.append(value)
-        else:
-            if value < self._min[-1]:
-                self._min.append(value)
-            else:
-                self._min.append(self._min[-1])
         self._stack.append(value)
 
     def pop(self):
         """Remove and return the top value."""
         value = self._stack.pop()
-        _ = self._min.pop()
+        if not self._min[-1] < value:
+            self._min.pop()
         return value
 
     def peek(self):
@@ -117,3 +437,142 @@ class MinStack:
     def get_min(self):
         """Return the minimum value in the stack in O(1) time."""
         return self._min[-1]
+
+
+class TypedStack:
+    """Stack of machine numbers stored unboxed in an array.array.
+
+    typecode is any array typecode ("q" for 64-bit ints, "d" for doubles...).
+    Values use itemsize bytes each instead of a pointer plus a boxed object.
+    """
+
+    def __init__(self, typecode: str = "q", values: Iterable = ()) -> None:
+        self._data = array(typecode)
+        self.push_many(values)
+
+    @property
+    def typecode(self) -> str:
+        return self._data.typecode
+
+    def push(self, value) -> None:
+        """Add value to the top of the stack."""
+        self._data.append(value)
+
+    def push_many(self, values: Iterable) -> None:
+        """Push every value in order with a single array extend."""
+        self._data.extend(values)
+
+    def pop(self):
+        """Remove and return the top value. Return None if empty."""
+        if not self._data:
+            return None
+        return self._data.pop()
+
+    def pop_n(self, n: int) -> array:
+        """Remove up to n values and return them top first, as an array."""
+        if n <= 0:
+            return array(self.typecode)
+        popped = self._data[-n:]
+        self._truncate(max(len(self._data) - n, 0))
+        popped.reverse()
+        return popped
+
+    def _truncate(self, size: int) -> None:
+        del self._data[size:]
+
+    def peek(self):
+        """Return the top value without removing it. Return None if empty."""
+        if not self._data:
+            return None
+        return self._data[-1]
+
+    def is_empty(self) -> bool:
+        """Return True if stack has no elements."""
+        return len(self._data) == 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return "<{}@{} = `{}`>".format(
+            type(self).__name__, id(self), self._data.tolist()
+        )
+
+
+class _ExtremumStack(TypedStack, ABC):
+    """TypedStack that tracks its minimum or maximum.
+
+    Only the positions where the extreme changed are recorded, in a second
+    array, so pop_n can drop all stale records with one bisect.
+    """
+
+    def __init__(self, typecode: str = "q", values: Iterable = ()) -> None:
+        self._marks = array("q")
+        super().__init__(typecode, values)
+
+    @abstractmethod
+    def _improves(self, value, current) -> bool: ...
+
+    def push(self, value) -> None:
+        """Add value to the top of the stack."""
+        data = self._data
+        data.append(value)  # may raise; only mark values that were stored
+        marks = self._marks
+        if not marks or self._improves(data[-1], data[marks[-1]]):
+            marks.append(len(data) - 1)
+
+    def push_many(self, values: Iterable) -> None:
+        """Push every value in order, recording only new extremes.
+
+        The values are converted up front, so a bad one pushes nothing.
+        """
+        data = self._data
+        start = len(data)
+        data.extend(array(data.typecode, values))
+        marks = self._marks
+        best = data[marks[-1]] if marks else None
+        improves = self._improves
+        for i in range(start, len(data)):
+            value = data[i]
+            if best is None or improves(value, best):
+                marks.append(i)
+                best = value
+
+    def pop(self):
+        """Remove and return the top value. Return None if empty."""
+        if not self._data:
+            return None
+        if self._marks[-1] == len(self._data) - 1:
+            self._marks.pop()
+        return self._data.pop()
+
+    def _truncate(self, size: int) -> None:
+        del self._data[size:]
+        del self._marks[bisect_left(self._marks, size) :]
+
+    def _extreme(self):
+        if not self._marks:
+            return None
+        return self._data[self._marks[-1]]
+
+
+class TypedMinStack(_ExtremumStack):
+    """TypedStack with an O(1) get_min; records only changes of minimum."""
+
+    def _improves(self, value, current) -> bool:
+        return value < current
+
+    def get_min(self):
+        """Return the minimum value in O(1) time. Return None if empty."""
+        return self._extreme()
+
+
+class TypedMaxStack(_ExtremumStack):
+    """TypedStack with an O(1) get_max; records only changes of maximum."""
+
+    def _improves(self, value, current) -> bool:
+        return value > current
+
+    def get_max(self):
+        """Return the maximum value in O(1) time. Return None if empty."""
+        return self._extreme()
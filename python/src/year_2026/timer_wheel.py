@@ -0,0 +1,231 @@
+"""Hashed hierarchical timer wheel and a DelayQueue built on it.
+
+The wheel has `levels` rings of 2**bits slots. A timer due `d` ticks from
+now goes to the lowest level whose span (2**(bits * (level + 1)) ticks)
+covers d, in the slot picked by the deadline's bits for that level. Each
+time level 0 wraps, the due slot of the next level is cascaded: its timers
+are re-filed relative to the new time and so move down a level. Schedule
+and cancel are O(1); every timer is re-filed at most `levels` times, so a
+tick is amortized O(1). Timers beyond the top level's span wait in an
+overflow bucket that is re-examined each time the top level wraps.
+"""
+
+from __future__ import annotations
+import math
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .queue_ds import Queue
+
+
+class Timer:
+    """Handle for a scheduled item; pass it to cancel()."""
+
+    __slots__ = ("deadline", "item", "_slot", "_level")
+
+    def __init__(self, deadline: int, item: Any) -> None:
+        self.deadline = deadline
+        self.item = item
+        self._slot: Optional[Dict[Timer, None]] = None
+        self._level = 0
+
+    @property
+    def active(self) -> bool:
+        """True until the timer fires or is cancelled."""
+        return self._slot is not None
+
+    def __repr__(self) -> str:
+        return f"Timer(deadline={self.deadline}, item={self.item!r})"
+
+
+class TimerWheel:
+    """Timers on an integer tick clock that starts at 0.
+
+    Timers fire on the first advance that reaches their deadline; timers
+    due on the same tick come out in no particular order.
+    """
+
+    def __init__(self, bits: int = 8, levels: int = 4) -> None:
+        if bits < 1 or levels < 1:
+            raise ValueError("bits and levels must be at least 1")
+        self.bits = bits
+        self.levels = levels
+        self.now = 0
+        self._mask = (1 << bits) - 1
+        self._slots: List[List[Dict[Timer, None]]] = [
+            [{} for _ in range(1 << bits)] for _ in range(levels)
+        ]
+        self._counts = [0] * (levels + 1)  # the last entry counts the overflow
+        self._overflow: Dict[Timer, None] = {}
+
+    def __len__(self) -> int:
+        return sum(self._counts)
+
+    def _file(self, timer: Timer) -> None:
+        diff = timer.deadline - self.now
+        level = (max(diff, 1).bit_length() - 1) // self.bits
+        if level >= self.levels:
+            slot = self._overflow
+            level = self.levels
+        else:
+            slot = self._slots[level][
+                (timer.deadline >> (self.bits * level)) & self._mask
+            ]
+        slot[timer] = None
+        timer._slot = slot
+        timer._level = level
+        self._counts[level] += 1
+
+    def schedule(self, item: Any, delay: int) -> Timer:
+        """Fire item `delay` ticks from now (at the next tick if delay < 1)."""
+        return self.schedule_at(item, self.now + delay)
+
+    def schedule_at(self, item: Any, deadline: int) -> Timer:
+        """Fire item at tick `deadline`; past deadlines fire on the next tick."""
+        timer = Timer(max(deadline, self.now + 1), item)
+        self._file(timer)
+        return timer
+
+    def cancel(self, timer: Timer) -> bool:
+        """Stop timer from firing. Return False if it already fired or was cancelled."""
+        if timer._slot is None:
+            return False
+        del timer._slot[timer]
+        timer._slot = None
+        self._counts[timer._level] -= 1
+        return True
+
+    def _cascade(self, level: int, index: int) -> None:
+        slot = self._slots[level][index]
+        self._slots[level][index] = {}
+        self._counts[level] -= len(slot)
+        for timer in slot:
+            self._file(timer)
+
+    def _tick(self, tick: int) -> List[Any]:
+        self.now = tick
+        if tick & self._mask == 0:
+            for level in range(1, self.levels):
+                index = (tick >> (self.bits * level)) & self._mask
+                self._cascade(level, index)
+                if index:
+                    break
+            else:
+                overflow, self._overflow = self._overflow, {}
+                self._counts[self.levels] = 0
+                for timer in overflow:
+                    self._file(timer)
+        index = tick & self._mask
+        slot = self._slots[0][index]
+        if not slot:
+            return []
+        self._slots[0][index] = {}
+        self._counts[0] -= len(slot)
+        for timer in slot:
+            timer._slot = None
+        return [timer.item for timer in slot]
+
+    def advance_to(self, tick: int) -> List[Any]:
+        """Move the clock to `tick` and return the items that fell due, in tick order.
+
+        Runs of ticks with nothing to fire or cascade are skipped in one step.
+        """
+        expired: List[Any] = []
+        while self.now < tick:
+            empty = 0
+            while empty < self.levels and not self._counts[empty]:
+                empty += 1
+            if empty == self.levels and not self._counts[self.levels]:
+                self.now = tick
+                break
+            # Levels below `empty` hold nothing, so jump to their next wrap.
+            shift = self.bits * empty
+            step = ((self.now >> shift) + 1) << shift if empty else self.now + 1
+            expired.extend(self._tick(min(step, tick)))
+        return expired
+
+    def advance(self, ticks: int = 1) -> List[Any]:
+        """Move the clock forward by `ticks` and return the items that fell due."""
+        return self.advance_to(self.now + ticks)
+
+
+class DelayQueue:
+    """Queue whose items become available only after their delay has passed.
+
+    Mirrors the Queue API; enqueue takes a delay in seconds and dequeue
+    returns None until some item is due. Deadlines are rounded up to whole
+    ticks of `resolution` seconds, so an item is never released early.
+    """
+
+    def __init__(
+        self,
+        resolution: float = 0.001,
+        clock: Callable[[], float] = time.monotonic,
+        bits: int = 8,
+        levels: int = 4,
+    ) -> None:
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        self.resolution = resolution
+        self._clock = clock
+        self._origin = clock()
+        self._wheel = TimerWheel(bits, levels)
+        self._ready: Queue[Any] = Queue()
+
+    def __repr__(self) -> str:
+        return f"<DelayQueue@{id(self)} : {len(self._ready)} ready, {len(self._wheel)} waiting>"
+
+    def __len__(self) -> int:
+        """Number of items not yet dequeued, due or not."""
+        return len(self._ready) + len(self._wheel)
+
+    def _poll(self) -> float:
+        """Release every item that is due; return the elapsed time in seconds."""
+        elapsed = self._clock() - self._origin
+        now = int(elapsed / self.resolution)
+        if now > self._wheel.now:
+            self._ready.enqueue_many(self._wheel.advance_to(now))
+        return elapsed
+
+    def enqueue(self, value: Any, delay: float = 0.0) -> Optional[Timer]:
+        """Add value, to become available after `delay` seconds.
+
+        Returns a Timer for cancel(), or None if the value is already due.
+        """
+        deadline = math.ceil((self._poll() + delay) / self.resolution)
+        if deadline <= self._wheel.now:
+            self._ready.enqueue(value)
+            return None
+        return self._wheel.schedule_at(value, deadline)
+
+    def enqueue_many(self, values: Iterable[Any], delay: float = 0.0) -> None:
+        """Add every value with the same delay."""
+        deadline = math.ceil((self._poll() + delay) / self.resolution)
+        if deadline <= self._wheel.now:
+            self._ready.enqueue_many(values)
+            return
+        for value in values:
+            self._wheel.schedule_at(value, deadline)
+
+    def cancel(self, timer: Timer) -> bool:
+        """Withdraw a pending value. Return False if it is already due."""
+        return self._wheel.cancel(timer)
+
+    def dequeue(self) -> Optional[Any]:
+        """Remove and return the next due value. Return None if none is due."""
+        self._poll()
+        return self._ready.dequeue()
+
+    def dequeue_many(self, n: int) -> List[Any]:
+        """Remove and return up to n due values."""
+        self._poll()
+        return self._ready.dequeue_many(n)
+
+    def peek(self) -> Optional[Any]:
+        """Return the next due value without removing it. Return None if none is due."""
+        self._poll()
+        return self._ready.peek()
+
+    def is_empty(self) -> bool:
+        """Return True if nothing is queued, due or pending."""
+        return len(self) == 0
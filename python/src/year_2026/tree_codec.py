@@ -0,0 +1,301 @@
+"""Compact binary tree format with streaming encode/decode and mmap loading.
+
+Layout (little-endian throughout, every section 8-byte aligned):
+
+    header   magic b"BTREE001", typecode, 7 pad bytes, node count n (u64)
+    shape    2 bits per node in level order, packed into u64 words:
+             bit 2i is set if node i has a left child, bit 2i+1 a right one
+    ranks    one u64 per shape word: set bits in all earlier words
+    values   n packed values of the typecode, in level order
+
+In level order the children are numbered in the order of their set shape
+bits, so the child at bit p is node 1 + (set bits before p). The ranks
+make that an O(1) lookup, which lets MappedTree walk a file-backed tree
+without reading it all. The shape and the ranks cost 2 bits per node
+each, so values dominate the size. Big-endian hosts byteswap on write and
+on load, so files move freely between machines.
+"""
+
+from __future__ import annotations
+import io
+import mmap
+import struct
+import sys
+import weakref
+from array import array
+from collections import deque
+from typing import BinaryIO, Callable, Iterator, Optional, Tuple
+
+from .trees import TreeNode
+
+MAGIC = b"BTREE001"
+_HEADER = struct.Struct("<8sc7xQ")
+DEFAULT_CHUNK = 1 << 16
+_NATIVE_LE = sys.byteorder == "little"
+
+
+def _le_bytes(values: array) -> bytes:
+    """Return the array's items as little-endian bytes."""
+    if not _NATIVE_LE:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le(values: array, data: bytes) -> None:
+    """Append the little-endian items in data to values."""
+    start = len(values)
+    values.frombytes(data)
+    if not _NATIVE_LE:
+        tail = values[start:]
+        tail.byteswap()
+        values[start:] = tail
+
+
+def _level_order_nodes(root: Optional[TreeNode]) -> Iterator[TreeNode]:
+    pending = deque([root] if root is not None else [])
+    while pending:
+        node = pending.popleft()
+        yield node
+        if node.left is not None:
+            pending.append(node.left)
+        if node.right is not None:
+            pending.append(node.right)
+
+
+def _shape(root: Optional[TreeNode]) -> Tuple[int, array]:
+    """Return the node count and the packed shape words."""
+    words = array("Q")
+    word = shift = count = 0
+    for node in _level_order_nodes(root):
+        count += 1
+        if node.left is not None:
+            word |= 1 << shift
+        if node.right is not None:
+            word |= 2 << shift
+        shift += 2
+        if shift == 64:
+            words.append(word)
+            word = shift = 0
+    if shift:
+        words.append(word)
+    return count, words
+
+
+def _ranks(words: array) -> array:
+    ranks = array("Q", bytes(8 * len(words)))
+    total = 0
+    for i, word in enumerate(words):
+        ranks[i] = total
+        total += word.bit_count()
+    return ranks
+
+
+def _padding(size: int) -> bytes:
+    return bytes(-size % 8)
+
+
+def iter_encode_tree(
+    root: Optional[TreeNode], typecode: str = "q", chunk_nodes: int = DEFAULT_CHUNK
+) -> Iterator[bytes]:
+    """Yield the binary encoding of the tree in pieces.
+
+    Walks the tree twice, once for the shape and once for the values; the
+    values are emitted chunk_nodes at a time, so only the shape (3 bits
+    per node) is held in memory. The tree must not change in between.
+    """
+    count, words = _shape(root)
+    yield _HEADER.pack(MAGIC, typecode.encode(), count)
+    yield _le_bytes(words)
+    yield _le_bytes(_ranks(words))
+    chunk = array(typecode)
+    written = 0
+    for node in _level_order_nodes(root):
+        chunk.append(node.value)
+        if len(chunk) == chunk_nodes:
+            yield _le_bytes(chunk)
+            written += len(chunk) * chunk.itemsize
+            chunk = array(typecode)
+    if chunk:
+        yield _le_bytes(chunk)
+        written += len(chunk) * chunk.itemsize
+    yield _padding(written)
+
+
+def encode_tree(root: Optional[TreeNode], typecode: str = "q") -> bytes:
+    """Return the whole binary encoding of the tree."""
+    return b"".join(iter_encode_tree(root, typecode))
+
+
+def write_tree(root: Optional[TreeNode], stream: BinaryIO, typecode: str = "q") -> None:
+    """Stream the binary encoding of the tree into a binary file object."""
+    for piece in iter_encode_tree(root, typecode):
+        stream.write(piece)
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("truncated tree data")
+    return data
+
+
+def _read_header(data: bytes) -> Tuple[str, int]:
+    magic, typecode, count = _HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError("not a binary tree encoding")
+    return typecode.decode(), count
+
+
+def read_tree(
+    stream: BinaryIO,
+    node_type: Callable[..., TreeNode] = TreeNode,
+    chunk_nodes: int = DEFAULT_CHUNK,
+) -> Optional[TreeNode]:
+    """Rebuild a tree from a binary file object, reading values in chunks.
+
+    Nodes are linked in level order through a queue of open child slots,
+    so decoding never recurses. node_type may be any class taking
+    (value) with left/right attributes, e.g. SlotTreeNode.
+    """
+    typecode, count = _read_header(_read_exact(stream, _HEADER.size))
+    if count == 0:
+        return None
+    n_words = (2 * count + 63) // 64
+    words = array("Q")
+    _from_le(words, _read_exact(stream, 8 * n_words))
+    _read_exact(stream, 8 * n_words)  # ranks are only needed for random access
+    root = None
+    open_slots: deque = deque()
+    index = 0
+    while index < count:
+        chunk = array(typecode)
+        take = min(chunk_nodes, count - index)
+        _from_le(chunk, _read_exact(stream, take * chunk.itemsize))
+        for value in chunk:
+            node = node_type(value)
+            if root is None:
+                root = node
+            else:
+                parent, is_right = open_slots.popleft()
+                if is_right:
+                    parent.right = node
+                else:
+                    parent.left = node
+            bits = words[index >> 5] >> (2 * (index & 31))
+            if bits & 1:
+                open_slots.append((node, False))
+            if bits & 2:
+                open_slots.append((node, True))
+            index += 1
+    return root
+
+
+def decode_tree(
+    data: bytes, node_type: Callable[..., TreeNode] = TreeNode
+) -> Optional[TreeNode]:
+    """Rebuild a tree from the bytes produced by encode_tree."""
+    return read_tree(io.BytesIO(data), node_type)
+
+
+class MappedNode:
+    """Read-only node view into a MappedTree; children are resolved on access."""
+
+    __slots__ = ("_tree", "_index", "__weakref__")
+
+    def __init__(self, tree: MappedTree, index: int) -> None:
+        self._tree = tree
+        self._index = index
+
+    @property
+    def value(self):
+        return self._tree.values[self._index]
+
+    @property
+    def left(self) -> Optional[MappedNode]:
+        return self._tree._child(2 * self._index)
+
+    @property
+    def right(self) -> Optional[MappedNode]:
+        return self._tree._child(2 * self._index + 1)
+
+    def __repr__(self) -> str:
+        return f"MappedNode({self._index}, value={self.value!r})"
+
+
+class MappedTree:
+    """A binary-encoded tree file opened lazily through mmap.
+
+    Opening maps the file and reads only the header; nodes are paged in as
+    they are visited. root is a MappedNode, which the read-only functions
+    in trees (traversals, tree_size, tree_height, bst_search, ...) accept
+    like a TreeNode. Node objects are cached weakly: a node keeps its
+    identity for as long as anything references it (which the traversals
+    rely on), and nodes nobody holds are dropped, so memory follows what
+    the caller keeps rather than how much of the tree was visited. On
+    big-endian hosts the arrays are copied and byteswapped on open.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        typecode, count = _read_header(view[: _HEADER.size].tobytes())
+        n_words = (2 * count + 63) // 64
+        start = _HEADER.size
+        self._count = count
+        self._words = self._section(view, start, 8 * n_words, "Q")
+        start += 8 * n_words
+        self._ranks = self._section(view, start, 8 * n_words, "Q")
+        start += 8 * n_words
+        itemsize = array(typecode).itemsize
+        self.values = self._section(view, start, count * itemsize, typecode)
+        self._view = view
+        self._nodes: weakref.WeakValueDictionary[int, MappedNode] = (
+            weakref.WeakValueDictionary()
+        )
+
+    @staticmethod
+    def _section(view: memoryview, start: int, size: int, typecode: str):
+        data = view[start : start + size]
+        if _NATIVE_LE:
+            return data.cast(typecode)
+        values = array(typecode)
+        _from_le(values, data.tobytes())
+        data.release()
+        return values
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def root(self) -> Optional[MappedNode]:
+        return self._node(0) if self._count else None
+
+    def _node(self, index: int) -> MappedNode:
+        node = self._nodes.get(index)
+        if node is None:
+            node = self._nodes[index] = MappedNode(self, index)
+        return node
+
+    def _child(self, bit: int) -> Optional[MappedNode]:
+        word = self._words[bit >> 6]
+        offset = bit & 63
+        if not (word >> offset) & 1:
+            return None
+        before = self._ranks[bit >> 6] + (word & ((1 << offset) - 1)).bit_count()
+        return self._node(1 + before)
+
+    def close(self) -> None:
+        """Unmap the file; nodes from this tree must not be used afterwards."""
+        self._nodes.clear()
+        for view in (self.values, self._words, self._ranks, self._view):
+            if isinstance(view, memoryview):
+                view.release()
+        self._map.close()
+
+    def __enter__(self) -> MappedTree:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,5 +1,9 @@
 from __future__ import annotations
-from typing import Generic, List, Optional, TypeVar
+import json
+from array import array
+from collections import deque
+from itertools import islice
+from typing import Generic, Iterable, Iterator, List, Optional, TypeVar, Union
 
 
 T = TypeVar("T")
@@ -18,59 +22,418 @@ class TreeNode(Generic[T]):
         self.left = left
         self.right = right
 
+    # Per-subtree caches, None when stale: the tree_aggregates(cache=True)
+    # summary and the (hash, mirror hash) pair from tree_hash.
+    _summary = None
+    _hash = None
+
+
+class SlotTreeNode(Generic[T]):
+    """TreeNode without a per-instance __dict__; works with every function here.
+
+    About 88 bytes per node against about 128 for a TreeNode on 64-bit
+    CPython (roughly 30% less), at the cost of not accepting extra
+    attributes.
+    """
+
+    __slots__ = ("value", "left", "right")
+
+    def __init__(
+        self,
+        value,
+        left: Optional[SlotTreeNode[T]] = None,
+        right: Optional[SlotTreeNode[T]] = None,
+    ):
+        self.value = value
+        self.left = left
+        self.right = right
+
+
+NIL = -1
+
+
+class ArrayTree(Generic[T]):
+    """Binary tree stored as parallel arrays indexed by node number.
+
+    Node i holds values[i] with children left[i] and right[i] (NIL for
+    none). Child links are packed machine integers and, with a typecode,
+    so are the values, so a node costs 16 bytes plus its value instead of
+    a Python object. The traversal generators, tree_size/tree_height, the
+    aggregates (tree_aggregates, tree_min, ...) and bst_insert/bst_search/
+    bst_delete accept an ArrayTree wherever they accept a root node; the
+    other BST functions do not.
+    """
+
+    def __init__(self, typecode: Optional[str] = None) -> None:
+        self.values: Union[List[T], array] = array(typecode) if typecode else []
+        self.left = array("q")
+        self.right = array("q")
+        self.root = NIL
+
+    def __len__(self) -> int:
+        return len(self.left)
+
+    def add(self, value: T, left: int = NIL, right: int = NIL) -> int:
+        """Append a node and return its index; it becomes the root if the tree was empty."""
+        self.values.append(value)
+        self.left.append(left)
+        self.right.append(right)
+        index = len(self.left) - 1
+        if self.root == NIL:
+            self.root = index
+        return index
+
+    @classmethod
+    def from_sorted(
+        cls,
+        values: Iterable[T],
+        typecode: Optional[str] = None,
+        length: Optional[int] = None,
+    ) -> ArrayTree[T]:
+        """Bulk-load a height-balanced BST from strictly increasing values in O(n).
+
+        Node i holds the i-th value, so values are copied straight into the
+        value array and only the child links are computed. length works as
+        in bst_from_sorted.
+        """
+        tree: ArrayTree[T] = cls(typecode)
+        tree.values.extend(_take_sorted(values, length))
+        n = len(tree.values)
+        tree.left = array("q", [NIL]) * n
+        tree.right = array("q", [NIL]) * n
+        for mid, left, right, _ in _balanced_links(n):
+            tree.left[mid] = left
+            tree.right[mid] = right
+        tree.root = (n - 1) // 2 if n else NIL
+        return tree
+
+    @classmethod
+    def from_nodes(
+        cls, root: Optional[TreeNode[T]], typecode: Optional[str] = None
+    ) -> ArrayTree[T]:
+        """Copy a linked tree, numbering nodes in preorder."""
+        tree: ArrayTree[T] = cls(typecode)
+        if root is None:
+            return tree
+        stack = [(root, NIL, False)]
+        while stack:
+            node, parent, is_right = stack.pop()
+            index = tree.add(node.value)
+            if parent != NIL:
+                (tree.right if is_right else tree.left)[parent] = index
+            if node.right is not None:
+                stack.append((node.right, index, True))
+            if node.left is not None:
+                stack.append((node.left, index, False))
+        return tree
+
+    def to_nodes(self) -> Optional[TreeNode[T]]:
+        """Rebuild the tree as linked TreeNodes."""
+        if self.root == NIL:
+            return None
+        nodes = [TreeNode(value) for value in self.values]
+        for i, node in enumerate(nodes):
+            if self.left[i] != NIL:
+                node.left = nodes[self.left[i]]
+            if self.right[i] != NIL:
+                node.right = nodes[self.right[i]]
+        return nodes[self.root]
+
+    def iter_preorder(self) -> Iterator[T]:
+        values, left, right = self.values, self.left, self.right
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            i = stack.pop()
+            yield values[i]
+            if right[i] != NIL:
+                stack.append(right[i])
+            if left[i] != NIL:
+                stack.append(left[i])
+
+    def iter_inorder(self) -> Iterator[T]:
+        values, left, right = self.values, self.left, self.right
+        stack: List[int] = []
+        i = self.root
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            yield values[i]
+            i = right[i]
+
+    def iter_postorder(self) -> Iterator[T]:
+        values = self.values
+        return (values[i] for i in self._postorder())
+
+    def _postorder(self) -> Iterator[int]:
+        """Yield node indices in postorder."""
+        left, right = self.left, self.right
+        stack: List[int] = []
+        i, last = self.root, NIL
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+            top = stack[-1]
+            if right[top] != NIL and right[top] != last:
+                i = right[top]
+            else:
+                last = stack.pop()
+                yield last
+
+    def iter_level_order(self) -> Iterator[T]:
+        values, left, right = self.values, self.left, self.right
+        pending = deque([self.root] if self.root != NIL else [])
+        while pending:
+            i = pending.popleft()
+            yield values[i]
+            if left[i] != NIL:
+                pending.append(left[i])
+            if right[i] != NIL:
+                pending.append(right[i])
+
+    def height(self) -> int:
+        """Number of levels; 0 for an empty tree."""
+        left, right = self.left, self.right
+        level = [self.root] if self.root != NIL else []
+        height = 0
+        while level:
+            height += 1
+            level = [c for i in level for c in (left[i], right[i]) if c != NIL]
+        return height
+
+    def search(self, value: T) -> int:
+        """Return the index of value in this BST, NIL if absent."""
+        values, left, right = self.values, self.left, self.right
+        i = self.root
+        while i != NIL:
+            current = values[i]
+            if value == current:
+                return i
+            i = left[i] if value < current else right[i]
+        return NIL
+
+    def insert(self, value: T) -> int:
+        """Insert value into this BST (left < node < right) and return its index.
+
+        A value already present is not duplicated; its index is returned.
+        """
+        values, left, right = self.values, self.left, self.right
+        i = self.root
+        if i == NIL:
+            return self.add(value)
+        while True:
+            current = values[i]
+            if value == current:
+                return i
+            links = left if value < current else right
+            if links[i] == NIL:
+                links[i] = self.add(value)
+                return links[i]
+            i = links[i]
+
+    def delete(self, value: T) -> bool:
+        """Remove value from this BST; return False if it was absent.
+
+        A node with two children takes its inorder successor's value and
+        the successor is unlinked instead. The freed slot is refilled with
+        the last node, so len() stays the node count and only that node's
+        index changes.
+        """
+        values, left, right = self.values, self.left, self.right
+        parent, i = NIL, self.root
+        while i != NIL and values[i] != value:
+            parent = i
+            i = left[i] if value < values[i] else right[i]
+        if i == NIL:
+            return False
+        if left[i] != NIL and right[i] != NIL:
+            parent, successor = i, right[i]
+            while left[successor] != NIL:
+                parent, successor = successor, left[successor]
+            values[i] = values[successor]
+            i = successor
+        self._relink(parent, i, left[i] if left[i] != NIL else right[i])
+        self._remove_slot(i)
+        return True
+
+    def _relink(self, parent: int, old: int, new: int) -> None:
+        """Point parent's link to old (the root if parent is NIL) at new."""
+        if parent == NIL:
+            self.root = new
+        elif self.left[parent] == old:
+            self.left[parent] = new
+        else:
+            self.right[parent] = new
+
+    def _remove_slot(self, i: int) -> None:
+        """Drop unlinked node i by moving the last node into its slot."""
+        values, left, right = self.values, self.left, self.right
+        last = len(left) - 1
+        if i != last:
+            value = values[last]
+            parent, j = NIL, self.root
+            while j != last:
+                parent = j
+                j = left[j] if value < values[j] else right[j]
+            values[i], left[i], right[i] = value, left[last], right[last]
+            self._relink(parent, last, i)
+        values.pop()
+        left.pop()
+        right.pop()
+
+
+def iter_preorder(root: Union[TreeNode[T], ArrayTree[T], None]) -> Iterator[T]:
+    """Yield values in preorder (root, left, right) using an explicit stack."""
+    if isinstance(root, ArrayTree):
+        return root.iter_preorder()
+    return _iter_preorder_nodes(root)
+
+
+def _iter_preorder_nodes(root: Optional[TreeNode[T]]) -> Iterator[T]:
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        yield node.value
+        if node.right is not None:
+            stack.append(node.right)
+        if node.left is not None:
+            stack.append(node.left)
+
+
+def iter_inorder(root: Union[TreeNode[T], ArrayTree[T], None]) -> Iterator[T]:
+    """Yield values in inorder (left, root, right) using an explicit stack."""
+    if isinstance(root, ArrayTree):
+        return root.iter_inorder()
+    return _iter_inorder_nodes(root)
+
+
+def _iter_inorder_nodes(root: Optional[TreeNode[T]]) -> Iterator[T]:
+    stack: List[TreeNode[T]] = []
+    node = root
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.value
+        node = node.right
+
+
+def iter_postorder(root: Union[TreeNode[T], ArrayTree[T], None]) -> Iterator[T]:
+    """Yield values in postorder (left, right, root) using an explicit stack."""
+    if isinstance(root, ArrayTree):
+        return root.iter_postorder()
+    return _iter_postorder_nodes(root)
+
+
+def _iter_postorder_nodes(root: Optional[TreeNode[T]]) -> Iterator[T]:
+    stack: List[TreeNode[T]] = []
+    node, last = root, None
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        if top.right is not None and top.right is not last:
+            node = top.right
+        else:
+            last = stack.pop()
+            yield last.value
+
+
+def iter_level_order(root: Union[TreeNode[T], ArrayTree[T], None]) -> Iterator[T]:
+    """Yield values level by level, left to right."""
+    if isinstance(root, ArrayTree):
+        return root.iter_level_order()
+    return _iter_level_order_nodes(root)
+
+
+def _iter_level_order_nodes(root: Optional[TreeNode[T]]) -> Iterator[T]:
+    pending = deque([root] if root is not None else [])
+    while pending:
+        node = pending.popleft()
+        yield node.value
+        if node.left is not None:
+            pending.append(node.left)
+        if node.right is not None:
+            pending.append(node.right)
+
+
+def _morris_walk(root: Optional[TreeNode[T]]) -> Iterator[T]:
+    node = root
+    while node is not None:
+        if node.left is None:
+            yield node.value
+            node = node.right
+            continue
+        pred = node.left
+        while pred.right is not None and pred.right is not node:
+            pred = pred.right
+        if pred.right is None:
+            pred.right = node  # thread back to node, then walk the left subtree
+            node = node.left
+        else:
+            pred.right = None  # left subtree done, remove the thread
+            yield node.value
+            node = node.right
+
+
+def morris_inorder(root: Optional[TreeNode[T]]) -> Iterator[T]:
+    """Yield values in inorder with O(1) extra memory (Morris traversal).
+
+    The walk temporarily threads each left subtree's rightmost node back to
+    its ancestor. If the generator is closed early, the walk is run to the
+    end without yielding so every thread is removed. The tree must not be
+    modified or shared with another traversal while iterating.
+    """
+    walker = _morris_walk(root)
+    try:
+        for value in walker:
+            yield value
+    finally:
+        for _ in walker:
+            pass
+
 
 def preorder_traversal(root: Optional[TreeNode[T]]) -> List[T]:
     """Return list of values in preorder (root, left, right)."""
-    traversal = []
-    if root is None:
-        return traversal
-    traversal.append(root.value)
-    if root.left is not None:
-        traversal.extend(preorder_traversal(root.left))
-    if root.right is not None:
-        traversal.extend(preorder_traversal(root.right))
-    return traversal
+    return list(iter_preorder(root))
 
 
 def inorder_traversal(root: Optional[TreeNode[T]]) -> List[T]:
     """Return list of values in inorder (left, root, right)."""
-    traversal = []
-    if root is None:
-        return traversal
-    if root.left is not None:
-        traversal.extend(inorder_traversal(root.left))
-    traversal.append(root.value)
-    if root.right is not None:
-        traversal.extend(inorder_traversal(root.right))
-    return traversal
+    return list(iter_inorder(root))
 
 
-def postorder_traversal(root):
+def postorder_traversal(root: Optional[TreeNode[T]]) -> List[T]:
     """Return list of values in postorder (left, right, root)."""
-    traversal = []
-    if root is None:
-        return traversal
-    if root.left is not None:
-        traversal.extend(postorder_traversal(root.left))
-    if root.right is not None:
-        traversal.extend(postorder_traversal(root.right))
-    traversal.append(root.value)
-    return traversal
+    return list(iter_postorder(root))
 
 
-def level_order_traversal(root):
+def level_order_traversal(root: Optional[TreeNode[T]]) -> List[T]:
     """Return list of values in level order (breadth-first)."""
-    raise NotImplementedError
+    return list(iter_level_order(root))
 
 
 def tree_size(root):
     """Return the number of nodes in the tree."""
-    raise NotImplementedError
+    if isinstance(root, ArrayTree):
+        return len(root)
+    return sum(1 for _ in iter_preorder(root))
 
 
 def tree_height(root):
     """Return the height of the tree (empty tree has height 0, single node has height 1)."""
-    raise NotImplementedError
+    if isinstance(root, ArrayTree):
+        return root.height()
+    level = [root] if root is not None else []
+    height = 0
+    while level:
+        height += 1
+        level = [c for node in level for c in (node.left, node.right) if c is not None]
+    return height
 
 
 def tree_contains(root, value):
@@ -78,39 +441,376 @@ def tree_contains(root, value):
     raise NotImplementedError
 
 
+# === Aggregates ===
+
+AGGREGATES = ("size", "height", "sum", "min", "max", "average", "balanced", "count_of")
+
+# Per-subtree summary: (size, height, sum, min, max, balanced).
+_EMPTY_SUMMARY = (0, 0, 0, None, None, True)
+_NO_VALUE = object()
+
+
+def _summarize(root, want_sum: bool, want_range: bool, value, cache: bool):
+    """One iterative postorder pass; return (root summary, count of value).
+
+    With cache=True every TreeNode keeps its subtree's summary in
+    node._summary and cached subtrees are not re-entered (unless a count
+    is requested, which needs every node). bst_insert and bst_delete
+    clear the summaries along the path they change.
+    """
+    counting = value is not _NO_VALUE
+    reuse = cache and not counting
+    count = 0
+    results = []
+    stack = [(root, False)] if root is not None else []
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            cached = getattr(node, "_summary", None) if reuse else None
+            if cached is not None:
+                results.append(cached)
+                continue
+            stack.append((node, True))
+            if node.right is not None:
+                stack.append((node.right, False))
+            if node.left is not None:
+                stack.append((node.left, False))
+            continue
+        right = results.pop() if node.right is not None else _EMPTY_SUMMARY
+        left = results.pop() if node.left is not None else _EMPTY_SUMMARY
+        v = node.value
+        if counting and v == value:
+            count += 1
+        summary = _combine(left, v, right, want_sum, want_range)
+        if cache and isinstance(node, TreeNode):
+            node._summary = summary
+        results.append(summary)
+    return (results[0] if results else _EMPTY_SUMMARY), count
+
+
+def _summarize_array(tree: ArrayTree, want_sum: bool, want_range: bool, value):
+    """_summarize for an ArrayTree, keeping summaries by node index."""
+    counting = value is not _NO_VALUE
+    count = 0
+    values, left, right = tree.values, tree.left, tree.right
+    summaries = {}
+    pop = summaries.pop
+    for i in tree._postorder():
+        v = values[i]
+        if counting and v == value:
+            count += 1
+        summaries[i] = _combine(
+            pop(left[i], _EMPTY_SUMMARY),
+            v,
+            pop(right[i], _EMPTY_SUMMARY),
+            want_sum,
+            want_range,
+        )
+    return summaries.get(tree.root, _EMPTY_SUMMARY), count
+
+
+def _combine(left, v, right, want_sum: bool, want_range: bool):
+    """Summary of a node with value v from its children's summaries."""
+    lo = hi = total = None
+    if want_sum:
+        total = left[2] + v + right[2]
+    if want_range:
+        lo = v if left[3] is None or v < left[3] else left[3]
+        hi = v if left[4] is None or left[4] < v else left[4]
+        if right[3] is not None:
+            lo = right[3] if right[3] < lo else lo
+            hi = right[4] if hi < right[4] else hi
+    return (
+        left[0] + right[0] + 1,
+        max(left[1], right[1]) + 1,
+        total,
+        lo,
+        hi,
+        left[5] and right[5] and abs(left[1] - right[1]) <= 1,
+    )
+
+
+def tree_aggregates(root, *names: str, value=_NO_VALUE, cache: bool = False):
+    """Compute several aggregates in a single walk and return them by name.
+
+    names are taken from AGGREGATES (all but count_of by default);
+    count_of needs value=. With cache=True, summaries are kept on the
+    nodes, so asking again before the next bst_insert/bst_delete is O(1),
+    and after one only the changed path is recomputed. Nodes changed by
+    hand need clear_tree_cache(). Caching computes every aggregate, so it
+    needs values that support both + and <. An ArrayTree is accepted too;
+    it has nowhere to keep summaries, so cache is ignored for it.
+    """
+    names = names or tuple(n for n in AGGREGATES if n != "count_of")
+    unknown = set(names) - set(AGGREGATES)
+    if unknown:
+        raise ValueError(f"unknown aggregates {sorted(unknown)}, use {AGGREGATES}")
+    if "count_of" in names and value is _NO_VALUE:
+        raise ValueError("count_of needs value=")
+    want_sum = cache or "sum" in names or "average" in names
+    want_range = cache or "min" in names or "max" in names
+    value = value if "count_of" in names else _NO_VALUE
+    if isinstance(root, ArrayTree):
+        summary, count = _summarize_array(root, want_sum, want_range, value)
+    else:
+        summary, count = _summarize(root, want_sum, want_range, value, cache)
+    size, height, total, lo, hi, balanced = summary
+    if not size:
+        total = 0
+    available = {
+        "size": size,
+        "height": height,
+        "sum": total,
+        "min": lo,
+        "max": hi,
+        "average": total / size if size and want_sum else None,
+        "balanced": balanced,
+        "count_of": count,
+    }
+    return {name: available[name] for name in names}
+
+
+def clear_tree_cache(root) -> None:
+    """Drop the cached summaries and structural hashes below root."""
+    if isinstance(root, ArrayTree):
+        return
+    for node in _iter_nodes(root):
+        if isinstance(node, TreeNode):
+            node._summary = node._hash = None
+
+
+def _iter_nodes(root) -> Iterator[TreeNode]:
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.right is not None:
+            stack.append(node.right)
+        if node.left is not None:
+            stack.append(node.left)
+
+
 def tree_min(root):
     """Return the minimum value in the tree, None if empty."""
-    raise NotImplementedError
+    return tree_aggregates(root, "min")["min"]
 
 
 def tree_max(root):
     """Return the maximum value in the tree, None if empty."""
-    raise NotImplementedError
+    return tree_aggregates(root, "max")["max"]
 
 
 def tree_sum(root):
     """Return the sum of all values in the tree."""
-    raise NotImplementedError
+    return tree_aggregates(root, "sum")["sum"]
 
 
 def tree_average(root):
     """Return the average of all values in the tree, None if empty."""
-    raise NotImplementedError
+    return tree_aggregates(root, "average")["average"]
 
 
 def tree_count_of(root, value):
     """Return the count of nodes with the given value."""
-    raise NotImplementedError
+    return tree_aggregates(root, "count_of", value=value)["count_of"]
 
 
 def tree_is_balanced(root):
     """Return True if tree is height-balanced (left and right heights differ by at most 1)."""
-    raise NotImplementedError
+    return tree_aggregates(root, "balanced")["balanced"]
+
+
+# === Structural hashing ===
+
+# (hash, mirror hash) of the empty tree.
+_EMPTY_HASHES = (hash(()), hash(()))
+
+
+def _hashes(node):
+    """Return node's (hash, mirror hash), computing and caching what is missing.
+
+    hash(t) = hash((value, hash(left), hash(right))) and the mirror hash
+    swaps the children, so mirror_hash(t) == hash(mirror image of t).
+    """
+    if node is None:
+        return _EMPTY_HASHES
+    cached = getattr(node, "_hash", None)
+    if cached is not None:
+        return cached
+    results = []
+    stack = [(node, False)]
+    while stack:
+        current, children_done = stack.pop()
+        if not children_done:
+            cached = getattr(current, "_hash", None)
+            if cached is not None:
+                results.append(cached)
+                continue
+            stack.append((current, True))
+            if current.right is not None:
+                stack.append((current.right, False))
+            if current.left is not None:
+                stack.append((current.left, False))
+            continue
+        right = results.pop() if current.right is not None else _EMPTY_HASHES
+        left = results.pop() if current.left is not None else _EMPTY_HASHES
+        value = current.value
+        pair = (hash((value, left[0], right[0])), hash((value, right[1], left[1])))
+        if isinstance(current, TreeNode):
+            current._hash = pair
+        results.append(pair)
+    return results[0]
+
+
+def tree_hash(root) -> int:
+    """Return a Merkle-style structural hash of the tree.
+
+    Equal trees (same shape and values) hash equal. Hashes are cached on
+    TreeNodes; bst_insert/bst_delete drop them along the path they change,
+    so rehashing after a mutation is O(h). Use clear_tree_cache() after
+    editing nodes by hand. Like hash(), values are hashed per process.
+    """
+    return _hashes(root)[0]
+
+
+def _cached_hashes(node):
+    """Return node's cached (hash, mirror hash), or None if it has none."""
+    return None if node is None else getattr(node, "_hash", None)
+
+
+def _same_structure(a, b, mirror: bool = False) -> bool:
+    """Compare two trees node by node, skipping subtrees shared by identity."""
+    pairs = [(a, b)]
+    while pairs:
+        x, y = pairs.pop()
+        if x is y and (x is None or not mirror):
+            continue
+        if x is None or y is None:
+            return False
+        if x.value != y.value:
+            return False
+        if mirror:
+            pairs.append((x.left, y.right))
+            pairs.append((x.right, y.left))
+        else:
+            pairs.append((x.left, y.left))
+            pairs.append((x.right, y.right))
+    return True
+
+
+def trees_equal(a, b, verify: bool = True) -> bool:
+    """Return True if both trees have the same shape and values.
+
+    Hashes are used once either tree has them cached (see tree_hash):
+    different hashes answer False, rehashing only the stale paths. A match
+    is confirmed by an O(n) walk, unless verify=False, which trusts equal
+    hashes and answers in O(1) at the risk of a hash collision. When
+    neither tree is hashed, or the values are unhashable, the trees are
+    just walked. The walk skips shared subtrees, so hash-consed trees
+    compare in O(1) either way.
+    """
+    if a is b:
+        return True
+    if a is None or b is None:
+        return False
+    if _cached_hashes(a) is not None or _cached_hashes(b) is not None:
+        try:
+            if _hashes(a)[0] != _hashes(b)[0]:
+                return False
+        except TypeError:
+            pass
+        else:
+            if not verify:
+                return True
+    return _same_structure(a, b)
 
 
 def tree_is_symmetric(root):
-    """Return True if tree is symmetric around its center."""
-    raise NotImplementedError
+    """Return True if tree is symmetric around its center.
+
+    With cached hashes, the left subtree's hash must equal the right
+    subtree's mirror hash before the mirror walk runs.
+    """
+    if root is None:
+        return True
+    left, right = root.left, root.right
+    if _cached_hashes(left) is not None or _cached_hashes(right) is not None:
+        try:
+            if _hashes(left)[0] != _hashes(right)[1]:
+                return False
+        except TypeError:
+            pass
+    return _same_structure(left, right, mirror=True)
+
+
+def _canonical_ids(root, table: dict):
+    """Yield (node, id) in postorder; equal subtrees get the same id from table."""
+    ids = []
+    stack = [(root, False)] if root is not None else []
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            if node.right is not None:
+                stack.append((node.right, False))
+            if node.left is not None:
+                stack.append((node.left, False))
+            continue
+        right = ids.pop() if node.right is not None else -1
+        left = ids.pop() if node.left is not None else -1
+        key = (node.value, left, right)
+        uid = table.setdefault(key, len(table))
+        ids.append(uid)
+        yield node, uid
+
+
+def duplicate_subtrees(root) -> List[TreeNode]:
+    """Return one root for every subtree shape that occurs more than once.
+
+    Subtrees are interned by (value, left id, right id), which is exact, so
+    no collision check is needed; O(n) for hashable values.
+    """
+    seen: dict = {}
+    duplicates = {}
+    for node, uid in _canonical_ids(root, {}):
+        if uid in seen:
+            duplicates.setdefault(uid, seen[uid])
+        else:
+            seen[uid] = node
+    return list(duplicates.values())
+
+
+def hash_cons(root, table: Optional[dict] = None):
+    """Share identical subtrees in place and return the (canonical) root.
+
+    Every subtree is replaced by the first equal subtree met, so repeated
+    shapes are stored once and compare equal by identity. Pass the same
+    table to share subtrees across several trees. The result is a DAG:
+    mutating a shared node changes every place it appears, so treat
+    hash-consed trees as read-only.
+    """
+    if root is None:
+        return None
+    table = {} if table is None else table
+    shared = []
+    stack = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            if node.right is not None:
+                stack.append((node.right, False))
+            if node.left is not None:
+                stack.append((node.left, False))
+            continue
+        if node.right is not None:
+            node.right = shared.pop()
+        if node.left is not None:
+            node.left = shared.pop()
+        # Children are canonical by now, so identity stands for structure.
+        key = (node.value, id(node.left), id(node.right))
+        shared.append(table.setdefault(key, node))
+    return shared[0]
 
 
 def tree_diameter(root):
@@ -119,31 +819,327 @@ def tree_diameter(root):
 
 
 def serialize_tree(root):
-    """Convert tree to a string representation."""
-    raise NotImplementedError
+    """Convert tree to a string representation.
+
+    A JSON list in level order with null for missing children, trailing
+    nulls dropped: [1, 2, 3, null, 4]. See tree_codec for a compact binary
+    format.
+    """
+    values = []
+    pending = deque([root])
+    while pending:
+        node = pending.popleft()
+        if node is None:
+            values.append(None)
+            continue
+        values.append(node.value)
+        pending.append(node.left)
+        pending.append(node.right)
+    while values and values[-1] is None:
+        values.pop()
+    return json.dumps(values)
 
 
 def deserialize_tree(data):
     """Reconstruct tree from string representation."""
-    raise NotImplementedError
+    values = json.loads(data)
+    if not values:
+        return None
+    root = TreeNode(values[0])
+    parents = deque([root])
+    it = iter(values[1:])
+    for left in it:
+        parent = parents.popleft()
+        if left is not None:
+            parent.left = TreeNode(left)
+            parents.append(parent.left)
+        right = next(it, None)
+        if right is not None:
+            parent.right = TreeNode(right)
+            parents.append(parent.right)
+    return root
 
 
 # === Binary Search Tree (BST) operations ===
 
 
+class AVLNode(TreeNode[T]):
+    """BST node that also records the height and size of its subtree.
+
+    bst_insert(None, ...) starts an AVL tree, and bst_insert/bst_delete
+    keep any tree rooted at an AVLNode height-balanced, so insert, delete
+    and search stay O(log n) even for sorted input. Trees of plain
+    TreeNodes are updated as ordinary, unbalanced BSTs. The subtree
+    sizes let bst_select, bst_rank and bst_count_range run in O(log n).
+    """
+
+    def __init__(
+        self,
+        value,
+        left: Optional[AVLNode[T]] = None,
+        right: Optional[AVLNode[T]] = None,
+    ):
+        super().__init__(value, left, right)
+        self.height = 1
+        self.size = 1
+
+
+def _height(node: Optional[AVLNode[T]]) -> int:
+    return node.height if node is not None else 0
+
+
+def _size(node: Optional[AVLNode[T]]) -> int:
+    return node.size if node is not None else 0
+
+
+def _update(node: AVLNode[T]) -> None:
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _rotate_right(node: AVLNode[T]) -> AVLNode[T]:
+    pivot = node.left
+    node._summary = pivot._summary = None
+    node._hash = pivot._hash = None
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node: AVLNode[T]) -> AVLNode[T]:
+    pivot = node.right
+    node._summary = pivot._summary = None
+    node._hash = pivot._hash = None
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node: AVLNode[T]) -> AVLNode[T]:
+    """Restore the AVL invariant at node and return the subtree's new root."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _retrace(root, path: List[TreeNode[T]], delta: int):
+    """Rebalance the nodes on path (root first) bottom-up; return the new root.
+
+    Once a subtree's height and root are unchanged nothing above it needs
+    rebalancing, and the remaining ancestors' sizes just change by delta
+    (+1 after an insert, -1 after a delete). Cached summaries and hashes
+    on the path are dropped first, since every one of those subtrees changed.
+    """
+    if isinstance(root, TreeNode):
+        for node in path:
+            node._summary = node._hash = None
+    if not isinstance(root, AVLNode):
+        return root
+    settled = False
+    for depth in range(len(path) - 1, -1, -1):
+        node = path[depth]
+        if settled:
+            node.size += delta
+            continue
+        before = node.height
+        subtree = _rebalance(node)
+        if subtree is node and node.height == before:
+            settled = True
+            continue
+        if depth == 0:
+            root = subtree
+        elif path[depth - 1].left is node:
+            path[depth - 1].left = subtree
+        else:
+            path[depth - 1].right = subtree
+    return root
+
+
 def bst_insert(root, value):
-    """Insert value into BST, return root. BST property: left < root < right."""
-    raise NotImplementedError
+    """Insert value into BST, return root. BST property: left < root < right.
+
+    Duplicates are ignored. Starting from None builds an AVL tree, which
+    stays balanced; a hand-built tree is extended as a plain BST, each new
+    node of its parent's class (so SlotTreeNode trees stay SlotTreeNode).
+    An ArrayTree is extended in place and returned.
+    """
+    if isinstance(root, ArrayTree):
+        root.insert(value)
+        return root
+    if root is None:
+        return AVLNode(value)
+    path = []
+    node = root
+    while node is not None:
+        if value == node.value:
+            return root
+        path.append(node)
+        node = node.left if value < node.value else node.right
+    parent = path[-1]
+    child = type(parent)(value)
+    if value < parent.value:
+        parent.left = child
+    else:
+        parent.right = child
+    return _retrace(root, path, 1)
+
+
+def bst_insert_many(root, values: Iterable[T]):
+    """Insert every value with bst_insert and return the root.
+
+    To build a tree from sorted values, bst_from_sorted is O(n) rather
+    than O(n log n).
+    """
+    for value in values:
+        root = bst_insert(root, value)
+    return root
+
+
+def _take_sorted(values: Iterable[T], length: Optional[int]) -> Iterator[T]:
+    """Yield values (exactly length of them, if given), checking they strictly increase."""
+    if length is not None:
+        values = islice(values, length)
+    count = 0
+    previous = None
+    for value in values:
+        if count and not previous < value:
+            raise ValueError("values must be strictly increasing")
+        previous = value
+        count += 1
+        yield value
+    if length is not None and count != length:
+        raise ValueError(f"expected {length} values, got {count}")
+
+
+def _balanced_links(n: int) -> Iterator[tuple]:
+    """Yield (node, left, right, size) for the balanced BST over inorder positions 0..n-1.
+
+    Each range's root is its middle position, (lo + hi) // 2; missing
+    children are NIL. Uses an explicit stack of ranges, no slicing.
+    """
+    stack = [(0, n - 1)] if n else []
+    while stack:
+        lo, hi = stack.pop()
+        mid = (lo + hi) // 2
+        left = right = NIL
+        if lo < mid:
+            left = (lo + mid - 1) // 2
+            stack.append((lo, mid - 1))
+        if mid < hi:
+            right = (mid + 1 + hi) // 2
+            stack.append((mid + 1, hi))
+        yield mid, left, right, hi - lo + 1
+
+
+def bst_from_sorted(
+    values: Iterable[T], length: Optional[int] = None, node_type=AVLNode
+):
+    """Build a height-balanced BST from strictly increasing values in O(n).
+
+    values may be any iterator; it is read once. Nodes are created in
+    order and then linked by inorder position, so the tree is ready as
+    soon as the input ends. With length, exactly that many values are
+    read (ValueError if the input runs short). AVLNodes get their heights
+    and sizes filled in, so bst_insert/bst_delete and the order statistics
+    work on the result straight away.
+    """
+    nodes = [node_type(value) for value in _take_sorted(values, length)]
+    augmented = issubclass(node_type, AVLNode)
+    for mid, left, right, size in _balanced_links(len(nodes)):
+        node = nodes[mid]
+        if left != NIL:
+            node.left = nodes[left]
+        if right != NIL:
+            node.right = nodes[right]
+        if augmented:
+            node.size = size
+            node.height = size.bit_length()
+    return nodes[(len(nodes) - 1) // 2] if nodes else None
 
 
 def bst_search(root, value):
-    """Return node with value if found, None otherwise. Use BST property."""
-    raise NotImplementedError
+    """Return node with value if found, None otherwise. Use BST property.
+
+    For an ArrayTree the node is its index, NIL if value is absent.
+    """
+    if isinstance(root, ArrayTree):
+        return root.search(value)
+    node = root
+    while node is not None and node.value != value:
+        node = node.left if value < node.value else node.right
+    return node
 
 
 def bst_delete(root, value):
-    """Delete node with value from BST, return root."""
-    raise NotImplementedError
+    """Delete node with value from BST, return root.
+
+    A node with two children takes its inorder successor's value, and the
+    successor node is unlinked instead. AVL trees are rebalanced. An
+    ArrayTree is changed in place and returned.
+    """
+    if isinstance(root, ArrayTree):
+        root.delete(value)
+        return root
+    path = []
+    node = root
+    while node is not None and node.value != value:
+        path.append(node)
+        node = node.left if value < node.value else node.right
+    if node is None:
+        return root
+    if node.left is not None and node.right is not None:
+        path.append(node)
+        successor = node.right
+        while successor.left is not None:
+            path.append(successor)
+            successor = successor.left
+        node.value = successor.value
+        node = successor
+    child = node.left if node.left is not None else node.right
+    if not path:
+        return child
+    parent = path[-1]
+    if parent.left is node:
+        parent.left = child
+    else:
+        parent.right = child
+    return _retrace(root, path, -1)
+
+
+def bst_range(root, lo: T, hi: T) -> Iterator[T]:
+    """Yield the values in lo <= value <= hi in ascending order.
+
+    Subtrees entirely outside the range are never entered, so this costs
+    O(h + k) for k results.
+    """
+    stack = []
+    node = root
+    while True:
+        while node is not None:
+            if node.value < lo:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        if not stack:
+            return
+        node = stack.pop()
+        if node.value > hi:
+            return
+        yield node.value
+        node = node.right
 
 
 def bst_validate(root):
@@ -152,10 +1148,148 @@ def bst_validate(root):
 
 
 def bst_inorder_successor(root, node):
-    """Return the inorder successor of node in BST, None if no successor."""
-    raise NotImplementedError
+    """Return the inorder successor of node in BST, None if no successor.
+
+    O(h): the leftmost node of node's right subtree if it has one,
+    otherwise the last ancestor where the search for node turned left.
+    """
+    if node.right is not None:
+        successor = node.right
+        while successor.left is not None:
+            successor = successor.left
+        return successor
+    successor = None
+    current = root
+    while current is not None and current is not node:
+        if node.value < current.value:
+            successor = current
+            current = current.left
+        else:
+            current = current.right
+    return successor
+
+
+# === Order statistics (trees built by bst_insert) ===
+
+
+def bst_select(root, k: int):
+    """Return the k-th smallest value (0-based). Raise IndexError if out of range.
+
+    O(log n) on AVL trees through the subtree sizes; plain TreeNode trees
+    fall back to an inorder walk.
+    """
+    if not isinstance(root, AVLNode):
+        if k >= 0:
+            for i, value in enumerate(iter_inorder(root)):
+                if i == k:
+                    return value
+        raise IndexError("select index out of range")
+    if not 0 <= k < root.size:
+        raise IndexError("select index out of range")
+    node = root
+    while True:
+        left = _size(node.left)
+        if k < left:
+            node = node.left
+        elif k == left:
+            return node.value
+        else:
+            k -= left + 1
+            node = node.right
+
+
+def _count_below(root, value, inclusive: bool) -> int:
+    if not isinstance(root, AVLNode):
+        if inclusive:
+            return sum(1 for v in iter_inorder(root) if v <= value)
+        return sum(1 for v in iter_inorder(root) if v < value)
+    count = 0
+    node = root
+    while node is not None:
+        if node.value < value or (inclusive and node.value == value):
+            count += _size(node.left) + 1
+            node = node.right
+        else:
+            node = node.left
+    return count
+
+
+def bst_rank(root, value) -> int:
+    """Return how many values in the tree are smaller than value."""
+    return _count_below(root, value, inclusive=False)
+
+
+def bst_count_range(root, lo, hi) -> int:
+    """Return how many values v satisfy lo <= v <= hi."""
+    if hi < lo:
+        return 0
+    return _count_below(root, hi, inclusive=True) - _count_below(
+        root, lo, inclusive=False
+    )
 
 
 def bst_lowest_common_ancestor(root, p, q):
-    """Return lowest common ancestor of nodes p and q in BST."""
-    raise NotImplementedError
+    """Return lowest common ancestor of nodes p and q in BST.
+
+    Walks down from the root until p and q fall on different sides, O(h)
+    per pair; tree_lca.LCAIndex answers many queries in O(1) each.
+    """
+    lo, hi = (p.value, q.value) if p.value <= q.value else (q.value, p.value)
+    node = root
+    while node is not None:
+        if hi < node.value:
+            node = node.left
+        elif node.value < lo:
+            node = node.right
+        else:
+            return node
+    return None
+
+
+class EytzingerTree(Generic[T]):
+    """Static search tree over sorted values in Eytzinger (BFS) order.
+
+    Slot k's children are 2k and 2k+1 (slot 0 is unused), so a search walks
+    a predictable path from the front of one flat array rather than
+    chasing pointers, and the first few levels share cache lines.
+    """
+
+    def __init__(self, sorted_values: Iterable[T], typecode: Optional[str] = None):
+        ordered = list(sorted_values)
+        n = self._n = len(ordered)
+        if typecode:
+            self._slots: Union[List[Optional[T]], array] = array(typecode, [0]) * (
+                n + 1
+            )
+        else:
+            self._slots = [None] * (n + 1)
+        # Visit the implicit tree in inorder so the sorted values land as a BST.
+        slots, stack, k = self._slots, [], 1
+        for value in ordered:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            slots[k] = value
+            k = 2 * k + 1
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __contains__(self, value: T) -> bool:
+        slots, n, k = self._slots, self._n, 1
+        while k <= n:
+            current = slots[k]
+            if value == current:
+                return True
+            k = 2 * k + (current < value)
+        return False
+
+    def lower_bound(self, value: T) -> Optional[T]:
+        """Return the smallest stored value >= value, None if there is none."""
+        slots, n, k = self._slots, self._n, 1
+        while k <= n:
+            k = 2 * k + (slots[k] < value)
+        # Undo the trailing right turns plus the last left turn.
+        k >>= ((~k) & (k + 1)).bit_length()
+        return slots[k] if k else None
@@ -25,6 +25,7 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "backtracking: backtracking exercises")
     config.addinivalue_line("markers", "greedy: greedy algorithm exercises")
     config.addinivalue_line("markers", "dp: dynamic programming exercises")
+    config.addinivalue_line("markers", "memo: memoization and caching helpers")
 
     # Other
     config.addinivalue_line("markers", "bits: bit manipulation exercises")
@@ -50,7 +50,6 @@ class TestBstToSortedArray:
         assert conversions.bst_to_sorted_array(None) == []
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestSortedArrayToBalancedBst:
     def test_simple(self):
         root = conversions.sorted_array_to_balanced_bst([1, 2, 3, 4, 5])
@@ -63,6 +62,11 @@ class TestSortedArrayToBalancedBst:
     def test_empty(self):
         assert conversions.sorted_array_to_balanced_bst([]) is None
 
+    def test_large_input_is_balanced_without_recursion(self):
+        root = conversions.sorted_array_to_balanced_bst(list(range(100_000)))
+        assert root.height == 17
+        assert root.size == 100_000
+
 
 @pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestAdjacencyListToMatrix:
@@ -8,7 +8,6 @@ pytestmark = pytest.mark.dp
 # === 1D DP Tests ===
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestFibonacci:
     def test_base_cases(self):
         assert dp.fibonacci(0) == 0
@@ -18,7 +17,6 @@ class TestFibonacci:
         assert dp.fibonacci(10) == 55
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestClimbingStairs:
     def test_simple(self):
         assert dp.climbing_stairs(2) == 2
@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from src.year_2026 import external_sort
+
+pytestmark = pytest.mark.sorting
+
+
+def write_lines(path, lines):
+    path.write_bytes(b"".join(line + b"\n" for line in lines))
+
+
+class TestExternalSort:
+    def test_single_run(self, tmp_path):
+        lines = [str(random.randint(0, 10**6)).encode() for _ in range(100)]
+        write_lines(tmp_path / "in.txt", lines)
+        runs = external_sort.external_sort(
+            str(tmp_path / "in.txt"), str(tmp_path / "out.txt")
+        )
+        assert runs == 1
+        assert (tmp_path / "out.txt").read_bytes().splitlines() == sorted(lines)
+
+    def test_many_runs_multi_pass(self, tmp_path):
+        lines = [
+            bytes(random.choice(b"abcdefgh") for _ in range(8)) for _ in range(2000)
+        ]
+        write_lines(tmp_path / "in.txt", lines)
+        runs = external_sort.external_sort(
+            str(tmp_path / "in.txt"),
+            str(tmp_path / "out.txt"),
+            memory_limit=512,
+            fan_in=3,
+            tmp_dir=str(tmp_path),
+        )
+        assert runs > 3
+        assert (tmp_path / "out.txt").read_bytes().splitlines() == sorted(lines)
+        # Temporary runs are cleaned up.
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["in.txt", "out.txt"]
+
+    def test_key(self, tmp_path):
+        lines = [str(n).encode() for n in random.sample(range(10_000), 500)]
+        write_lines(tmp_path / "in.txt", lines)
+        external_sort.external_sort(
+            str(tmp_path / "in.txt"),
+            str(tmp_path / "out.txt"),
+            memory_limit=256,
+            key=int,
+        )
+        result = (tmp_path / "out.txt").read_bytes().splitlines()
+        assert result == sorted(lines, key=int)
+
+    def test_key_sees_record_without_newline(self, tmp_path):
+        numbers = random.sample(range(10_000), 300)
+        data = b"\n".join(f"row{i},{n}".encode() for i, n in enumerate(numbers))
+        (tmp_path / "in.txt").write_bytes(data)  # last record has no newline
+        seen = []
+
+        def last_field(record):
+            seen.append(record)
+            return int(record.rsplit(b",", 1)[1].decode())
+
+        external_sort.external_sort(
+            str(tmp_path / "in.txt"),
+            str(tmp_path / "out.txt"),
+            memory_limit=256,
+            fan_in=2,
+            key=last_field,
+        )
+        assert not any(record.endswith(b"\n") for record in seen)
+        result = (tmp_path / "out.txt").read_bytes().splitlines()
+        assert [int(r.rsplit(b",", 1)[1]) for r in result] == sorted(numbers)
+
+    def test_prefix_sorts_before_bytes_below_newline(self, tmp_path):
+        (tmp_path / "in.txt").write_bytes(b"a\tb\na\nab\n")
+        external_sort.external_sort(str(tmp_path / "in.txt"), str(tmp_path / "out.txt"))
+        assert (tmp_path / "out.txt").read_bytes() == b"a\na\tb\nab\n"
+        external_sort.external_sort(
+            str(tmp_path / "in.txt"), str(tmp_path / "out.txt"), memory_limit=1
+        )
+        assert (tmp_path / "out.txt").read_bytes() == b"a\na\tb\nab\n"
+
+    def test_missing_trailing_newline(self, tmp_path):
+        (tmp_path / "in.txt").write_bytes(b"b\nc\na")
+        external_sort.external_sort(str(tmp_path / "in.txt"), str(tmp_path / "out.txt"))
+        assert (tmp_path / "out.txt").read_bytes() == b"a\nb\nc\n"
+
+    def test_empty_file(self, tmp_path):
+        (tmp_path / "in.txt").write_bytes(b"")
+        assert (
+            external_sort.external_sort(
+                str(tmp_path / "in.txt"), str(tmp_path / "out.txt")
+            )
+            == 0
+        )
+        assert (tmp_path / "out.txt").read_bytes() == b""
+
+    def test_invalid_fan_in(self, tmp_path):
+        with pytest.raises(ValueError):
+            external_sort.external_sort("in", "out", fan_in=1)
+
+    def test_custom_sorter(self, tmp_path):
+        lines = [str(random.randint(0, 10**6)).encode() for _ in range(300)]
+        write_lines(tmp_path / "in.txt", lines)
+        external_sort.external_sort(
+            str(tmp_path / "in.txt"),
+            str(tmp_path / "out.txt"),
+            memory_limit=200,
+            sorter=sorted,
+        )
+        assert (tmp_path / "out.txt").read_bytes().splitlines() == sorted(lines)
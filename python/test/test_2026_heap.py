@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from src.year_2026 import heap
@@ -65,7 +67,6 @@ class TestHeapSort:
         assert heap.heap_sort([]) == []
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestKthLargest:
     def test_simple(self):
         assert heap.kth_largest([3, 2, 1, 5, 6, 4], 2) == 5
@@ -74,7 +75,6 @@ class TestKthLargest:
         assert heap.kth_largest([3, 2, 1, 5, 6, 4], 1) == 6
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestKthSmallest:
     def test_simple(self):
         assert heap.kth_smallest([3, 2, 1, 5, 6, 4], 2) == 2
@@ -98,3 +98,18 @@ class TestSlidingWindowMaximum:
             6,
             7,
         ]
+
+
+class TestKthLargeInputs:
+    def test_kth_smallest_matches_sorted(self):
+        arr = [random.randint(-1000, 1000) for _ in range(2000)]
+        expected = sorted(arr)
+        assert heap.kth_smallest(arr, 1) == expected[0]
+        assert heap.kth_smallest(arr, 1000) == expected[999]
+        assert heap.kth_largest(arr, 1) == expected[-1]
+        assert heap.kth_largest(arr, 7) == expected[-7]
+
+    def test_input_not_modified(self):
+        arr = [3, 2, 1, 5, 6, 4]
+        heap.kth_largest(arr, 2)
+        assert arr == [3, 2, 1, 5, 6, 4]
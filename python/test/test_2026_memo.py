@@ -0,0 +1,184 @@
+import gc
+import threading
+
+import pytest
+
+from src.year_2026 import dp, memo, recursion
+
+pytestmark = pytest.mark.memo
+
+
+class TestMemoizeLRU:
+    def test_caches_results(self):
+        calls = []
+
+        @memo.memoize(maxsize=4)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert calls == [3]
+        info = square.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        assert info.hit_rate == 0.5
+
+    def test_evicts_least_recently_used(self):
+        @memo.memoize(maxsize=2)
+        def ident(x):
+            return x
+
+        ident(1)
+        ident(2)
+        ident(1)  # 1 is now most recent
+        ident(3)  # evicts 2
+        assert (1,) in ident.cache
+        assert (2,) not in ident.cache
+        assert ident.cache_info().evictions == 1
+
+    def test_kwargs_are_part_of_key(self):
+        @memo.memoize()
+        def add(a, b=0):
+            return a + b
+
+        assert add(1, b=2) == 3
+        assert add(1, b=3) == 4
+        assert add.cache_info().misses == 2
+
+    def test_zero_maxsize_never_stores(self):
+        @memo.memoize(maxsize=0)
+        def ident(x):
+            return x
+
+        assert ident(1) == 1
+        assert ident(1) == 1
+        assert ident.cache_info().currsize == 0
+
+    def test_cache_clear_resets_stats(self):
+        @memo.memoize()
+        def ident(x):
+            return x
+
+        ident(1)
+        ident(1)
+        ident.cache_clear()
+        info = ident.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+class TestMemoizeLFU:
+    def test_evicts_least_frequently_used(self):
+        @memo.memoize(maxsize=2, policy="lfu")
+        def ident(x):
+            return x
+
+        ident(1)
+        ident(1)
+        ident(1)
+        ident(2)
+        ident(3)  # 2 has the lowest frequency
+        assert (1,) in ident.cache
+        assert (2,) not in ident.cache
+        assert (3,) in ident.cache
+
+    def test_ties_evict_oldest(self):
+        @memo.memoize(maxsize=2, policy="lfu")
+        def ident(x):
+            return x
+
+        ident(1)
+        ident(2)
+        ident(3)
+        assert (1,) not in ident.cache
+        assert ident.cache_info().evictions == 1
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            memo.memoize(policy="fifo")
+
+
+class TestThreadSafety:
+    @pytest.mark.parametrize("policy", ["lru", "lfu"])
+    def test_concurrent_get_put(self, policy):
+        cache = memo._POLICIES[policy](64)
+
+        def hammer(seed):
+            for i in range(5000):
+                key = (seed * 7 + i) % 200
+                if cache.get(key, memo._MISSING) is memo._MISSING:
+                    cache.put(key, key)
+
+        threads = [threading.Thread(target=hammer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.info()
+        assert info.hits + info.misses == 8 * 5000
+        assert info.currsize == len(cache) <= 64
+        assert all(cache.get(key, key) == key for key in range(200))
+
+
+class TestSharedAcrossCalls:
+    def test_recursion_reuses_cache(self):
+        recursion.fibonacci_memo.cache_clear()
+        recursion.fibonacci_memo(30)
+        misses = recursion.fibonacci_memo.cache_info().misses
+        assert recursion.fibonacci_memo(30) == 832_040
+        assert recursion.fibonacci_memo.cache_info().misses == misses
+
+    def test_cache_stats_registry(self):
+        stats = memo.cache_stats()
+        assert any(name.endswith("fibonacci_memo") for name in stats)
+
+    def test_deep_inputs_do_not_hit_recursion_limit(self):
+        for func in (
+            recursion.fibonacci_memo,
+            recursion.factorial_memo,
+            dp.fibonacci,
+            dp.climbing_stairs,
+        ):
+            func.cache_clear()
+        assert recursion.fibonacci_memo(5000) == dp.fibonacci(5000)
+        assert dp.climbing_stairs(5000) == dp.fibonacci(5001)
+        assert recursion.factorial_memo(900) == recursion.factorial(900)
+        assert recursion.fibonacci_memo(100_000) == dp.fibonacci(100_000)
+        assert recursion.factorial_memo(100_000) == recursion.factorial(100_000)
+
+    def test_chain_fill_counts_each_argument_once(self):
+        calls = []
+
+        @memo.memoize(maxsize=None, chain=True)
+        def triangle(n):
+            calls.append(n)
+            return n + triangle(n - 1) if n else 0
+
+        assert triangle(10 * memo.CHAIN_STRIDE + 5) == sum(
+            range(10 * memo.CHAIN_STRIDE + 6)
+        )
+        assert sorted(calls) == list(range(10 * memo.CHAIN_STRIDE + 6))
+        assert triangle.cache_info().misses == len(calls)
+
+    def test_registry_keeps_same_named_closures(self):
+        def make(offset):
+            @memo.memoize()
+            def shifted(x):
+                return x + offset
+
+            return shifted
+
+        first, second = make(1), make(2)
+        first(0)
+        second(0)
+        second(1)
+        stats = memo.cache_stats()
+        name = f"{__name__}.{make.__qualname__}.<locals>.shifted"
+        assert {stats[name].misses, stats[name + "#2"].misses} == {1, 2}
+        del first, second
+        gc.collect()
+        assert not any(".<locals>.shifted" in key for key in memo.cache_stats())
+
+    def test_cache_base_is_abstract(self):
+        with pytest.raises(TypeError):
+            memo._Cache(4)
@@ -0,0 +1,48 @@
+import random
+from array import array
+
+import pytest
+
+from src.year_2026 import parallel_sort
+
+pytestmark = pytest.mark.sorting
+
+
+class TestParallelSort:
+    def test_small_input_single_process(self):
+        arr = array("q", [random.randint(-100, 100) for _ in range(50)])
+        result = parallel_sort.parallel_sort(arr, workers=4)
+        assert result.tolist() == sorted(arr)
+        assert result.typecode == "q"
+
+    def test_empty(self):
+        assert parallel_sort.parallel_sort(array("i")).tolist() == []
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("workers", [2, 3, 4])
+    def test_multiple_workers(self, workers):
+        arr = array("q", [random.randint(-(10**9), 10**9) for _ in range(10_000)])
+        result = parallel_sort.parallel_sort(arr, workers=workers, min_parallel=0)
+        assert result.tolist() == sorted(arr)
+
+    @pytest.mark.slow
+    def test_floats(self):
+        arr = array("d", [random.uniform(-1, 1) for _ in range(5_000)])
+        result = parallel_sort.parallel_sort(arr, workers=3, min_parallel=0)
+        assert result.tolist() == sorted(arr)
+
+    @pytest.mark.slow
+    def test_duplicate_heavy(self):
+        for values in ([7] * 3_001, [random.randint(0, 2) for _ in range(4_999)]):
+            arr = array("i", values)
+            result = parallel_sort.parallel_sort(arr, workers=4, min_parallel=0)
+            assert result.tolist() == sorted(values)
+
+    def test_does_not_modify_input(self):
+        arr = array("i", [3, 1, 2])
+        parallel_sort.parallel_sort(arr, workers=2, min_parallel=0)
+        assert arr.tolist() == [3, 1, 2]
+
+    def test_unsupported_typecode(self):
+        with pytest.raises(TypeError):
+            parallel_sort.parallel_sort(array("u", "abc"))
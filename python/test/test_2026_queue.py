@@ -1,3 +1,8 @@
+import asyncio
+import multiprocessing
+import random
+import threading
+
 import pytest
 
 from src.year_2026 import queue_ds
@@ -52,3 +57,270 @@ class TestQueueUsingStacks:
     def test_empty(self):
         q = queue_ds.QueueUsingStacks()
         assert q.dequeue() is None
+
+
+class TestRingBufferQueue:
+    def test_wraps_and_grows(self):
+        q = queue_ds.Queue()
+        reference = []
+        for i in range(1000):
+            if reference and random.random() < 0.4:
+                assert q.dequeue() == reference.pop(0)
+            else:
+                q.enqueue(i)
+                reference.append(i)
+            assert len(q) == len(reference)
+        assert q.dequeue_many(len(reference) + 5) == reference
+        assert q.is_empty()
+
+    def test_batch_operations(self):
+        q = queue_ds.Queue()
+        q.enqueue_many(range(5))
+        assert q.dequeue_many(2) == [0, 1]
+        q.enqueue_many(range(5, 20))
+        assert q.dequeue_many(100) == list(range(2, 20))
+        assert q.dequeue_many(3) == []
+
+    def test_dequeue_releases_references(self):
+        q = queue_ds.Queue()
+        q.enqueue(object())
+        q.dequeue()
+        assert all(slot is None for slot in q._buf)
+
+    def test_capacity_raise(self):
+        q = queue_ds.Queue(capacity=2)
+        q.enqueue(1)
+        q.enqueue(2)
+        assert q.is_full()
+        with pytest.raises(queue_ds.QueueFull):
+            q.enqueue(3)
+        with pytest.raises(queue_ds.QueueFull):
+            q.enqueue_many([3])
+        assert q.dequeue_many(2) == [1, 2]
+
+    def test_capacity_drop_oldest(self):
+        q = queue_ds.Queue(capacity=3, overflow="drop_oldest")
+        q.enqueue_many([1, 2, 3])
+        q.enqueue(4)
+        assert q.peek() == 2
+        q.enqueue_many([5, 6, 7, 8, 9])
+        assert q.dequeue_many(3) == [7, 8, 9]
+        assert q.dropped == 6
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            queue_ds.Queue(capacity=0)
+        with pytest.raises(ValueError):
+            queue_ds.Queue(overflow="spill")
+        with pytest.raises(ValueError):
+            queue_ds.Queue(capacity=4, overflow="block")
+
+
+class TestThreadSafeQueue:
+    def test_producer_consumer_preserves_order(self):
+        q = queue_ds.ThreadSafeQueue(capacity=8)
+        received = []
+
+        def consume():
+            while len(received) < 1000:
+                received.extend(q.get_many(16, timeout=5))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(1000):
+            q.put(i, timeout=5)
+        consumer.join(timeout=10)
+        assert received == list(range(1000))
+        stats = q.stats()
+        assert stats.enqueued == stats.dequeued == 1000
+        assert stats.max_depth <= 8
+
+    def test_timeouts(self):
+        q = queue_ds.ThreadSafeQueue(capacity=1)
+        with pytest.raises(queue_ds.QueueEmpty):
+            q.get(timeout=0.01)
+        assert q.get_many(4, timeout=0.01) == []
+        q.put(1)
+        with pytest.raises(queue_ds.QueueFull):
+            q.put(2, timeout=0.01)
+        assert q.get() == 1
+
+    def test_queue_api_is_non_blocking(self):
+        q = queue_ds.ThreadSafeQueue(capacity=2, overflow="drop_oldest")
+        q.enqueue_many([1, 2, 3])
+        assert q.peek() == 2
+        assert q.dequeue_many(5) == [2, 3]
+        assert q.dequeue() is None
+
+    def test_put_many_waits_for_room(self):
+        q = queue_ds.ThreadSafeQueue(capacity=3)
+        producer = threading.Thread(target=q.put_many, args=(range(10),))
+        producer.start()
+        received = []
+        while len(received) < 10:
+            received.extend(q.get_many(2, timeout=5))
+        producer.join(timeout=5)
+        assert received == list(range(10))
+
+
+class TestAsyncQueue:
+    def test_producer_consumer(self):
+        async def run():
+            q = queue_ds.AsyncQueue(capacity=4)
+            received = []
+
+            async def consume():
+                while len(received) < 100:
+                    received.extend(await q.get_many(8, timeout=5))
+
+            consumer = asyncio.create_task(consume())
+            await q.put_many(range(50))
+            for i in range(50, 100):
+                await q.put(i)
+            await consumer
+            return received, q.stats()
+
+        received, stats = asyncio.run(run())
+        assert received == list(range(100))
+        assert stats.dequeued == 100
+        assert stats.max_depth <= 4
+
+    def test_timeouts(self):
+        async def run():
+            q = queue_ds.AsyncQueue(capacity=1)
+            with pytest.raises(queue_ds.QueueEmpty):
+                await q.get(timeout=0.01)
+            await q.put(1)
+            with pytest.raises(queue_ds.QueueFull):
+                await q.put(2, timeout=0.01)
+            assert not q._putters
+            return await q.get()
+
+        assert asyncio.run(run()) == 1
+
+    def test_sync_enqueue_wakes_getter(self):
+        async def run():
+            q = queue_ds.AsyncQueue()
+            getter = asyncio.create_task(q.get(timeout=5))
+            await asyncio.sleep(0)
+            q.enqueue("x")
+            return await getter
+
+        assert asyncio.run(run()) == "x"
+
+    def test_cancelled_waiter_passes_wakeup_on(self):
+        async def run():
+            q = queue_ds.AsyncQueue()
+            first = asyncio.create_task(q.get())
+            second = asyncio.create_task(q.get(timeout=5))
+            await asyncio.sleep(0)
+            q.enqueue("x")  # wakes first, which is cancelled before it runs
+            first.cancel()
+            value = await second
+            assert first.cancelled()
+            return value, q._getters
+
+        value, getters = asyncio.run(run())
+        assert value == "x"
+        assert not getters
+
+    def test_cancelled_putter_passes_wakeup_on(self):
+        async def run():
+            q = queue_ds.AsyncQueue(capacity=1)
+            await q.put(0)
+            first = asyncio.create_task(q.put(1))
+            second = asyncio.create_task(q.put(2, timeout=5))
+            await asyncio.sleep(0)
+            assert await q.get() == 0  # wakes first, then it is cancelled
+            first.cancel()
+            await second
+            return await q.get(timeout=1)
+
+        assert asyncio.run(run()) == 2
+
+
+def _ring_producer(ring, count):
+    for i in range(count):
+        ring.put(i.to_bytes(4, "little") * (i % 50), timeout=10)
+    ring.close()
+
+
+class TestSharedRingBuffer:
+    def test_variable_length_wraps(self):
+        ring = queue_ds.SharedRingBuffer(64)
+        try:
+            for i in range(20):
+                message = bytes([i]) * (i % 13)
+                ring.put(message)
+                assert ring.get() == message
+            assert ring.is_empty()
+        finally:
+            ring.close()
+            ring.unlink()
+
+    def test_fixed_records_and_zero_copy_view(self):
+        ring = queue_ds.SharedRingBuffer(32, record_size=8)
+        try:
+            for i in range(4):
+                assert ring.try_put(i.to_bytes(8, "little"))
+            assert not ring.try_put(bytes(8))
+            view = ring.acquire()
+            assert int.from_bytes(view, "little") == 0
+            with pytest.raises(RuntimeError):
+                ring.try_acquire()
+            view.release()
+            ring.release()
+            assert ring.try_put(bytes(8))
+            with pytest.raises(ValueError):
+                ring.put(bytes(3))
+        finally:
+            ring.close()
+            ring.unlink()
+
+    def test_timeouts(self):
+        ring = queue_ds.SharedRingBuffer(32)
+        try:
+            with pytest.raises(queue_ds.QueueEmpty):
+                ring.get(timeout=0.01)
+            ring.put(b"12345678")
+            ring.put(b"12345678")
+            with pytest.raises(queue_ds.QueueFull):
+                ring.put(b"x", timeout=0.01)
+            with pytest.raises(ValueError):
+                ring.put(bytes(100))
+        finally:
+            ring.close()
+            ring.unlink()
+
+    def test_large_message_after_wrap(self):
+        ring = queue_ds.SharedRingBuffer(1024)
+        try:
+            ring.put(bytes(500))
+            assert ring.get() == bytes(500)
+            with pytest.raises(ValueError):
+                ring.put(bytes(600), timeout=1)
+            limit = ring.capacity // 2 - 4
+            for offset in range(0, 1024, 8):
+                # An empty ring takes the largest message from any position.
+                ring.put(bytes(offset % 200))
+                ring.get()
+                ring.put(b"x" * limit, timeout=1)
+                assert ring.get() == b"x" * limit
+                assert ring.is_empty()
+        finally:
+            ring.close()
+            ring.unlink()
+
+    def test_cross_process(self):
+        ctx = multiprocessing.get_context("spawn")
+        ring = queue_ds.SharedRingBuffer(1024)
+        try:
+            producer = ctx.Process(target=_ring_producer, args=(ring, 500))
+            producer.start()
+            for i in range(500):
+                assert ring.get(timeout=30) == i.to_bytes(4, "little") * (i % 50)
+            producer.join(timeout=30)
+            assert producer.exitcode == 0
+        finally:
+            ring.close()
+            ring.unlink()
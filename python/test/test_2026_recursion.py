@@ -1,3 +1,5 @@
+import math
+
 import pytest
 
 from src.year_2026 import recursion
@@ -117,3 +119,16 @@ class TestFibonacciMemo:
     def test_larger(self):
         # Memoized version can handle larger inputs efficiently
         assert recursion.fibonacci_memo(30) == 832_040
+
+
+class TestBigIntegers:
+    """Large inputs that would exceed the recursion limit with a linear recursion."""
+
+    def test_factorial_large(self):
+        assert recursion.factorial(5000) == math.factorial(5000)
+
+    def test_power_large_exponent(self):
+        assert recursion.power(3, 10_001) == 3**10_001
+
+    def test_power_memo_large_exponent(self):
+        assert recursion.power_memo(7, 4_097) == 7**4_097
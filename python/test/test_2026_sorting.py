@@ -1,4 +1,5 @@
 import random
+from array import array
 
 import pytest
 
@@ -116,7 +117,6 @@ class TestMergeSort:
         assert sorting.merge_sort(arr) == sorted(arr)
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestQuickSort:
     def test_simple(self):
         length = random.randint(5, 20)
@@ -137,8 +137,53 @@ class TestQuickSort:
         arr = [random.randint(-1000, 1000) for _ in range(length)]
         assert sorting.quick_sort(arr) == sorted(arr)
 
+    def test_large_with_many_duplicates(self):
+        arr = [random.randint(0, 5) for _ in range(3000)]
+        assert sorting.quick_sort(arr) == sorted(arr)
+
+    def test_sorted_and_reversed(self):
+        arr = list(range(2000))
+        assert sorting.quick_sort(arr) == arr
+        assert sorting.quick_sort(arr[::-1]) == arr
+
+    def test_heapsort_fallback(self, monkeypatch):
+        monkeypatch.setattr(sorting, "_depth_limit", lambda n: 0)
+        arr = [random.randint(-1000, 1000) for _ in range(500)]
+        assert sorting.quick_sort(arr) == sorted(arr)
+
+
+class TestSelect:
+    def test_every_rank(self):
+        arr = [random.randint(-50, 50) for _ in range(200)]
+        expected = sorted(arr)
+        for k in range(len(arr)):
+            assert sorting.select(list(arr), k) == expected[k]
+
+    def test_partitions_around_k(self):
+        arr = [random.randint(-1000, 1000) for _ in range(1000)]
+        k = random.randint(0, 999)
+        value = sorting.select(arr, k)
+        assert all(x <= value for x in arr[:k])
+        assert all(x >= value for x in arr[k + 1 :])
+
+    def test_out_of_range(self):
+        with pytest.raises(IndexError):
+            sorting.select([1, 2, 3], 3)
+
+
+class TestPartialSort:
+    def test_top_k(self):
+        arr = [random.randint(-1000, 1000) for _ in range(1000)]
+        expected = sorted(arr)
+        assert sorting.partial_sort(arr, 10) == expected[:10]
+        assert arr[:10] == expected[:10]
+        assert sorted(arr) == expected
+
+    def test_k_bounds(self):
+        assert sorting.partial_sort([3, 1, 2], 0) == []
+        assert sorting.partial_sort([3, 1, 2], 5) == [1, 2, 3]
+
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestCountingSort:
     def test_simple(self):
         length = random.randint(5, 20)
@@ -157,8 +202,27 @@ class TestCountingSort:
         arr = [random.randint(0, 1000) for _ in range(length)]
         assert sorting.counting_sort(arr) == sorted(arr)
 
+    def test_negatives(self):
+        arr = [random.randint(-500, 500) for _ in range(200)]
+        assert sorting.counting_sort(arr) == sorted(arr)
+
+    def test_empty(self):
+        assert sorting.counting_sort([]) == []
+
+    def test_typed_array(self):
+        arr = array("i", [random.randint(-100, 100) for _ in range(200)])
+        result = sorting.counting_sort(arr)
+        assert isinstance(result, array)
+        assert result.typecode == "i"
+        assert result.tolist() == sorted(arr)
+
+    def test_reuses_output_buffer(self):
+        arr = array("h", [random.randint(-100, 100) for _ in range(50)])
+        out = array("h", [0] * 50)
+        assert sorting.counting_sort(arr, out=out) is out
+        assert out.tolist() == sorted(arr)
+
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestRadixSort:
     def test_simple(self):
         length = random.randint(5, 20)
@@ -174,3 +238,212 @@ class TestRadixSort:
         length = random.randint(10, 100)
         arr = [random.randint(0, 10000) for _ in range(length)]
         assert sorting.radix_sort(arr) == sorted(arr)
+
+    def test_negatives(self):
+        arr = [random.randint(-(10**6), 10**6) for _ in range(500)]
+        assert sorting.radix_sort(arr) == sorted(arr)
+
+    def test_wide_keys(self):
+        arr = [random.randint(-(2**63), 2**63 - 1) for _ in range(500)]
+        assert sorting.radix_sort(arr) == sorted(arr)
+
+    def test_empty_and_constant(self):
+        assert sorting.radix_sort([]) == []
+        assert sorting.radix_sort([7] * 10) == [7] * 10
+
+    def test_typed_array(self):
+        arr = array("q", [random.randint(-(2**40), 2**40) for _ in range(500)])
+        original = arr.tolist()
+        result = sorting.radix_sort(arr)
+        assert result.typecode == "q"
+        assert result.tolist() == sorted(original)
+        assert arr.tolist() == original
+
+    def test_reuses_output_buffer(self):
+        arr = array("l", [random.randint(-(10**9), 10**9) for _ in range(300)])
+        out = array("l", [0] * 300)
+        assert sorting.radix_sort(arr, out=out) is out
+        assert out.tolist() == sorted(arr)
+
+    def test_reuses_scratch_buffer(self):
+        scratch = array("q", [0] * 300)
+        for bits in (8, 16, 24, 40):
+            arr = array("q", [random.randrange(2**bits) for _ in range(300)])
+            result = sorting.radix_sort(arr, scratch=scratch)
+            assert result is not scratch
+            assert result.tolist() == sorted(arr)
+            out = array("q", [0] * 300)
+            assert sorting.radix_sort(arr, out=out, scratch=scratch) is out
+            assert out.tolist() == sorted(arr)
+        with pytest.raises(ValueError):
+            sorting.radix_sort(array("q", [2, 1]), scratch=scratch)
+
+    def test_rejects_floats(self):
+        with pytest.raises(TypeError):
+            sorting.radix_sort(array("d", [1.0, 0.5]))
+
+
+class TestMergeSortRuns:
+    """Bottom-up merge sort: natural runs, short-run padding and stability."""
+
+    def test_large_random(self):
+        arr = [random.randint(-1000, 1000) for _ in range(5000)]
+        assert sorting.merge_sort(arr) == sorted(arr)
+
+    def test_sorted_and_reversed(self):
+        arr = list(range(1000))
+        assert sorting.merge_sort(arr) == arr
+        assert sorting.merge_sort(arr[::-1]) == arr
+
+    def test_nearly_sorted(self):
+        arr = list(range(2000))
+        for _ in range(20):
+            i = random.randint(0, len(arr) - 2)
+            arr[i], arr[i + 1] = arr[i + 1], arr[i]
+        assert sorting.merge_sort(arr) == sorted(arr)
+
+    def test_does_not_modify_input(self):
+        arr = [3, 1, 2]
+        sorting.merge_sort(arr)
+        assert arr == [3, 1, 2]
+
+    def test_stable(self):
+        class Item:
+            def __init__(self, key, tag):
+                self.key = key
+                self.tag = tag
+
+            def __lt__(self, other):
+                return self.key < other.key
+
+        items = [Item(random.randint(0, 5), i) for i in range(500)]
+        result = sorting.merge_sort(items)
+        assert [(x.key, x.tag) for x in result] == sorted((x.key, x.tag) for x in items)
+
+
+def _run(sorter, arr, **kwargs):
+    """Call an in-place or returning sorter and give back the sorted list."""
+    result = sorter(arr, **kwargs)
+    return arr if result is None else list(result)
+
+
+COMPARISON_SORTERS = [
+    sorting.bubble_sort,
+    sorting.selection_sort,
+    sorting.insertion_sort,
+    sorting.merge_sort,
+    sorting.quick_sort,
+]
+
+
+@pytest.mark.parametrize("sorter", COMPARISON_SORTERS, ids=lambda f: f.__name__)
+class TestKeyAndReverse:
+    def test_key(self, sorter):
+        arr = [random.randint(-100, 100) for _ in range(50)]
+        assert _run(sorter, list(arr), key=abs) == sorted(arr, key=abs)
+
+    def test_reverse(self, sorter):
+        arr = [random.randint(-100, 100) for _ in range(50)]
+        assert _run(sorter, list(arr), reverse=True) == sorted(arr, reverse=True)
+
+    def test_stable_with_key_and_reverse(self, sorter):
+        records = [(random.randint(0, 3), i) for i in range(60)]
+        for reverse in (False, True):
+            expected = sorted(records, key=lambda r: r[0], reverse=reverse)
+            result = _run(sorter, list(records), key=lambda r: r[0], reverse=reverse)
+            assert result == expected
+
+    def test_key_called_once_per_element(self, sorter):
+        calls = []
+
+        def key(x):
+            calls.append(x)
+            return x
+
+        arr = [random.randint(0, 1000) for _ in range(40)]
+        _run(sorter, arr, key=key)
+        assert len(calls) == 40
+
+    def test_count_comparisons(self, sorter):
+        arr = [random.randint(0, 1000) for _ in range(40)]
+        result, comparisons = sorting.count_comparisons(sorter, arr)
+        assert result == sorted(arr)
+        assert comparisons > 0
+        keyed, _ = sorting.count_comparisons(sorter, arr, key=lambda x: -x)
+        assert keyed == sorted(arr, reverse=True)
+
+
+@pytest.mark.parametrize(
+    "sorter", [sorting.counting_sort, sorting.radix_sort], ids=lambda f: f.__name__
+)
+class TestIntegerSortKeys:
+    def test_key(self, sorter):
+        words = [("x" * random.randint(0, 9), i) for i in range(100)]
+        expected = sorted(words, key=lambda w: len(w[0]))
+        assert sorter(words, key=lambda w: len(w[0])) == expected
+
+    def test_reverse_is_stable(self, sorter):
+        records = [(random.randint(-5, 5), i) for i in range(100)]
+        expected = sorted(records, key=lambda r: r[0], reverse=True)
+        assert sorter(records, key=lambda r: r[0], reverse=True) == expected
+
+    def test_reverse_typed_array(self, sorter):
+        arr = array("i", [random.randint(-100, 100) for _ in range(100)])
+        result = sorter(arr, reverse=True)
+        assert result.tolist() == sorted(arr, reverse=True)
+
+
+class TestCountComparisons:
+    def test_insertion_sort_best_and_worst_case(self):
+        arr = list(range(200))
+        _, sorted_cost = sorting.count_comparisons(sorting.insertion_sort, arr)
+        _, reversed_cost = sorting.count_comparisons(sorting.insertion_sort, arr[::-1])
+        assert sorted_cost == 199
+        assert reversed_cost == 200 * 199 // 2
+
+    @pytest.mark.parametrize("sorter", COMPARISON_SORTERS, ids=lambda f: f.__name__)
+    def test_key_counts_match_plain(self, sorter):
+        arr = list(range(200))
+        _, plain = sorting.count_comparisons(sorter, arr)
+        _, keyed = sorting.count_comparisons(sorter, arr, key=lambda x: x)
+        assert keyed == plain
+        _, flipped = sorting.count_comparisons(sorter, arr[::-1], reverse=True)
+        assert flipped > 0
+
+    def test_input_not_modified(self):
+        arr = [3, 1, 2]
+        sorting.count_comparisons(sorting.bubble_sort, arr)
+        assert arr == [3, 1, 2]
+
+
+class _Record:
+    """Compares by key only, so equal keys with different tags are distinguishable."""
+
+    def __init__(self, key, tag):
+        self.key, self.tag = key, tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+class TestStableWithKey:
+    """selection_sort and quick_sort are stable when key or reverse is given.
+
+    Their plain paths are documented as unstable; no order of equal
+    elements is promised there, so none is asserted.
+    """
+
+    def test_selection_sort(self):
+        arr = [_Record(1, "a"), _Record(1, "b"), _Record(0, "c")]
+        sorting.selection_sort(arr, key=lambda r: r.key)
+        assert [r.tag for r in arr] == ["c", "a", "b"]
+        arr = [_Record(1, "a"), _Record(1, "b"), _Record(0, "c")]
+        sorting.selection_sort(arr)
+        assert [r.key for r in arr] == [0, 1, 1]
+
+    def test_quick_sort(self):
+        rng = random.Random(7)
+        arr = [_Record(rng.randint(0, 3), i) for i in range(200)]
+        keyed = [r.tag for r in sorting.quick_sort(arr, key=lambda r: r.key)]
+        assert keyed == [r.tag for r in sorted(arr, key=lambda r: r.key)]
+        assert [r.key for r in sorting.quick_sort(arr)] == sorted(r.key for r in arr)
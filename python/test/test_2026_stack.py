@@ -1,3 +1,6 @@
+import io
+import random
+
 import pytest
 
 from src.year_2026 import stack
@@ -45,6 +48,106 @@ class TestValidParentheses:
     def test_empty(self):
         assert stack.valid_parentheses("") is True
 
+    def test_ignores_other_characters(self):
+        assert stack.valid_parentheses('{"a": [1, (2)], "b": {}}') is True
+        assert stack.valid_parentheses("x)") is False
+
+
+class TestBracketValidator:
+    def test_state_carries_across_chunks(self):
+        v = stack.BracketValidator()
+        for chunk in ["{[", "(a)", "]", "}"]:
+            assert v.feed(chunk) is True
+        assert v.finish() is True
+        assert v.error_offset is None
+
+    def test_bytes_chunks(self):
+        v = stack.BracketValidator()
+        assert v.feed(b'{"k": [1,') is True
+        assert v.depth == 2
+        assert v.feed(b" 2]}") is True
+        assert v.finish() is True
+
+    def test_mismatch_offset_spans_chunks(self):
+        v = stack.BracketValidator()
+        v.feed("abc(")
+        assert v.feed("xx]") is False
+        assert v.error_offset == 6
+        assert v.feed("()") is False  # stays failed
+
+    def test_unmatched_closer_offset(self):
+        v = stack.BracketValidator()
+        v.feed(b"()")
+        v.feed(b"  )")
+        assert v.error_offset == 4
+
+    def test_unclosed_reported_at_end(self):
+        v = stack.BracketValidator()
+        v.feed("((x)")
+        assert v.finish() is False
+        assert v.error_offset == 4
+
+    def test_custom_pairs(self):
+        v = stack.BracketValidator("<>")
+        v.feed("<<a>(>")
+        assert v.finish() is True
+
+    def test_invalid_pairs(self):
+        with pytest.raises(ValueError):
+            stack.BracketValidator("(")
+
+    def test_deep_nesting_falls_back(self):
+        v = stack.BracketValidator()
+        v.feed("(" * 100 + "[" * 50)
+        v.feed("]" * 50 + ")" * 99 + "}")
+        assert v.error_offset == 299
+
+    def test_matches_reference_on_random_chunks(self):
+        def reference(text):
+            pairs = {")": "(", "]": "[", "}": "{"}
+            st = []
+            for i, c in enumerate(text):
+                if c in "([{":
+                    st.append(c)
+                elif c in pairs and (not st or st.pop() != pairs[c]):
+                    return i
+            return len(text) if st else None
+
+        for _ in range(200):
+            depth = random.choice([3, 30])
+            text = ""
+            open_stack = []
+            for _ in range(random.randint(0, 80)):
+                if open_stack and (len(open_stack) >= depth or random.random() < 0.5):
+                    text += {"(": ")", "[": "]", "{": "}"}[open_stack.pop()]
+                else:
+                    open_stack.append(random.choice("([{"))
+                    text += open_stack[-1]
+                if random.random() < 0.3:
+                    text += random.choice("ab ,:")
+            if random.random() < 0.5 and text:
+                i = random.randrange(len(text))
+                text = text[:i] + random.choice(")]}([{") + text[i + 1 :]
+            v = stack.BracketValidator()
+            data = text.encode()
+            pos = 0
+            while pos < len(data):
+                step = random.randint(1, 10)
+                v.feed(data[pos : pos + step])
+                pos += step
+            v.finish()
+            assert v.error_offset == reference(text), text
+
+
+class TestValidateBracketsStream:
+    def test_valid_binary_stream(self):
+        payload = b'[{"a": [1, 2, {"b": ()}]}]' * 1000
+        assert stack.validate_brackets_stream(io.BytesIO(payload), chunk_size=7) is None
+
+    def test_error_offset_in_text_stream(self):
+        payload = "[" * 10 + "}" + "]" * 10
+        assert stack.validate_brackets_stream(io.StringIO(payload), chunk_size=3) == 10
+
 
 class TestEvaluatePostfix:
     def test_simple_add(self):
@@ -83,6 +186,83 @@ class TestEvaluatePostfix:
                 stack.evaluate_postfix(sample.split())
 
 
+class TestCompiledExpression:
+    def test_postfix_with_variables(self):
+        expr = stack.compile_postfix("x y + 2 *".split())
+        assert expr.variables == ("x", "y")
+        assert expr(x=1, y=2) == 6
+        assert expr(x=0.5, y=0.5) == 2.0
+
+    def test_float_and_negative_literals(self):
+        assert stack.evaluate_postfix(["1.5", "-2", "*"]) == -3.0
+
+    def test_unbound_variable(self):
+        with pytest.raises(ValueError):
+            stack.compile_postfix(["x", "1", "+"])()
+
+    def test_invalid_tokens(self):
+        for tokens in (["1", "+"], ["1", "2"], [], ["1", "$", "+"]):
+            with pytest.raises(ValueError):
+                stack.compile_postfix(tokens)
+
+    def test_long_expressions(self):
+        chained = ["x"] + ["1", "+"] * 3000
+        assert stack.compile_postfix(chained)(x=2) == 3002
+        nested = ["1"] * 2001 + ["+"] * 2000
+        assert stack.evaluate_postfix(nested) == 2001
+        with pytest.raises(ValueError):
+            stack.evaluate_postfix(["inf", "1", "+"])
+
+    def test_variables_shadowing_registers(self):
+        expr = stack.compile_postfix("_r0 _r1 * 2 - _r2 +".split())
+        assert expr(_r0=3, _r1=4, _r2=1) == 11
+
+    def test_batch_over_plain_columns(self):
+        expr = stack.compile_postfix("price qty *".split())
+        result = expr.evaluate_batch({"price": [1.0, 2.0, 3.0], "qty": [4, 5, 6]})
+        assert result == [4.0, 10.0, 18.0]
+
+    def test_batch_uses_vectorized_call(self):
+        class Column(list):
+            """Minimal array-like: elementwise arithmetic, marked via __array_ufunc__."""
+
+            __array_ufunc__ = None
+            calls = 0
+
+            def __add__(self, other):
+                Column.calls += 1
+                return Column(a + b for a, b in zip(self, other))
+
+        expr = stack.compile_infix("a + b")
+        result = expr.evaluate_batch({"a": Column([1, 2]), "b": Column([3, 4])})
+        assert result == [4, 6]
+        assert Column.calls == 1
+
+
+class TestInfix:
+    def test_precedence_and_parentheses(self):
+        assert stack.infix_to_postfix("1 + 2 * 3") == ["1", "2", "3", "*", "+"]
+        assert stack.infix_to_postfix("(1 + 2) * 3") == ["1", "2", "+", "3", "*"]
+
+    def test_left_associative(self):
+        assert stack.compile_infix("10 - 4 - 3")() == 3
+        assert stack.compile_infix("8 / 4 / 2")() == 1
+
+    def test_unary_minus(self):
+        assert stack.compile_infix("-x * 2")(x=3) == -6
+        assert stack.compile_infix("2 * -(1 + 2)")() == -6
+
+    def test_variables_and_floats(self):
+        expr = stack.compile_infix("(price - cost) * qty / 2.5")
+        assert expr.variables == ("price", "cost", "qty")
+        assert expr(price=10, cost=5, qty=2) == 4.0
+
+    def test_invalid(self):
+        for text in ("1 +", "(1 + 2", "1 + 2)", "1 2", "* 3", "1 % 2"):
+            with pytest.raises(ValueError):
+                stack.compile_infix(text)
+
+
 class TestMinStack:
     def test_basic(self):
         s = stack.MinStack()
@@ -104,3 +284,103 @@ class TestMinStack:
         s.push(1)
         s.pop()
         assert s.get_min() == 1
+
+    def test_only_records_changes_of_minimum(self):
+        s = stack.MinStack()
+        for value in [5, 6, 7, 8, 4, 9]:
+            s.push(value)
+        assert s._min == [5, 4]
+        s.pop()
+        s.pop()
+        assert s.get_min() == 5
+
+
+class TestStackBulk:
+    def test_push_many_pop_n(self):
+        s = stack.Stack()
+        s.push_many([1, 2, 3, 4])
+        assert s.pop_n(3) == [4, 3, 2]
+        assert len(s) == 1
+        assert s.pop_n(5) == [1]
+        assert s.pop_n(1) == []
+
+
+class TestTypedStack:
+    def test_push_pop(self):
+        s = stack.TypedStack("q")
+        s.push(1)
+        s.push(2)
+        assert s.peek() == 2
+        assert s.pop() == 2
+        assert s.pop() == 1
+        assert s.pop() is None
+        assert s.is_empty()
+
+    def test_bulk(self):
+        s = stack.TypedStack("d", [0.5, 1.5])
+        s.push_many([2.5, 3.5])
+        popped = s.pop_n(3)
+        assert popped.typecode == "d"
+        assert popped.tolist() == [3.5, 2.5, 1.5]
+        assert len(s) == 1
+
+    def test_rejects_wrong_type(self):
+        with pytest.raises(TypeError):
+            stack.TypedStack("q").push("x")
+
+
+class TestTypedMinMaxStack:
+    def test_extremum_base_is_abstract(self):
+        with pytest.raises(TypeError):
+            stack._ExtremumStack("q")
+
+    def test_min_matches_reference(self):
+        s = stack.TypedMinStack("i")
+        reference = []
+        for _ in range(500):
+            if reference and random.random() < 0.4:
+                n = random.randint(1, 4)
+                assert s.pop_n(n).tolist() == reference[::-1][:n]
+                del reference[-n:]
+            elif random.random() < 0.5:
+                values = [random.randint(-50, 50) for _ in range(random.randint(0, 5))]
+                s.push_many(values)
+                reference.extend(values)
+            else:
+                value = random.randint(-50, 50)
+                s.push(value)
+                reference.append(value)
+            assert s.get_min() == (min(reference) if reference else None)
+        assert len(s._marks) <= len(s)
+
+    def test_rejected_values_leave_no_marks(self):
+        s = stack.TypedMinStack("b", [5, 3])
+        with pytest.raises(OverflowError):
+            s.push(1000)
+        with pytest.raises(TypeError):
+            s.push("x")
+        with pytest.raises(OverflowError):
+            s.push_many([1, 2, 1000])
+        assert s.get_min() == 3
+        s.push_many([4, 1])
+        assert s.get_min() == 1
+        assert s.pop_n(5).tolist() == [1, 4, 3, 5]
+        assert s.get_min() is None
+
+    def test_max(self):
+        s = stack.TypedMaxStack("q", [3, 1, 4, 1, 5])
+        assert s.get_max() == 5
+        assert s.pop() == 5
+        assert s.get_max() == 4
+        s.pop_n(3)
+        assert s.get_max() == 3
+        s.pop()
+        assert s.get_max() is None
+
+    def test_duplicates_of_minimum(self):
+        s = stack.TypedMinStack("q")
+        s.push_many([2, 1, 1])
+        s.pop()
+        assert s.get_min() == 1
+        s.pop()
+        assert s.get_min() == 2
@@ -0,0 +1,110 @@
+import random
+
+import pytest
+
+from src.year_2026 import timer_wheel
+
+pytestmark = pytest.mark.queue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTimerWheel:
+    def test_fires_at_deadline(self):
+        wheel = timer_wheel.TimerWheel()
+        wheel.schedule("a", 5)
+        wheel.schedule("b", 300)
+        wheel.schedule("c", 70_000)
+        assert wheel.advance(4) == []
+        assert wheel.advance() == ["a"]
+        assert wheel.advance_to(299) == []
+        assert wheel.advance_to(300) == ["b"]
+        assert wheel.advance_to(100_000) == ["c"]
+        assert len(wheel) == 0
+
+    def test_cancel(self):
+        wheel = timer_wheel.TimerWheel()
+        keep = wheel.schedule("keep", 1000)
+        drop = wheel.schedule("drop", 1000)
+        assert wheel.cancel(drop)
+        assert not wheel.cancel(drop)
+        assert wheel.advance(1000) == ["keep"]
+        assert not keep.active
+        assert not wheel.cancel(keep)
+
+    def test_past_deadline_fires_next_tick(self):
+        wheel = timer_wheel.TimerWheel()
+        wheel.advance(10)
+        wheel.schedule_at("late", 3)
+        assert wheel.advance() == ["late"]
+
+    def test_overflow_beyond_top_level(self):
+        wheel = timer_wheel.TimerWheel(bits=2, levels=2)
+        wheel.schedule("far", 100)
+        assert wheel.advance_to(99) == []
+        assert wheel.advance_to(100) == ["far"]
+
+    @pytest.mark.parametrize("bits,levels", [(1, 1), (2, 3), (8, 2)])
+    def test_matches_brute_force(self, bits, levels):
+        rng = random.Random(bits * 10 + levels)
+        wheel = timer_wheel.TimerWheel(bits, levels)
+        pending = {}
+        for step in range(500):
+            roll = rng.random()
+            if roll < 0.5:
+                timer = wheel.schedule(step, rng.choice([1, 2, rng.randint(1, 5000)]))
+                pending[timer] = timer.deadline
+            elif roll < 0.6 and pending:
+                timer = rng.choice(list(pending))
+                assert wheel.cancel(timer)
+                del pending[timer]
+            else:
+                target = wheel.now + rng.randint(1, 2000)
+                due = sorted((d, t.item) for t, d in pending.items() if d <= target)
+                fired = wheel.advance_to(target)
+                assert sorted(fired) == sorted(item for _, item in due)
+                pending = {t: d for t, d in pending.items() if d > target}
+        assert len(wheel) == len(pending)
+
+
+class TestDelayQueue:
+    def test_items_wait_for_their_delay(self):
+        clock = FakeClock()
+        q = timer_wheel.DelayQueue(resolution=0.01, clock=clock)
+        q.enqueue("later", delay=0.5)
+        q.enqueue("now")
+        assert q.dequeue() == "now"
+        assert q.dequeue() is None
+        assert len(q) == 1
+        clock.now = 0.49
+        assert q.peek() is None
+        clock.now = 0.5
+        assert q.peek() == "later"
+        assert q.dequeue() == "later"
+        assert q.is_empty()
+
+    def test_never_early_within_a_tick(self):
+        clock = FakeClock()
+        q = timer_wheel.DelayQueue(resolution=1.0, clock=clock)
+        clock.now = 0.9
+        q.enqueue("x", delay=0.5)
+        clock.now = 1.3
+        assert q.dequeue() is None
+        clock.now = 2.0
+        assert q.dequeue() == "x"
+
+    def test_batch_and_cancel(self):
+        clock = FakeClock()
+        q = timer_wheel.DelayQueue(clock=clock)
+        q.enqueue_many(range(5), delay=1.0)
+        timer = q.enqueue("cancelled", delay=1.0)
+        assert q.cancel(timer)
+        clock.now = 2.0
+        assert q.dequeue_many(10) == [0, 1, 2, 3, 4]
+        assert q.is_empty()
@@ -0,0 +1,113 @@
+import gc
+import io
+import random
+
+import pytest
+
+from src.year_2026 import tree_codec, trees
+
+pytestmark = pytest.mark.trees
+
+
+def _random_tree(n, seed):
+    rng = random.Random(seed)
+    root = trees.TreeNode(rng.randrange(-1000, 1000))
+    nodes = [root]
+    while len(nodes) < n:
+        parent = rng.choice(nodes)
+        side = rng.choice(("left", "right"))
+        if getattr(parent, side) is None:
+            child = trees.TreeNode(rng.randrange(-1000, 1000))
+            setattr(parent, side, child)
+            nodes.append(child)
+    return root
+
+
+def _shape(root):
+    return trees.serialize_tree(root)
+
+
+class TestEncodeDecode:
+    @pytest.mark.parametrize("n", [1, 2, 31, 32, 33, 500])
+    def test_round_trip(self, n):
+        root = _random_tree(n, n)
+        data = tree_codec.encode_tree(root)
+        assert len(data) % 8 == 0
+        assert _shape(tree_codec.decode_tree(data)) == _shape(root)
+
+    def test_empty_tree(self):
+        assert tree_codec.decode_tree(tree_codec.encode_tree(None)) is None
+
+    def test_streaming_in_small_chunks(self):
+        root = _random_tree(300, 1)
+        pieces = list(tree_codec.iter_encode_tree(root, "i", chunk_nodes=7))
+        assert len(pieces) > 10
+        restored = tree_codec.read_tree(
+            io.BytesIO(b"".join(pieces)), trees.SlotTreeNode, chunk_nodes=5
+        )
+        assert isinstance(restored, trees.SlotTreeNode)
+        assert _shape(restored) == _shape(root)
+
+    def test_deep_tree_does_not_recurse(self):
+        root = None
+        for value in range(50_000):
+            root = trees.TreeNode(value, right=root)
+        restored = tree_codec.decode_tree(tree_codec.encode_tree(root))
+        assert trees.tree_height(restored) == 50_000
+
+    def test_smaller_than_text(self):
+        root = _random_tree(1000, 2)
+        binary = tree_codec.encode_tree(root, "h")
+        assert len(binary) < len(trees.serialize_tree(root)) / 2
+
+    def test_rejects_bad_data(self):
+        data = tree_codec.encode_tree(_random_tree(10, 3))
+        with pytest.raises(ValueError):
+            tree_codec.decode_tree(data[:-16])
+        with pytest.raises(ValueError):
+            tree_codec.decode_tree(b"X" + data[1:])
+
+
+class TestMappedTree:
+    def test_lazy_traversal_and_search(self, tmp_path):
+        root = trees.bst_insert_many(None, random.Random(4).sample(range(10_000), 2000))
+        path = tmp_path / "tree.bin"
+        with open(path, "wb") as f:
+            tree_codec.write_tree(root, f)
+        with tree_codec.MappedTree(str(path)) as mapped:
+            assert len(mapped) == 2000
+            assert trees.inorder_traversal(mapped.root) == trees.inorder_traversal(root)
+            assert trees.postorder_traversal(mapped.root) == trees.postorder_traversal(
+                root
+            )
+            assert trees.tree_height(mapped.root) == trees.tree_height(root)
+            for value in (root.value, root.left.value, -1):
+                found = trees.bst_search(mapped.root, value)
+                assert (found is None) == (value == -1)
+
+    def test_opening_touches_no_nodes(self, tmp_path):
+        path = tmp_path / "tree.bin"
+        path.write_bytes(tree_codec.encode_tree(_random_tree(100, 5)))
+        with tree_codec.MappedTree(str(path)) as mapped:
+            assert not mapped._nodes
+            assert mapped.root.left is mapped.root.left
+
+    def test_unreferenced_nodes_are_dropped(self, tmp_path):
+        root = trees.bst_insert_many(None, range(3000))
+        path = tmp_path / "tree.bin"
+        path.write_bytes(tree_codec.encode_tree(root))
+        with tree_codec.MappedTree(str(path)) as mapped:
+            assert trees.postorder_traversal(mapped.root) == list(
+                trees.iter_postorder(root)
+            )
+            assert trees.tree_size(mapped.root) == 3000
+            gc.collect()
+            assert len(mapped._nodes) < 100
+
+    def test_little_endian_on_disk(self):
+        root = trees.TreeNode(1, trees.TreeNode(2), trees.TreeNode(258))
+        data = tree_codec.encode_tree(root, "i")
+        values = data[-16:-4]  # three i values, then 4 bytes of padding
+        assert values == b"".join(v.to_bytes(4, "little") for v in (1, 2, 258))
+        words = data[tree_codec._HEADER.size : tree_codec._HEADER.size + 8]
+        assert int.from_bytes(words, "little") == 0b11
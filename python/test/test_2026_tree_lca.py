@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from src.year_2026 import tree_lca, trees
+
+pytestmark = pytest.mark.trees
+
+
+def _random_tree(n, seed):
+    rng = random.Random(seed)
+    root = trees.TreeNode(0)
+    nodes, parents = [root], {root: None}
+    while len(nodes) < n:
+        parent = rng.choice(nodes)
+        side = rng.choice(("left", "right"))
+        if getattr(parent, side) is None:
+            child = trees.TreeNode(len(nodes))
+            setattr(parent, side, child)
+            nodes.append(child)
+            parents[child] = parent
+    return root, nodes, parents
+
+
+def _naive_lca(parents, p, q):
+    seen = set()
+    while p is not None:
+        seen.add(p)
+        p = parents[p]
+    while q not in seen:
+        q = parents[q]
+    return q
+
+
+class TestLCAIndex:
+    @pytest.mark.parametrize("n", [1, 2, 3, 100, 1000])
+    def test_matches_naive(self, n):
+        root, nodes, parents = _random_tree(n, n)
+        index = tree_lca.LCAIndex(root)
+        rng = random.Random(0)
+        pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(500)]
+        expected = [_naive_lca(parents, p, q) for p, q in pairs]
+        assert index.lca_many(pairs) == expected
+        assert [index.lca(p, q) for p, q in pairs] == expected
+
+    def test_bst_agrees_with_walk(self):
+        root = trees.bst_insert_many(None, random.Random(2).sample(range(1000), 300))
+        index = tree_lca.LCAIndex(root)
+        values = trees.inorder_traversal(root)
+        for a, b in zip(values, reversed(values)):
+            p, q = trees.bst_search(root, a), trees.bst_search(root, b)
+            assert index.lca(p, q) is trees.bst_lowest_common_ancestor(root, p, q)
+
+    def test_unknown_node(self):
+        index = tree_lca.LCAIndex(trees.TreeNode(1))
+        assert len(index) == 1
+        with pytest.raises(KeyError):
+            index.lca(trees.TreeNode(1), trees.TreeNode(2))
+        assert len(tree_lca.LCAIndex(None)) == 0
+
+    def test_degenerate_tree(self):
+        root = None
+        for value in range(5000):
+            root = trees.TreeNode(value, left=root)
+        index = tree_lca.LCAIndex(root)
+        deepest = root
+        while deepest.left is not None:
+            deepest = deepest.left
+        assert index.lca(deepest, root.left.left) is root.left.left
+        assert index.position(root) == 0
@@ -1,3 +1,6 @@
+import math
+import random
+
 import pytest
 
 from src.year_2026 import trees
@@ -94,7 +97,6 @@ class TestPostorderTraversal:
         assert trees.postorder_traversal(None) == []
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestLevelOrderTraversal:
     def test_simple_tree(self):
         root = trees.TreeNode(1)
@@ -112,7 +114,67 @@ class TestLevelOrderTraversal:
         assert trees.level_order_traversal(None) == []
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
+def _full_tree(lo, hi):
+    if lo > hi:
+        return None
+    mid = (lo + hi) // 2
+    return trees.TreeNode(mid, _full_tree(lo, mid - 1), _full_tree(mid + 1, hi))
+
+
+def _right_spine(n):
+    root = None
+    for value in range(n, 0, -1):
+        root = trees.TreeNode(value, right=root)
+    return root
+
+
+def _left_spine(n):
+    root = None
+    for value in range(1, n + 1):
+        root = trees.TreeNode(value, left=root)
+    return root
+
+
+class TestTraversalGenerators:
+    def test_orders_match_recursive_definition(self):
+        root = _full_tree(1, 20)
+
+        def pre(node):
+            return [node.value] + pre(node.left) + pre(node.right) if node else []
+
+        def post(node):
+            return post(node.left) + post(node.right) + [node.value] if node else []
+
+        assert list(trees.iter_preorder(root)) == pre(root)
+        assert list(trees.iter_postorder(root)) == post(root)
+        assert list(trees.iter_inorder(root)) == list(range(1, 21))
+        assert list(trees.morris_inorder(root)) == list(range(1, 21))
+
+    def test_deep_trees_do_not_recurse(self):
+        left, right = _left_spine(100_000), _right_spine(100_000)
+        expected = list(range(1, 100_001))
+        assert trees.inorder_traversal(left) == expected
+        assert trees.inorder_traversal(right) == expected
+        assert trees.preorder_traversal(right) == expected
+        assert trees.postorder_traversal(left) == expected
+        assert trees.level_order_traversal(left) == expected[::-1]
+        assert list(trees.morris_inorder(left)) == expected
+
+    def test_generators_are_lazy(self):
+        it = trees.iter_level_order(_full_tree(1, 7))
+        assert next(it) == 4
+        assert next(it) == 2
+
+    def test_morris_restores_tree_when_closed_early(self):
+        root = _full_tree(1, 31)
+        before = trees.preorder_traversal(root)
+        walk = trees.morris_inorder(root)
+        assert [next(walk) for _ in range(5)] == [1, 2, 3, 4, 5]
+        walk.close()
+        assert trees.preorder_traversal(root) == before
+        assert trees.inorder_traversal(root) == list(range(1, 32))
+
+
 class TestTreeSize:
     def test_simple_tree(self):
         root = trees.TreeNode(1)
@@ -136,7 +198,6 @@ class TestTreeSize:
         assert trees.tree_size(root) == 5
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestTreeHeight:
     def test_single_node(self):
         root = trees.TreeNode(42)
@@ -158,6 +219,76 @@ class TestTreeHeight:
         assert trees.tree_height(root) == 3
 
 
+class TestSlotTreeNode:
+    def test_works_with_traversals(self):
+        root = trees.SlotTreeNode(2, trees.SlotTreeNode(1), trees.SlotTreeNode(3))
+        assert trees.inorder_traversal(root) == [1, 2, 3]
+        assert trees.tree_height(root) == 2
+        assert not hasattr(root, "__dict__")
+
+
+class TestArrayTree:
+    def test_round_trip_and_traversals(self):
+        root = _full_tree(1, 15)
+        root.left.left.left.left = trees.TreeNode(0)
+        tree = trees.ArrayTree.from_nodes(root, "q")
+        assert len(tree) == trees.tree_size(tree) == 16
+        assert trees.tree_height(tree) == trees.tree_height(root) == 5
+        for order in ("preorder", "inorder", "postorder", "level_order"):
+            wrapper = getattr(trees, f"{order}_traversal")
+            assert wrapper(tree) == wrapper(root)
+        assert trees.preorder_traversal(tree.to_nodes()) == trees.preorder_traversal(
+            root
+        )
+
+    def test_bst_insert_and_search(self):
+        tree = trees.ArrayTree()
+        for value in [5, 3, 8, 1, 4, 9, 3]:
+            tree.insert(value)
+        assert len(tree) == 6
+        assert trees.inorder_traversal(tree) == [1, 3, 4, 5, 8, 9]
+        assert tree.values[tree.search(4)] == 4
+        assert tree.search(7) == trees.NIL
+
+    def test_delete(self):
+        values = random.Random(5).sample(range(200), 100)
+        tree = trees.ArrayTree("q")
+        for value in values:
+            trees.bst_insert(tree, value)
+        expected = sorted(values)
+        for value in values[::3] + [1000]:
+            assert trees.bst_delete(tree, value) is tree
+            if value in expected:
+                expected.remove(value)
+            assert trees.inorder_traversal(tree) == expected
+            assert len(tree) == len(expected)
+        for value in expected:
+            assert tree.values[trees.bst_search(tree, value)] == value
+        assert trees.bst_search(tree, 1000) == trees.NIL
+        for value in expected:
+            assert tree.delete(value)
+        assert tree.root == trees.NIL and len(tree) == 0
+        assert not tree.delete(1)
+
+    def test_empty(self):
+        tree = trees.ArrayTree.from_nodes(None)
+        assert trees.inorder_traversal(tree) == []
+        assert trees.tree_height(tree) == 0
+        assert tree.to_nodes() is None
+
+
+class TestEytzingerTree:
+    @pytest.mark.parametrize("n", [0, 1, 2, 7, 8, 100])
+    def test_matches_bisect(self, n):
+        values = list(range(0, 2 * n, 2))
+        tree = trees.EytzingerTree(values, "q")
+        assert len(tree) == n
+        for probe in range(-1, 2 * n + 2):
+            assert (probe in tree) == (probe in values)
+            expected = next((v for v in values if v >= probe), None)
+            assert tree.lower_bound(probe) == expected
+
+
 @pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestTreeContains:
     def test_contains_root(self):
@@ -181,7 +312,6 @@ class TestTreeContains:
         assert trees.tree_contains(None, 1) is False
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestTreeMin:
     def test_simple_tree(self):
         root = trees.TreeNode(5)
@@ -203,7 +333,6 @@ class TestTreeMin:
         assert trees.tree_min(root) == -5
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestTreeMax:
     def test_simple_tree(self):
         root = trees.TreeNode(5)
@@ -219,7 +348,6 @@ class TestTreeMax:
         assert trees.tree_max(None) is None
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestTreeSum:
     def test_simple_tree(self):
         root = trees.TreeNode(1)
@@ -241,7 +369,6 @@ class TestTreeSum:
         assert trees.tree_sum(root) == 10
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestTreeAverage:
     def test_simple_tree(self):
         root = trees.TreeNode(1)
@@ -257,7 +384,6 @@ class TestTreeAverage:
         assert trees.tree_average(None) is None
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestTreeCountOf:
     def test_count_existing(self):
         root = trees.TreeNode(1)
@@ -279,7 +405,6 @@ class TestTreeCountOf:
         assert trees.tree_count_of(None, 1) == 0
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestTreeIsBalanced:
     def test_balanced(self):
         root = trees.TreeNode(1)
@@ -297,7 +422,81 @@ class TestTreeIsBalanced:
         assert trees.tree_is_balanced(None) is True
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
+class TestTreeAggregates:
+    def test_single_pass_matches_individual_functions(self):
+        root = _full_tree(1, 20)
+        root.left.left.left.left = trees.TreeNode(1)
+        result = trees.tree_aggregates(root, *trees.AGGREGATES, value=1)
+        assert result == {
+            "size": 21,
+            "height": 5,
+            "sum": 211,
+            "min": 1,
+            "max": 20,
+            "average": 211 / 21,
+            "balanced": trees.tree_is_balanced(root),
+            "count_of": 2,
+        }
+        assert trees.tree_aggregates(None) == {
+            "size": 0,
+            "height": 0,
+            "sum": 0,
+            "min": None,
+            "max": None,
+            "average": None,
+            "balanced": True,
+        }
+
+    def test_array_tree(self):
+        root = _full_tree(1, 20)
+        root.left.left.left.left = trees.TreeNode(1)
+        tree = trees.ArrayTree.from_nodes(root, "q")
+        assert trees.tree_aggregates(
+            tree, *trees.AGGREGATES, value=1, cache=True
+        ) == trees.tree_aggregates(root, *trees.AGGREGATES, value=1)
+        assert trees.tree_min(tree) == 1 and trees.tree_max(tree) == 20
+        assert trees.tree_sum(tree) == 211 and trees.tree_count_of(tree, 1) == 2
+        trees.clear_tree_cache(tree)
+        assert trees.tree_aggregates(trees.ArrayTree()) == trees.tree_aggregates(None)
+
+    def test_only_requested_fields_are_computed(self):
+        root = trees.TreeNode("b", trees.TreeNode("a"))
+        assert trees.tree_aggregates(root, "min", "max", "size") == {
+            "min": "a",
+            "max": "b",
+            "size": 2,
+        }
+        with pytest.raises(ValueError):
+            trees.tree_aggregates(root, "median")
+        with pytest.raises(ValueError):
+            trees.tree_aggregates(root, "count_of")
+
+    def test_cache_is_invalidated_by_mutations(self):
+        rng = random.Random(3)
+        root, present = None, set()
+        for step in range(600):
+            value = rng.randrange(200)
+            if rng.random() < 0.6:
+                root = trees.bst_insert(root, value)
+                present.add(value)
+            else:
+                root = trees.bst_delete(root, value)
+                present.discard(value)
+            if step % 25 == 0 and present:
+                cached = trees.tree_aggregates(root, cache=True)
+                assert cached == trees.tree_aggregates(root)
+                assert cached["sum"] == sum(present)
+                assert cached["min"] == min(present)
+
+    def test_cached_query_does_not_walk(self):
+        root = trees.bst_insert_many(None, range(100))
+        trees.tree_aggregates(root, cache=True)
+        root.left.left.value = -1000  # a hand edit the cache cannot see
+        assert trees.tree_aggregates(root, "min", cache=True)["min"] == 0
+        trees.clear_tree_cache(root)
+        assert trees.tree_aggregates(root, "min", cache=True)["min"] == -1000
+
+
 class TestTreeIsSymmetric:
     def test_symmetric(self):
         root = trees.TreeNode(1)
@@ -311,6 +510,129 @@ class TestTreeIsSymmetric:
         root.right = trees.TreeNode(3)
         assert trees.tree_is_symmetric(root) is False
 
+    def test_deep_mirror(self):
+        left = trees.bst_insert_many(None, range(50))
+        right = trees.bst_insert_many(None, range(50))
+        stack = [right]
+        while stack:
+            node = stack.pop()
+            node.left, node.right = node.right, node.left
+            stack.extend(child for child in (node.left, node.right) if child)
+        assert trees.tree_is_symmetric(trees.TreeNode(0, left, right)) is True
+        right.value = -1
+        trees.clear_tree_cache(right)
+        assert trees.tree_is_symmetric(trees.TreeNode(0, left, right)) is False
+
+    def test_empty_and_shared_child(self):
+        assert trees.tree_is_symmetric(None) is True
+        child = trees.TreeNode(2, trees.TreeNode(3))
+        assert trees.tree_is_symmetric(trees.TreeNode(1, child, child)) is False
+        child = trees.TreeNode(2, trees.TreeNode(3), trees.TreeNode(3))
+        assert trees.tree_is_symmetric(trees.TreeNode(1, child, child)) is True
+
+
+class TestStructuralHashing:
+    def test_equal_trees(self):
+        a = trees.bst_insert_many(None, range(100))
+        b = trees.bst_from_sorted(range(100))
+        c = trees.bst_insert_many(None, range(100))
+        assert trees.trees_equal(a, c)
+        assert trees.tree_hash(a) == trees.tree_hash(c)
+        assert trees.trees_equal(a, b) == (
+            trees.serialize_tree(a) == trees.serialize_tree(b)
+        )
+        assert trees.trees_equal(None, None)
+        assert not trees.trees_equal(a, None)
+
+    def test_shape_matters(self):
+        a = trees.TreeNode(1, trees.TreeNode(2))
+        b = trees.TreeNode(1, None, trees.TreeNode(2))
+        assert not trees.trees_equal(a, b)
+
+    def test_mutation_invalidates_hashes(self):
+        a = trees.bst_insert_many(None, range(64))
+        b = trees.bst_insert_many(None, range(64))
+        trees.tree_hash(a)
+        trees.tree_hash(b)
+        assert trees.trees_equal(a, b)
+        a = trees.bst_insert(a, 100)
+        assert not trees.trees_equal(a, b)
+        b = trees.bst_insert(b, 100)
+        assert trees.trees_equal(a, b)
+        a = trees.bst_delete(a, 10)
+        b = trees.bst_delete(b, 11)
+        assert not trees.trees_equal(a, b)
+        assert trees.tree_hash(a) == trees.tree_hash(
+            trees.deserialize_tree(trees.serialize_tree(a))
+        )
+
+    def test_collision_is_verified(self):
+        a = trees.TreeNode(1, trees.TreeNode(2))
+        b = trees.TreeNode(1, trees.TreeNode(3))
+        a._hash = b._hash = (0, 0)  # a forged collision
+        assert not trees.trees_equal(a, b)
+        assert trees.trees_equal(a, b, verify=False)
+
+    def test_cold_trees_are_walked(self):
+        a = trees.bst_insert_many(None, range(50))
+        b = trees.bst_insert_many(None, range(50))
+        assert trees.trees_equal(a, b)
+        assert a._hash is None and b._hash is None
+        trees.tree_hash(a)
+        assert trees.trees_equal(a, b, verify=False)
+        assert b._hash is not None
+
+    def test_unhashable_values(self):
+        a = trees.TreeNode([1], trees.TreeNode([2]))
+        b = trees.TreeNode([1], trees.TreeNode([2]))
+        c = trees.TreeNode([1], None, trees.TreeNode([2]))
+        assert trees.trees_equal(a, b)
+        assert not trees.trees_equal(a, c)
+        b._hash = (0, 0)
+        assert trees.trees_equal(a, b)
+        assert trees.tree_is_symmetric(trees.TreeNode([0], a, c)) is True
+        assert trees.tree_is_symmetric(trees.TreeNode([0], a, b)) is False
+
+    def test_duplicate_subtrees(self):
+        root = trees.TreeNode(
+            1,
+            trees.TreeNode(2, trees.TreeNode(4)),
+            trees.TreeNode(3, trees.TreeNode(2, trees.TreeNode(4)), trees.TreeNode(4)),
+        )
+        found = sorted(
+            trees.serialize_tree(node) for node in trees.duplicate_subtrees(root)
+        )
+        expected = sorted(
+            trees.serialize_tree(node)
+            for node in (trees.TreeNode(4), trees.TreeNode(2, trees.TreeNode(4)))
+        )
+        assert found == expected
+        assert trees.duplicate_subtrees(None) == []
+
+    def test_hash_cons_shares_subtrees(self):
+        root = trees.TreeNode(
+            1,
+            trees.TreeNode(2, trees.TreeNode(4), trees.TreeNode(4)),
+            trees.TreeNode(2, trees.TreeNode(4), trees.TreeNode(4)),
+        )
+        before = trees.serialize_tree(root)
+        root = trees.hash_cons(root)
+        assert trees.serialize_tree(root) == before
+        assert root.left is root.right
+        assert root.left.left is root.left.right
+        assert trees.hash_cons(None) is None
+
+    def test_hash_cons_shared_table(self):
+        table = {}
+        a = trees.hash_cons(
+            trees.bst_from_sorted(range(31), node_type=trees.TreeNode), table
+        )
+        b = trees.hash_cons(
+            trees.bst_from_sorted(range(31), node_type=trees.TreeNode), table
+        )
+        assert a is b
+        assert trees.trees_equal(a, b)
+
 
 @pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestTreeDiameter:
@@ -323,7 +645,6 @@ class TestTreeDiameter:
         assert trees.tree_diameter(root) == 3
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestSerializeDeserialize:
     def test_round_trip(self):
         root = trees.TreeNode(1)
@@ -335,16 +656,32 @@ class TestSerializeDeserialize:
         assert restored.left.value == 2
         assert restored.right.value == 3
 
+    def test_sparse_and_empty(self):
+        root = trees.TreeNode("a", right=trees.TreeNode("b", left=trees.TreeNode("c")))
+        data = trees.serialize_tree(root)
+        assert data == '["a", null, "b", "c"]'
+        restored = trees.deserialize_tree(data)
+        assert trees.preorder_traversal(restored) == ["a", "b", "c"]
+        assert restored.left is None and restored.right.right is None
+        assert trees.deserialize_tree(trees.serialize_tree(None)) is None
+
 
 # === BST Tests ===
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestBstInsert:
     def test_insert_to_empty(self):
         root = trees.bst_insert(None, 5)
         assert root.value == 5
 
+    def test_keeps_node_class(self):
+        root = trees.SlotTreeNode(5)
+        for value in [3, 8, 4, 9]:
+            root = trees.bst_insert(root, value)
+        assert trees.inorder_traversal(root) == [3, 4, 5, 8, 9]
+        for node in (root.left, root.left.right, root.right, root.right.right):
+            assert type(node) is trees.SlotTreeNode
+
     def test_insert_smaller(self):
         root = trees.TreeNode(5)
         root = trees.bst_insert(root, 3)
@@ -356,7 +693,6 @@ class TestBstInsert:
         assert root.right.value == 7
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestBstSearch:
     def test_found(self):
         root = trees.TreeNode(5)
@@ -369,7 +705,6 @@ class TestBstSearch:
         assert trees.bst_search(root, 10) is None
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestBstDelete:
     def test_delete_leaf(self):
         root = trees.TreeNode(5)
@@ -385,6 +720,102 @@ class TestBstDelete:
         assert root.value in [3, 7]
 
 
+def _check_avl(node):
+    """Return the height of node's subtree, asserting AVL balance and stored fields."""
+    if node is None:
+        return 0
+    left, right = _check_avl(node.left), _check_avl(node.right)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    assert node.size == trees.tree_size(node)
+    return node.height
+
+
+class TestAVL:
+    def test_sorted_inserts_stay_balanced(self):
+        root = trees.bst_insert_many(None, range(100_000))
+        assert isinstance(root, trees.AVLNode)
+        assert root.height <= 1.45 * math.log2(100_000)
+        assert trees.inorder_traversal(root) == list(range(100_000))
+
+    def test_random_inserts_and_deletes(self):
+        rng = random.Random(7)
+        root, present = None, set()
+        for _ in range(3000):
+            value = rng.randrange(500)
+            if rng.random() < 0.6:
+                root = trees.bst_insert(root, value)
+                present.add(value)
+            else:
+                root = trees.bst_delete(root, value)
+                present.discard(value)
+        _check_avl(root)
+        assert trees.inorder_traversal(root) == sorted(present)
+        for value in range(500):
+            found = trees.bst_search(root, value)
+            assert (found is not None) == (value in present)
+
+    def test_delete_everything(self):
+        root = trees.bst_insert_many(None, range(64))
+        for value in range(0, 64, 2):
+            root = trees.bst_delete(root, value)
+            _check_avl(root)
+        for value in range(1, 64, 2):
+            root = trees.bst_delete(root, value)
+        assert root is None
+
+    def test_plain_tree_stays_plain(self):
+        root = trees.TreeNode(5)
+        root = trees.bst_insert_many(root, [1, 2, 3])
+        assert type(root.left) is trees.TreeNode
+        assert trees.tree_height(root) == 4
+
+    def test_range(self):
+        root = trees.bst_insert_many(None, range(0, 100, 3))
+        assert list(trees.bst_range(root, 10, 30)) == [12, 15, 18, 21, 24, 27, 30]
+        assert list(trees.bst_range(root, 200, 300)) == []
+        assert list(trees.bst_range(None, 0, 1)) == []
+
+
+class TestBulkLoad:
+    @pytest.mark.parametrize("n", [0, 1, 2, 3, 4, 7, 8, 100, 1023])
+    def test_balanced_from_unknown_length_iterator(self, n):
+        root = trees.bst_from_sorted(iter(range(n)))
+        assert trees.inorder_traversal(root) == list(range(n))
+        if n:
+            _check_avl(root)
+            assert root.value == (n - 1) // 2
+
+    def test_result_supports_avl_operations(self):
+        root = trees.bst_from_sorted(range(0, 200, 2))
+        for value in range(1, 200, 4):
+            root = trees.bst_insert(root, value)
+        root = trees.bst_delete(root, 0)
+        _check_avl(root)
+        assert trees.bst_select(root, 0) == 1
+
+    def test_length_and_plain_nodes(self):
+        stream = iter(range(10))
+        root = trees.bst_from_sorted(stream, length=4, node_type=trees.SlotTreeNode)
+        assert trees.inorder_traversal(root) == [0, 1, 2, 3]
+        assert next(stream) == 4
+        with pytest.raises(ValueError):
+            trees.bst_from_sorted(range(3), length=5)
+
+    def test_rejects_unsorted(self):
+        with pytest.raises(ValueError):
+            trees.bst_from_sorted([1, 3, 2])
+        with pytest.raises(ValueError):
+            trees.ArrayTree.from_sorted([1, 1])
+
+    def test_array_tree(self):
+        tree = trees.ArrayTree.from_sorted(range(1000), "q")
+        assert trees.inorder_traversal(tree) == list(range(1000))
+        assert tree.height() == 10
+        assert tree.values[tree.search(777)] == 777
+        assert len(trees.ArrayTree.from_sorted([])) == 0
+
+
 @pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestBstValidate:
     def test_valid_bst(self):
@@ -399,7 +830,6 @@ class TestBstValidate:
         assert trees.bst_validate(root) is False
 
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestBstInorderSuccessor:
     def test_has_right_child(self):
         root = trees.TreeNode(5)
@@ -409,8 +839,48 @@ class TestBstInorderSuccessor:
         successor = trees.bst_inorder_successor(root, root)
         assert successor.value == 6
 
+    def test_from_leaf_and_last(self):
+        root = trees.bst_insert_many(None, range(0, 40, 2))
+        for value in range(0, 38, 2):
+            node = trees.bst_search(root, value)
+            assert trees.bst_inorder_successor(root, node).value == value + 2
+        assert trees.bst_inorder_successor(root, trees.bst_search(root, 38)) is None
+
+
+class TestOrderStatistics:
+    def test_against_sorted_list(self):
+        rng = random.Random(11)
+        root, present = None, set()
+        for _ in range(2000):
+            value = rng.randrange(300)
+            if rng.random() < 0.65:
+                root = trees.bst_insert(root, value)
+                present.add(value)
+            else:
+                root = trees.bst_delete(root, value)
+                present.discard(value)
+        ordered = sorted(present)
+        assert root.size == len(ordered)
+        for k, value in enumerate(ordered):
+            assert trees.bst_select(root, k) == value
+        for probe in range(-1, 302, 7):
+            assert trees.bst_rank(root, probe) == sum(v < probe for v in ordered)
+            hi = probe + 40
+            assert trees.bst_count_range(root, probe, hi) == sum(
+                probe <= v <= hi for v in ordered
+            )
+        with pytest.raises(IndexError):
+            trees.bst_select(root, len(ordered))
+
+    def test_plain_tree_fallback(self):
+        root = trees.TreeNode(5, trees.TreeNode(2), trees.TreeNode(9))
+        assert trees.bst_select(root, 2) == 9
+        assert trees.bst_rank(root, 9) == 2
+        assert trees.bst_count_range(root, 2, 5) == 2
+        with pytest.raises(IndexError):
+            trees.bst_select(root, 3)
+
 
-@pytest.mark.xfail(reason="Not implemented yet", raises=NotImplementedError)
 class TestBstLowestCommonAncestor:
     def test_lca(self):
         root = trees.TreeNode(6)
@@ -420,3 +890,9 @@ class TestBstLowestCommonAncestor:
         root.left.right = trees.TreeNode(4)
         lca = trees.bst_lowest_common_ancestor(root, root.left, root.right)
         assert lca.value == 6
+
+    def test_ancestor_of_itself(self):
+        root = trees.bst_insert_many(None, range(15))
+        node = trees.bst_search(root, 3)
+        child = trees.bst_search(root, 2)
+        assert trees.bst_lowest_common_ancestor(root, node, child) is node